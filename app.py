@@ -1,11 +1,12 @@
 from flask import Flask
 from database import db, init_db
 from routes.main_routes import main_bp
+from services.metrikler import metrikleri_etkinlestir
 from models import Ogrenci, ZiyaretNotu, StajDegerlendirme, NormalDonemDegerlendirme, Sinif  # Modelleri import et ki tablolar oluşturulsun
 import os
 
-def create_app():
-    """Flask uygulaması oluştur"""
+def create_app(config=None):
+    """Flask uygulaması oluştur (config: varsayılanların üzerine yazılacak ayarlar)"""
     app = Flask(__name__)
     
     # Konfigürasyon
@@ -13,6 +14,13 @@ def create_app():
     app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///staj_takip.db'
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
     app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+    # Veritabanı profili: 'gelistirme' veya 'uretim' (WAL, busy timeout, bağlantı havuzu)
+    app.config['VERITABANI_PROFILI'] = os.environ.get('VERITABANI_PROFILI', 'gelistirme')
+    # İstek süresi/SQL metrikleri ve /metrics endpoint'i (kapalıyken maliyeti yoktur)
+    app.config['METRIKLER_ACIK'] = os.environ.get('METRIKLER_ACIK') == '1'
+    
+    if config:
+        app.config.update(config)
     
     # Veritabanını başlat
     init_db(app)
@@ -20,6 +28,9 @@ def create_app():
     # Blueprint'leri kaydet
     app.register_blueprint(main_bp)
     
+    # Metrikler (METRIKLER_ACIK)
+    metrikleri_etkinlestir(app)
+    
     return app
 
 if __name__ == '__main__':
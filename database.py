@@ -1,11 +1,131 @@
+from flask import g, has_app_context, has_request_context, request
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
 from datetime import datetime
 
 db = SQLAlchemy()
 
+# Tüm profillerde çalıştırılan PRAGMA'lar: SQLite yabancı anahtarları (ve ON DELETE
+# CASCADE) bağlantı bazında açılmadıkça uygulamaz
+ORTAK_PRAGMALAR = {
+    'foreign_keys': 'ON'
+}
+
+# Veritabanı profilleri: her yeni SQLite bağlantısında çalıştırılacak PRAGMA'lar ve
+# bağlantı havuzu ayarları. Profil VERITABANI_PROFILI ayarıyla seçilir.
+VERITABANI_PROFILLERI = {
+    # Varsayılan SQLite ayarları (rollback journal)
+    'gelistirme': {
+        'pragmalar': {},
+        'engine_options': {}
+    },
+    # Eşzamanlı kullanım için: okuyucular yazıcıyı beklemez, kilitli veritabanında
+    # hemen hata vermek yerine busy_timeout kadar beklenir
+    'uretim': {
+        'pragmalar': {
+            'journal_mode': 'WAL',
+            'busy_timeout': 30000,          # ms
+            'synchronous': 'NORMAL',        # WAL ile güvenli, her commit'te fsync yapmaz
+            'cache_size': -64000,           # ~64 MB sayfa önbelleği
+            'mmap_size': 268435456,         # 256 MB bellek eşlemeli okuma
+            'temp_store': 'MEMORY'
+        },
+        'engine_options': {
+            'pool_size': 10,
+            'max_overflow': 20,
+            'pool_timeout': 30,
+            'pool_recycle': 3600,
+            'pool_pre_ping': True,
+            'connect_args': {'timeout': 30, 'check_same_thread': False}
+        }
+    }
+}
+
+def pragmalari_kaydet(engine, pragmalar):
+    """Engine'in açtığı her bağlantıda verilen PRAGMA'ları çalıştır"""
+    if not pragmalar:
+        return
+    
+    @event.listens_for(engine, 'connect')
+    def _pragmalari_uygula(dbapi_baglanti, baglanti_kaydi):
+        cursor = dbapi_baglanti.cursor()
+        for ad, deger in pragmalar.items():
+            cursor.execute(f"PRAGMA {ad} = {deger}")
+        cursor.close()
+
+# Veri değiştirmemesi gereken HTTP metotları ve yazma sayılan SQL komutları
+GUVENLI_METOTLAR = ('GET', 'HEAD', 'OPTIONS')
+YAZMA_KOMUTLARI = ('INSERT', 'UPDATE', 'DELETE', 'REPLACE', 'CREATE', 'DROP', 'ALTER')
+
+def okuma_korumasi_kaydet(engine):
+    """GET/HEAD isteklerinde veritabanına yazılmasını engelle
+    
+    Okuma istekleri SQLite yazma kilidini almamalıdır; bir okuma yolunda yanlışlıkla
+    yazma yapılırsa sorgu çalıştırılmadan hata fırlatılır.
+    """
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _yazmayi_engelle(baglanti, cursor, ifade, parametreler, context, executemany):
+        if not has_request_context() or request.method not in GUVENLI_METOTLAR:
+            return
+        komut = ifade.lstrip().split(None, 1)[0].upper() if ifade.strip() else ''
+        if komut in YAZMA_KOMUTLARI:
+            raise RuntimeError(
+                f"{request.method} {request.path} isteği veritabanına yazamaz ({komut})"
+            )
+
+def yazma_kilidi_kullan():
+    """Geçerli uygulama bağlamındaki transaction'lar da BEGIN IMMEDIATE ile başlasın
+    
+    İstek dışında yazan kodlar (ör. arka plan içe aktarma işi) için; bağlam kapanınca biter.
+    """
+    g.yazma_kilidi = True
+
+def _yazma_baglami():
+    """Yazma isteği ya da yazma kilidi istenmiş bir uygulama bağlamı içinde mi"""
+    if has_request_context():
+        return request.method not in GUVENLI_METOTLAR
+    return has_app_context() and g.get('yazma_kilidi', False)
+
+def yazma_kilidi_kaydet(engine):
+    """Yazma isteklerinin ve yazan arka plan işlerinin transaction'ını BEGIN IMMEDIATE ile başlat
+    
+    sqlite3 sürücüsü BEGIN'i ilk yazma komutuna kadar erteler; servislerin yazmadan önce
+    okuduğu önceki durum (ör. özet farkları için eski not) başka bir yazıcı tarafından
+    değiştirilebilir. Yazma kilidi transaction başında alınır, eşzamanlı yazıcılar
+    busy_timeout kadar sırayla bekler. Diğer bağlantılarda (okuma istekleri, scriptler,
+    rapor işleri) sürücünün varsayılan davranışı korunur.
+    """
+    @event.listens_for(engine, 'begin')
+    def _yazma_kilidini_al(baglanti):
+        if _yazma_baglami():
+            baglanti.exec_driver_sql('BEGIN IMMEDIATE')
+    
+    @event.listens_for(engine, 'checkin')
+    def _acik_transactioni_geri_al(dbapi_baglanti, baglanti_kaydi):
+        # COMMIT 'database is locked' ile başarısız olursa SQLite transaction'ı açık kalır,
+        # SQLAlchemy ise bitmiş sayıp havuza dönüşte geri almaz; sonraki kullanıcıya devredilmez
+        if dbapi_baglanti is not None and dbapi_baglanti.in_transaction:
+            dbapi_baglanti.rollback()
+
 def init_db(app):
     """Veritabanını başlat"""
+    from migrations import migrasyonlari_uygula
+    
+    profil_adi = app.config.get('VERITABANI_PROFILI', 'gelistirme')
+    if profil_adi not in VERITABANI_PROFILLERI:
+        raise ValueError(f"Geçersiz veritabanı profili: {profil_adi}")
+    profil = VERITABANI_PROFILLERI[profil_adi]
+    
+    # Uygulamada açıkça verilen engine ayarları profil ayarlarından önceliklidir
+    engine_options = dict(profil['engine_options'])
+    engine_options.update(app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options
+    
     db.init_app(app)
     with app.app_context():
+        pragmalari_kaydet(db.engine, {**ORTAK_PRAGMALAR, **profil['pragmalar']})
+        okuma_korumasi_kaydet(db.engine)
+        yazma_kilidi_kaydet(db.engine)
         db.create_all()
-
+        # Mevcut veritabanlarına yeni indeks/sütunları uygula
+        migrasyonlari_uygula(db.engine)
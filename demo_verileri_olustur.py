@@ -5,6 +5,7 @@ Test için örnek öğrenciler, ziyaret notları ve değerlendirmeler ekler
 from app import create_app
 from database import db
 from models import Ogrenci, ZiyaretNotu, StajDegerlendirme
+from services.staj_service import ZiyaretService, OzetService
 from datetime import datetime, timedelta
 import random
 
@@ -72,6 +73,8 @@ def demo_verileri_olustur():
                 toplam_ziyaret += 1
         
         db.session.commit()
+        # Notlar doğrudan eklendiği için arama indeksini tablodan oluştur
+        ZiyaretService.arama_indeksini_yeniden_olustur()
         print(f"✅ {toplam_ziyaret} ziyaret notu eklendi")
         
         # Örnek değerlendirmeler
@@ -93,6 +96,8 @@ def demo_verileri_olustur():
             degerlendirilen += 1
         
         db.session.commit()
+        # Kayıtlar doğrudan eklendiği için sınıf özetlerini tablolardan oluştur
+        OzetService.yeniden_olustur()
         print(f"✅ {degerlendirilen} öğrenci değerlendirildi")
         
         print("\n" + "="*50)
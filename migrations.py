@@ -0,0 +1,136 @@
+"""
+Hafif, sürümlü veritabanı migrasyonları
+db.create_all() yalnızca eksik tabloları oluşturur; mevcut bir veritabanına yeni
+indeks veya sütun eklemez. Bu modül uygulama açılışında çalışır ve veritabanının
+sürümünü (PRAGMA user_version) okuyarak henüz uygulanmamış adımları sırayla uygular.
+"""
+import re
+from functools import partial
+from sqlalchemy import text
+
+def yabanci_anahtari_cascade_yap(baglanti, tablo, ust_tablo):
+    """Tablonun ust_tablo'ya olan yabancı anahtarını ON DELETE CASCADE yap
+    
+    SQLite mevcut bir kısıtlamayı değiştiremediği için tablo aynı şemayla yeniden
+    oluşturulup veriler kopyalanır ve indeksleri yeniden eklenir. Kısıtlama zaten
+    CASCADE ise (create_all ile oluşturulan yeni veritabanları) bir şey yapılmaz.
+    """
+    # foreign_key_list sütunları: id, seq, table, from, to, on_update, on_delete, match
+    anahtarlar = baglanti.execute(text(f"PRAGMA foreign_key_list({tablo})")).all()
+    if all(anahtar[2] != ust_tablo or anahtar[6] == 'CASCADE' for anahtar in anahtarlar):
+        return
+    
+    tablo_sql = baglanti.execute(
+        text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :ad"), {'ad': tablo}
+    ).scalar()
+    indeks_sqlleri = baglanti.execute(
+        text("SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = :ad AND sql IS NOT NULL"),
+        {'ad': tablo}
+    ).scalars().all()
+    
+    yeni_sql = re.sub(rf'(REFERENCES\s+"?{ust_tablo}"?\s*\([^)]*\))', r'\1 ON DELETE CASCADE', tablo_sql)
+    yeni_sql = re.sub(rf'^CREATE TABLE\s+"?{tablo}"?', f'CREATE TABLE {tablo}_yeni', yeni_sql)
+    
+    baglanti.execute(text(yeni_sql))
+    baglanti.execute(text(f"INSERT INTO {tablo}_yeni SELECT * FROM {tablo}"))
+    baglanti.execute(text(f"DROP TABLE {tablo}"))
+    baglanti.execute(text(f"ALTER TABLE {tablo}_yeni RENAME TO {tablo}"))
+    for indeks_sql in indeks_sqlleri:
+        baglanti.execute(text(indeks_sql))
+
+# Sınıf özetlerinin tam sayımı (0 = sınıfsız); yeniden oluşturma ve tutarlılık kontrolü kullanır
+SINIF_OZET_SAYIMI = """
+    SELECT COALESCE(o.sinif_id, 0) AS sinif_id, COUNT(*) AS ogrenci_sayisi,
+           COALESCE(SUM(z.sayi), 0) AS ziyaret_sayisi,
+           SUM(CASE WHEN s.toplam > 0 THEN 1 ELSE 0 END) AS staj_degerlendirilen,
+           COALESCE(SUM(s.toplam), 0) AS staj_toplam_toplami
+    FROM ogrenciler o
+    LEFT JOIN (SELECT ogrenci_id, COUNT(*) AS sayi FROM ziyaret_notlari GROUP BY ogrenci_id) z
+        ON z.ogrenci_id = o.id
+    LEFT JOIN staj_degerlendirme s ON s.ogrenci_id = o.id
+    GROUP BY COALESCE(o.sinif_id, 0)
+"""
+SINIF_HARF_OZET_SAYIMI = """
+    SELECT COALESCE(o.sinif_id, 0) AS sinif_id, d.tur, d.harf_notu, COUNT(*) AS sayi
+    FROM (
+        SELECT ogrenci_id, 'staj' AS tur, harf_notu FROM staj_degerlendirme
+        UNION ALL
+        SELECT ogrenci_id, 'normal_donem', harf_notu FROM normal_donem_degerlendirme
+    ) d
+    JOIN ogrenciler o ON o.id = d.ogrenci_id
+    WHERE d.harf_notu IS NOT NULL
+    GROUP BY COALESCE(o.sinif_id, 0), d.tur, d.harf_notu
+"""
+
+def sinif_ozetini_yeniden_olustur(baglanti):
+    """sinif_ozet ve sinif_harf_ozet tablolarını kaynak tablolardan baştan say"""
+    baglanti.execute(text("DELETE FROM sinif_ozet"))
+    baglanti.execute(text("DELETE FROM sinif_harf_ozet"))
+    baglanti.execute(text(
+        "INSERT INTO sinif_ozet (sinif_id, ogrenci_sayisi, ziyaret_sayisi, staj_degerlendirilen, "
+        "staj_toplam_toplami) " + SINIF_OZET_SAYIMI
+    ))
+    baglanti.execute(text(
+        "INSERT INTO sinif_harf_ozet (sinif_id, tur, harf_notu, sayi) " + SINIF_HARF_OZET_SAYIMI
+    ))
+
+# (sürüm, açıklama, adımlar) - adımlar SQL metni ya da baglanti alan fonksiyonlardır.
+# Uygulanmış bir migrasyon değiştirilmez; her değişiklik yeni bir sürüm olarak eklenir.
+MIGRASYONLAR = [
+    (1, 'Öğrenci ve ziyaret notu indeksleri', [
+        "CREATE INDEX IF NOT EXISTS ix_ogrenciler_sinif_id_kayit_tarihi ON ogrenciler (sinif_id, kayit_tarihi)",
+        "CREATE INDEX IF NOT EXISTS ix_ogrenciler_kayit_tarihi ON ogrenciler (kayit_tarihi)",
+        "CREATE INDEX IF NOT EXISTS ix_ziyaret_notlari_ogrenci_id_tarih ON ziyaret_notlari (ogrenci_id, tarih)",
+    ]),
+    (2, 'Ziyaret notları için FTS5 tam metin arama indeksi', [
+        # rowid = ziyaret_notlari.id; indeks ZiyaretService tarafından güncel tutulur
+        "CREATE VIRTUAL TABLE IF NOT EXISTS ziyaret_notlari_fts USING fts5("
+        "not_metni, ogretmen_adi, tokenize='unicode61 remove_diacritics 2')",
+        "DELETE FROM ziyaret_notlari_fts",
+        "INSERT INTO ziyaret_notlari_fts (rowid, not_metni, ogretmen_adi) "
+        "SELECT id, not_metni, ogretmen_adi FROM ziyaret_notlari",
+    ]),
+    (3, 'Sınıf bazında özet tabloları', [
+        # Tablolar create_all ile oluşturulur; burada mevcut veriden doldurulur
+        sinif_ozetini_yeniden_olustur,
+    ]),
+    (4, 'Öğrenci alt kayıtları için ON DELETE CASCADE', [
+        # Yabancı anahtarlar artık uygulandığından öğrencisi silinmiş (yetim) kayıtlar kopyalanamaz
+        "DELETE FROM ziyaret_notlari_fts WHERE rowid IN ("
+        "SELECT id FROM ziyaret_notlari WHERE ogrenci_id NOT IN (SELECT id FROM ogrenciler))",
+        "DELETE FROM ziyaret_notlari WHERE ogrenci_id NOT IN (SELECT id FROM ogrenciler)",
+        "DELETE FROM staj_degerlendirme WHERE ogrenci_id NOT IN (SELECT id FROM ogrenciler)",
+        "DELETE FROM normal_donem_degerlendirme WHERE ogrenci_id NOT IN (SELECT id FROM ogrenciler)",
+        partial(yabanci_anahtari_cascade_yap, tablo='ziyaret_notlari', ust_tablo='ogrenciler'),
+        partial(yabanci_anahtari_cascade_yap, tablo='staj_degerlendirme', ust_tablo='ogrenciler'),
+        partial(yabanci_anahtari_cascade_yap, tablo='normal_donem_degerlendirme', ust_tablo='ogrenciler'),
+    ]),
+]
+
+def veritabani_surumu(baglanti):
+    """Veritabanının uygulanmış son migrasyon sürümünü getir"""
+    return baglanti.execute(text("PRAGMA user_version")).scalar()
+
+def migrasyonlari_uygula(engine):
+    """Uygulanmamış migrasyonları sırayla uygula, uygulanan sürümlerin listesini döndür"""
+    uygulananlar = []
+    
+    with engine.begin() as baglanti:
+        mevcut_surum = veritabani_surumu(baglanti)
+    
+    for surum, aciklama, adimlar in MIGRASYONLAR:
+        if surum <= mevcut_surum:
+            continue
+        
+        # Her migrasyon kendi transaction'ında uygulanır; hata olursa sürüm artmaz
+        with engine.begin() as baglanti:
+            for adim in adimlar:
+                if callable(adim):
+                    adim(baglanti)
+                else:
+                    baglanti.execute(text(adim))
+            baglanti.execute(text(f"PRAGMA user_version = {int(surum)}"))
+        
+        uygulananlar.append((surum, aciklama))
+    
+    return uygulananlar
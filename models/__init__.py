@@ -22,6 +22,12 @@ class Sinif(db.Model):
 class Ogrenci(db.Model):
     """Öğrenci modeli"""
     __tablename__ = 'ogrenciler'
+    __table_args__ = (
+        # Sınıf filtresi + kayıt tarihine göre sıralama (sinif_id tek başına da bu indeksi kullanır)
+        db.Index('ix_ogrenciler_sinif_id_kayit_tarihi', 'sinif_id', 'kayit_tarihi'),
+        # Varsayılan liste sıralaması
+        db.Index('ix_ogrenciler_kayit_tarihi', 'kayit_tarihi'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     ad = db.Column(db.String(100), nullable=False)
@@ -32,48 +38,65 @@ class Ogrenci(db.Model):
     kayit_tarihi = db.Column(db.DateTime, default=datetime.utcnow)
     
     # İlişkiler
-    ziyaret_notlari = db.relationship('ZiyaretNotu', backref='ogrenci', lazy=True, cascade='all, delete-orphan')
-    staj_degerlendirme = db.relationship('StajDegerlendirme', backref='ogrenci', uselist=False, cascade='all, delete-orphan')
-    normal_donem_degerlendirme = db.relationship('NormalDonemDegerlendirme', backref='ogrenci', uselist=False, cascade='all, delete-orphan')
+    # Alt kayıtlar veritabanında ON DELETE CASCADE ile silinir; öğrenci silinirken
+    # yüklenmemiş notlar/değerlendirmeler belleğe alınmaz (passive_deletes)
+    ziyaret_notlari = db.relationship('ZiyaretNotu', backref='ogrenci', lazy=True,
+                                      cascade='all, delete-orphan', passive_deletes=True)
+    staj_degerlendirme = db.relationship('StajDegerlendirme', backref='ogrenci', uselist=False,
+                                         cascade='all, delete-orphan', passive_deletes=True)
+    normal_donem_degerlendirme = db.relationship('NormalDonemDegerlendirme', backref='ogrenci', uselist=False,
+                                                 cascade='all, delete-orphan', passive_deletes=True)
     
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'ad': self.ad,
-            'soyad': self.soyad,
-            'ogrenci_no': self.ogrenci_no,
-            'telefon': self.telefon,
-            'sinif_id': self.sinif_id,
-            'sinif_adi': self.sinif.ad if self.sinif else None,
-            'kayit_tarihi': self.kayit_tarihi.strftime('%Y-%m-%d %H:%M:%S') if self.kayit_tarihi else None,
-            'tam_ad': f"{self.ad} {self.soyad}"
-        }
+    # to_dict alanları: ad -> değer (liste endpoint'lerinde alan projeksiyonu için)
+    ALANLAR = {
+        'id': lambda o: o.id,
+        'ad': lambda o: o.ad,
+        'soyad': lambda o: o.soyad,
+        'ogrenci_no': lambda o: o.ogrenci_no,
+        'telefon': lambda o: o.telefon,
+        'sinif_id': lambda o: o.sinif_id,
+        'sinif_adi': lambda o: o.sinif.ad if o.sinif else None,
+        'kayit_tarihi': lambda o: o.kayit_tarihi.strftime('%Y-%m-%d %H:%M:%S') if o.kayit_tarihi else None,
+        'tam_ad': lambda o: f"{o.ad} {o.soyad}"
+    }
+    
+    def to_dict(self, alanlar=None):
+        """Sözlüğe çevir (alanlar verilirse yalnızca o alanlar, verilen sırayla)"""
+        return {alan: self.ALANLAR[alan](self) for alan in alanlar or self.ALANLAR}
 
 class ZiyaretNotu(db.Model):
     """Öğretmen ziyaret notları modeli"""
     __tablename__ = 'ziyaret_notlari'
+    __table_args__ = (
+        # Öğrencinin ziyaretleri tarihe göre sıralı listelenir
+        db.Index('ix_ziyaret_notlari_ogrenci_id_tarih', 'ogrenci_id', 'tarih'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
-    ogrenci_id = db.Column(db.Integer, db.ForeignKey('ogrenciler.id'), nullable=False)
+    ogrenci_id = db.Column(db.Integer, db.ForeignKey('ogrenciler.id', ondelete='CASCADE'), nullable=False)
     tarih = db.Column(db.DateTime, default=datetime.utcnow)
     not_metni = db.Column(db.Text, nullable=False)
     ogretmen_adi = db.Column(db.String(100))
     
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'ogrenci_id': self.ogrenci_id,
-            'tarih': self.tarih.strftime('%Y-%m-%d %H:%M:%S') if self.tarih else None,
-            'not_metni': self.not_metni,
-            'ogretmen_adi': self.ogretmen_adi
-        }
+    # to_dict alanları: ad -> değer (liste endpoint'lerinde alan projeksiyonu için)
+    ALANLAR = {
+        'id': lambda z: z.id,
+        'ogrenci_id': lambda z: z.ogrenci_id,
+        'tarih': lambda z: z.tarih.strftime('%Y-%m-%d %H:%M:%S') if z.tarih else None,
+        'not_metni': lambda z: z.not_metni,
+        'ogretmen_adi': lambda z: z.ogretmen_adi
+    }
+    
+    def to_dict(self, alanlar=None):
+        """Sözlüğe çevir (alanlar verilirse yalnızca o alanlar, verilen sırayla)"""
+        return {alan: self.ALANLAR[alan](self) for alan in alanlar or self.ALANLAR}
 
 class StajDegerlendirme(db.Model):
     """Staj dosyası değerlendirme notu modeli"""
     __tablename__ = 'staj_degerlendirme'
     
     id = db.Column(db.Integer, primary_key=True)
-    ogrenci_id = db.Column(db.Integer, db.ForeignKey('ogrenciler.id'), nullable=False, unique=True)
+    ogrenci_id = db.Column(db.Integer, db.ForeignKey('ogrenciler.id', ondelete='CASCADE'), nullable=False, unique=True)
     
     # Değerlendirme kriterleri (Resimden alınan bilgiler)
     ziyaretci_ogretim_elemani_notu = db.Column(db.Float, default=0)  # 0%
@@ -151,7 +174,7 @@ class NormalDonemDegerlendirme(db.Model):
     __tablename__ = 'normal_donem_degerlendirme'
     
     id = db.Column(db.Integer, primary_key=True)
-    ogrenci_id = db.Column(db.Integer, db.ForeignKey('ogrenciler.id'), nullable=False, unique=True)
+    ogrenci_id = db.Column(db.Integer, db.ForeignKey('ogrenciler.id', ondelete='CASCADE'), nullable=False, unique=True)
     
     # Vize notları
     vize_notu = db.Column(db.Float, default=0)
@@ -302,3 +325,33 @@ class NormalDonemDegerlendirme(db.Model):
             'guncelleme_tarihi': self.guncelleme_tarihi.strftime('%Y-%m-%d %H:%M:%S') if self.guncelleme_tarihi else None
         }
 
+class VeriSurumu(db.Model):
+    """Tablo bazlı veri sürümü (her yazma işleminde artan değişiklik sayacı)"""
+    __tablename__ = 'veri_surumleri'
+    
+    tablo = db.Column(db.String(50), primary_key=True)
+    surum = db.Column(db.Integer, nullable=False, default=0)
+
+class SinifOzet(db.Model):
+    """Sınıf bazında özet sayılar
+    
+    Her görüntülemede yeniden sayılmaz; öğrenci, ziyaret ve değerlendirme yazan servisler
+    aynı transaction içinde fark (delta) uygulayarak güncel tutar (OzetService).
+    """
+    __tablename__ = 'sinif_ozet'
+    
+    # 0 = sınıfı olmayan öğrenciler
+    sinif_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    ogrenci_sayisi = db.Column(db.Integer, nullable=False, default=0)
+    ziyaret_sayisi = db.Column(db.Integer, nullable=False, default=0)
+    staj_degerlendirilen = db.Column(db.Integer, nullable=False, default=0)  # toplamı 0'dan büyük olanlar
+    staj_toplam_toplami = db.Column(db.Float, nullable=False, default=0)
+
+class SinifHarfOzet(db.Model):
+    """Sınıf ve değerlendirme türü bazında harf notu dağılımı (SinifOzet ile birlikte güncellenir)"""
+    __tablename__ = 'sinif_harf_ozet'
+    
+    sinif_id = db.Column(db.Integer, primary_key=True, autoincrement=False)  # 0 = sınıfsız
+    tur = db.Column(db.String(20), primary_key=True)  # staj, normal_donem
+    harf_notu = db.Column(db.String(5), primary_key=True)
+    sayi = db.Column(db.Integer, nullable=False, default=0)
@@ -0,0 +1,462 @@
+"""
+Performans testi (benchmark) scripti
+Verilen öğrenci sayılarında sentetik veritabanları oluşturur ve önemli API/Excel
+yollarını Flask test istemcisi üzerinden ölçer: gecikme (ms), en yüksek Python bellek
+kullanımı (tracemalloc, KB) ve çalıştırılan SQL sorgu sayısı.
+
+Sonuçlar bir JSON referans dosyasıyla karşılaştırılır; bir yol eşik değerinden fazla
+yavaşlarsa, daha çok bellek kullanırsa ya da daha çok sorgu çalıştırırsa script
+1 çıkış koduyla sonlanır. Referans dosyası makineye özeldir, depoya eklenmez; dosya
+yoksa script 1 ile sonlanır (ilk çalıştırmada --kaydet ile oluşturulur). Aşağıdaki
+doğruluk kontrolleri referanstan bağımsız olarak her çalıştırmada yapılır.
+Birden fazla boyut ölçüldüğünde liste ve dışa aktarma yollarının sorgu sayısı
+boyutlar arasında aynı olmalıdır (ör. N ve 10N); değişirse script 1 ile sonlanır.
+Senaryolardan sonra sınıf özet tabloları tam sayımla karşılaştırılır; tutarsızlık
+varsa da script 1 çıkış koduyla sonlanır (sonuçlar referans olarak kaydedilmez).
+Herhangi bir istek başarısız olursa (ör. eşzamanlı not girişinde 'database is locked')
+script yine 1 ile sonlanır. Ölçümler varsayılan olarak üretim profiliyle (WAL, busy
+timeout) yapılır; --profil gelistirme varsayılan SQLite ayarlarıyla (rollback journal,
+sqlite3 sürücüsünün 5 sn'lik beklemesi) karşılaştırma içindir.
+
+Kullanım:
+    python performans_testi.py                          # 1k/10k/100k, referansla karşılaştır
+    python performans_testi.py --boyutlar 1000 10000    # yalnızca verilen boyutlar (N ve 10N sorgu kontrolü)
+    python performans_testi.py --kaydet                 # sonuçları yeni referans olarak kaydet
+    python performans_testi.py --esik 0.5 --profil gelistirme
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from sqlalchemy import event, insert
+from app import create_app
+from database import db
+from models import Ogrenci, ZiyaretNotu, StajDegerlendirme, NormalDonemDegerlendirme, Sinif
+from services.excel_service import ExcelService
+from services.rapor_cache import rapor_cache
+from services.staj_service import OzetService
+
+VARSAYILAN_BOYUTLAR = [1000, 10000, 100000]
+VARSAYILAN_REFERANS = 'performans_referans.json'
+VARSAYILAN_ESIK = 0.25          # %25'ten fazla kötüleşme gerileme sayılır
+MINIMUM_SURE_FARKI_MS = 10      # Çok kısa yollarda ölçüm gürültüsünü yok say
+MINIMUM_BELLEK_FARKI_KB = 256
+TEKRAR = 3
+
+SINIF_SAYISI = 40
+OGRENCI_BASINA_ZIYARET = 3
+ICE_AKTARILAN_SATIR = 1000
+ESZAMANLI_YAZICI = 8
+YAZICI_BASINA_ISTEK = 25
+EKLEME_PARCASI = 5000
+
+def _parcalar(satirlar, boyut=EKLEME_PARCASI):
+    """Satır üreticisini sabit boyutlu listelere böl"""
+    parca = []
+    for satir in satirlar:
+        parca.append(satir)
+        if len(parca) == boyut:
+            yield parca
+            parca = []
+    if parca:
+        yield parca
+
+def _staj_satiri(ogrenci_id, rastgele, simdi):
+    """Hesaplanmış toplam ve harf notuyla staj değerlendirmesi satırı üret"""
+    degerlendirme = StajDegerlendirme(
+        ogrenci_id=ogrenci_id,
+        ziyaretci_ogretim_elemani_notu=0,
+        isyeren_notu=rastgele.randint(10, 30),
+        icindekiler=rastgele.randint(0, 10),
+        firma_bilgisi=rastgele.randint(0, 10),
+        yazim_duzeni=rastgele.randint(0, 10),
+        resim_sekil=rastgele.randint(0, 10),
+        dil_kullanimi=rastgele.randint(0, 20),
+        sonuc_bolumu=rastgele.randint(0, 10),
+        defter_duzeni_mulakat=rastgele.randint(0, 30),
+        guncelleme_tarihi=simdi
+    )
+    degerlendirme.hesapla_toplam()
+    return {k.key: getattr(degerlendirme, k.key) for k in StajDegerlendirme.__table__.columns if k.key != 'id'}
+
+def _normal_donem_satiri(ogrenci_id, rastgele, simdi):
+    """Hesaplanmış notlarla normal dönem değerlendirmesi satırı üret"""
+    butunleme = rastgele.random() < 0.2
+    degerlendirme = NormalDonemDegerlendirme(
+        ogrenci_id=ogrenci_id,
+        vize_notu=rastgele.randint(0, 100),
+        vize_odev_puani=None,
+        vize_odev_yuzdesi=0,
+        final_notu=rastgele.randint(0, 100),
+        final_odev_puani=None,
+        final_odev_yuzdesi=0,
+        devamsizlik_durumu=rastgele.random() < 0.9,
+        butunleme_notu=rastgele.randint(0, 100) if butunleme else None,
+        butunleme_odev_puani=None,
+        butunleme_odev_yuzdesi=0,
+        guncelleme_tarihi=simdi
+    )
+    degerlendirme.hesapla_tum_notlar()
+    return {k.key: getattr(degerlendirme, k.key) for k in NormalDonemDegerlendirme.__table__.columns if k.key != 'id'}
+
+def ornek_veri_olustur(ogrenci_sayisi):
+    """Sınıf, öğrenci, ziyaret ve değerlendirme tablolarını sentetik verilerle doldur"""
+    rastgele = random.Random(ogrenci_sayisi)
+    simdi = datetime.utcnow()
+    
+    db.session.execute(insert(Sinif.__table__), [{'ad': f"Sınıf {i + 1}"} for i in range(SINIF_SAYISI)])
+    
+    ogrenciler = (
+        {
+            'ad': f"Ad{i}",
+            'soyad': f"Soyad{i}",
+            'ogrenci_no': f"{20000000 + i}",
+            'telefon': f"0555{i:07d}",
+            'sinif_id': i % SINIF_SAYISI + 1,
+            'kayit_tarihi': simdi - timedelta(minutes=i)
+        }
+        for i in range(ogrenci_sayisi)
+    )
+    ziyaretler = (
+        {
+            'ogrenci_id': i % ogrenci_sayisi + 1,
+            'not_metni': "Staj yerine ziyaret yapıldı, öğrenci çalışmalarını anlattı.",
+            'ogretmen_adi': f"Öğretmen {i % 25}",
+            'tarih': simdi - timedelta(hours=i)
+        }
+        for i in range(ogrenci_sayisi * OGRENCI_BASINA_ZIYARET)
+    )
+    # Öğrencilerin ~%80'inin staj, ~%70'inin normal dönem notu girilmiş olsun
+    staj = (
+        _staj_satiri(i + 1, rastgele, simdi)
+        for i in range(ogrenci_sayisi) if i % 5
+    )
+    normal_donem = (
+        _normal_donem_satiri(i + 1, rastgele, simdi)
+        for i in range(ogrenci_sayisi) if i % 10 < 7
+    )
+    
+    for model, satirlar in ((Ogrenci, ogrenciler), (ZiyaretNotu, ziyaretler),
+                            (StajDegerlendirme, staj), (NormalDonemDegerlendirme, normal_donem)):
+        for parca in _parcalar(satirlar):
+            db.session.execute(insert(model.__table__), parca)
+    db.session.commit()
+    OzetService.yeniden_olustur()
+
+class SorguSayaci:
+    """Engine üzerinde çalıştırılan SQL ifadelerini say"""
+    
+    def __init__(self, engine):
+        self.engine = engine
+        self.sayi = 0
+    
+    def _say(self, *args):
+        self.sayi += 1
+    
+    def __enter__(self):
+        self.sayi = 0
+        event.listen(self.engine, 'before_cursor_execute', self._say)
+        return self
+    
+    def __exit__(self, *args):
+        event.remove(self.engine, 'before_cursor_execute', self._say)
+
+def _istek(istemci, metot, url, **kwargs):
+    """İsteği gönder, yanıt gövdesini sonuna kadar oku ve başarılı olduğunu doğrula"""
+    yanit = istemci.open(url, method=metot, **kwargs)
+    govde = yanit.get_data()
+    yanit.close()
+    if yanit.status_code != 200:
+        raise RuntimeError(f"{metot} {url} -> {yanit.status_code}: {govde[:200]!r}")
+    return govde
+
+def _ice_aktarma_dosyasi(ortam):
+    """Her çalıştırmada farklı öğrenci numaralarıyla içe aktarma dosyası hazırla"""
+    baslangic = 90000000 + ortam['ice_aktarma_sayisi'] * ICE_AKTARILAN_SATIR
+    ortam['ice_aktarma_sayisi'] += 1
+    
+    tampon = io.BytesIO()
+    ExcelService._calisma_kitabi_yaz(
+        tampon, 'Öğrenciler', ['Ad', 'Soyad', 'Öğrenci No', 'Telefon'],
+        ([f"Yeni{i}", f"Kayit{i}", str(baslangic + i), None] for i in range(ICE_AKTARILAN_SATIR)),
+        '4472C4'
+    )
+    tampon.seek(0)
+    return {'data': {'file': (tampon, 'ogrenciler.xlsx')}, 'content_type': 'multipart/form-data'}
+
+def _eszamanli_not_girisi(istemci, ortam):
+    """Bir okuyucu rapor indirirken birden fazla istemcinin aynı anda not girmesi
+    
+    Başarısız istekler (ör. 'database is locked') hata_sayisi olarak raporlanır.
+    """
+    hatalar = []
+    
+    def yazici(sira):
+        yazici_istemci = ortam['app'].test_client()
+        for i in range(YAZICI_BASINA_ISTEK):
+            ogrenci_id = (sira * YAZICI_BASINA_ISTEK + i) % ortam['ogrenci_sayisi'] + 1
+            try:
+                _istek(yazici_istemci, 'POST', f'/api/degerlendirme/{ogrenci_id}', json={'isyeren_notu': i % 30})
+            except Exception as e:
+                hatalar.append(str(e))
+    
+    def okuyucu():
+        try:
+            _istek(ortam['app'].test_client(), 'GET', '/api/excel/export')
+        except Exception as e:
+            hatalar.append(str(e))
+    
+    islemler = [threading.Thread(target=yazici, args=(i,)) for i in range(ESZAMANLI_YAZICI)]
+    islemler.append(threading.Thread(target=okuyucu))
+    for islem in islemler:
+        islem.start()
+    for islem in islemler:
+        islem.join()
+    
+    if hatalar:
+        print(f"   ⚠️  {len(hatalar)} eşzamanlı istek başarısız: {hatalar[0][:150]}")
+    return {'hata_sayisi': len(hatalar)}
+
+# Ölçülen yollar: ad -> (hazırlık fonksiyonu (süreye dahil değil), çalıştırma fonksiyonu)
+SENARYOLAR = {
+    'ogrenci_listesi': (None, lambda istemci, ortam, hazirlik: _istek(istemci, 'GET', '/api/ogrenciler')),
+    'ogrenci_listesi_sayfa': (None, lambda istemci, ortam, hazirlik: _istek(istemci, 'GET', '/api/ogrenciler?limit=200')),
+    'ogrenci_listesi_sutunlu': (None, lambda istemci, ortam, hazirlik: _istek(istemci, 'GET', '/api/ogrenciler?format=columnar&fields=id,ogrenci_no,tam_ad,sinif_adi')),
+    'ogrenci_detay': (None, lambda istemci, ortam, hazirlik: _istek(istemci, 'GET', f"/api/ogrenciler/{ortam['ornek_ogrenci_id']}")),
+    'harf_notlari': (None, lambda istemci, ortam, hazirlik: _istek(istemci, 'GET', '/api/istatistikler/harf-notlari')),
+    'istatistik_ozeti': (None, lambda istemci, ortam, hazirlik: _istek(istemci, 'GET', '/api/istatistikler/ozet')),
+    'excel_export': (None, lambda istemci, ortam, hazirlik: _istek(istemci, 'GET', '/api/excel/export')),
+    # Rapor önbelleği her çalıştırmadan önce boşaltılır; ölçülen süre raporun oluşturulmasıdır
+    'excel_staj_raporu': (
+        lambda ortam: rapor_cache.temizle(),
+        lambda istemci, ortam, hazirlik: _istek(istemci, 'GET', '/api/excel/rapor')
+    ),
+    'excel_normal_donem_raporu': (
+        lambda ortam: rapor_cache.temizle(),
+        lambda istemci, ortam, hazirlik: _istek(istemci, 'GET', '/api/excel/rapor/normal-donem')
+    ),
+    'csv_export': (None, lambda istemci, ortam, hazirlik: _istek(istemci, 'GET', '/api/disa-aktar/ogrenciler.csv')),
+    'ndjson_staj_raporu': (None, lambda istemci, ortam, hazirlik: _istek(istemci, 'GET', '/api/disa-aktar/staj.ndjson')),
+    'excel_import': (
+        _ice_aktarma_dosyasi,
+        lambda istemci, ortam, hazirlik: _istek(istemci, 'POST', '/api/excel/import', **hazirlik)
+    ),
+    'eszamanli_not_girisi': (None, lambda istemci, ortam, hazirlik: _eszamanli_not_girisi(istemci, ortam)),
+}
+
+ESZAMANLI_SENARYOLAR = ('eszamanli_not_girisi',)
+
+# Sorgu sayısı öğrenci sayısından bağımsız olması gereken liste, detay ve dışa aktarma yolları
+# (tests/test_sorgu_sayilari.py bunları küçük veritabanlarında da kontrol eder)
+SABIT_SORGULU_SENARYOLAR = (
+    'ogrenci_listesi', 'ogrenci_listesi_sayfa', 'ogrenci_listesi_sutunlu', 'ogrenci_detay',
+    'excel_export', 'excel_staj_raporu', 'excel_normal_donem_raporu', 'csv_export', 'ndjson_staj_raporu'
+)
+
+def senaryo_olc(istemci, ortam, hazirla, calistir, tekrar):
+    """Bir yolu ölç: ilk çalıştırmada bellek ve sorgu sayısı, sonrakilerde süre"""
+    sayac = SorguSayaci(ortam['engine'])
+    
+    ek_olcumler = []
+    
+    hazirlik = hazirla(ortam) if hazirla else None
+    tracemalloc.start()
+    with sayac:
+        ek_olcumler.append(calistir(istemci, ortam, hazirlik))
+    _, en_yuksek_bellek = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    sureler = []
+    for _ in range(tekrar):
+        hazirlik = hazirla(ortam) if hazirla else None
+        baslangic = time.perf_counter()
+        ek_olcumler.append(calistir(istemci, ortam, hazirlik))
+        sureler.append((time.perf_counter() - baslangic) * 1000)
+    
+    sonuc = {
+        'sure_ms': round(statistics.median(sureler), 2),
+        'bellek_kb': round(en_yuksek_bellek / 1024, 1),
+        'sorgu_sayisi': sayac.sayi
+    }
+    # Senaryonun döndürdüğü ek sayaçlar (ör. hata_sayisi) tüm çalıştırmalar boyunca toplanır
+    for ek in ek_olcumler:
+        if isinstance(ek, dict):
+            for anahtar, deger in ek.items():
+                sonuc[anahtar] = sonuc.get(anahtar, 0) + deger
+    return sonuc
+
+def boyut_olc(ogrenci_sayisi, profil, tekrar, senaryolar):
+    """Verilen öğrenci sayısıyla veritabanı oluştur ve tüm senaryoları ölç
+    
+    Dönüş: (senaryo sonuçları, sınıf özeti tutarsızlıkları)
+    """
+    dosya = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+    dosya.close()
+    ayarlar = {
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{dosya.name}",
+        'VERITABANI_PROFILI': profil
+    }
+    app = create_app(ayarlar)
+    
+    try:
+        with app.app_context():
+            baslangic = time.perf_counter()
+            ornek_veri_olustur(ogrenci_sayisi)
+            print(f"📚 {ogrenci_sayisi} öğrenci oluşturuldu ({time.perf_counter() - baslangic:.1f} sn)")
+            
+            ortam = {
+                'app': app,
+                'engine': db.engine,
+                'ogrenci_sayisi': ogrenci_sayisi,
+                # Ziyaret notları ve iki değerlendirmesi de olan bir öğrenci
+                'ornek_ogrenci_id': ogrenci_sayisi // 2 + 1,
+                'ice_aktarma_sayisi': 0
+            }
+        
+        istemci = app.test_client()
+        sonuclar = {}
+        for ad in senaryolar:
+            hazirla, calistir = SENARYOLAR[ad]
+            sonuclar[ad] = senaryo_olc(istemci, ortam, hazirla, calistir, tekrar)
+            print(f"   {ad:<28} {sonuclar[ad]['sure_ms']:>10.2f} ms "
+                  f"{sonuclar[ad]['bellek_kb']:>10.1f} KB {sonuclar[ad]['sorgu_sayisi']:>6} sorgu")
+        
+        # Senaryolardaki yazmalardan sonra sınıf özetleri tam sayımla aynı kalmalı
+        with app.app_context():
+            farklar = OzetService.tutarlilik_kontrolu()
+        hatalar = [
+            f"{ogrenci_sayisi} öğrenci: {fark['tablo']} {fark['anahtar']} özet={fark['ozet']} sayım={fark['sayim']}"
+            for fark in farklar
+        ]
+        return sonuclar, hatalar
+    finally:
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        os.remove(dosya.name)
+
+def sorgu_artislarini_bul(sonuclar):
+    """Sorgu sayısı ölçülen boyutlar arasında değişen (N+1 benzeri) liste/detay/dışa aktarma yollarını listele"""
+    artislar = []
+    boyutlar = sorted(sonuclar, key=int)
+    for ad in SABIT_SORGULU_SENARYOLAR:
+        sayilar = [(boyut, sonuclar[boyut][ad]['sorgu_sayisi']) for boyut in boyutlar if ad in sonuclar[boyut]]
+        if len({sayi for _, sayi in sayilar}) > 1:
+            artislar.append(f"{ad}: " + ", ".join(f"{boyut} öğrenci {sayi} sorgu" for boyut, sayi in sayilar))
+    return artislar
+
+def basarisiz_istekleri_bul(sonuclar):
+    """Başarısız istek (ör. eşzamanlı yazmada 'database is locked') olan yolları listele"""
+    return [
+        f"{boyut}/{ad}: {olcum['hata_sayisi']} başarısız istek"
+        for boyut, yollar in sonuclar.items()
+        for ad, olcum in yollar.items() if olcum.get('hata_sayisi')
+    ]
+
+def gerilemeleri_bul(sonuclar, referans, esik):
+    """Referansa göre eşiği aşan kötüleşmeleri listele"""
+    gerilemeler = []
+    for boyut, yollar in sonuclar.items():
+        for ad, olcum in yollar.items():
+            onceki = referans.get(boyut, {}).get(ad)
+            if not onceki:
+                continue
+            
+            if (olcum['sure_ms'] > onceki['sure_ms'] * (1 + esik)
+                    and olcum['sure_ms'] - onceki['sure_ms'] > MINIMUM_SURE_FARKI_MS):
+                gerilemeler.append(f"{boyut}/{ad}: süre {onceki['sure_ms']} -> {olcum['sure_ms']} ms")
+            if (olcum['bellek_kb'] > onceki['bellek_kb'] * (1 + esik)
+                    and olcum['bellek_kb'] - onceki['bellek_kb'] > MINIMUM_BELLEK_FARKI_KB):
+                gerilemeler.append(f"{boyut}/{ad}: bellek {onceki['bellek_kb']} -> {olcum['bellek_kb']} KB")
+            # Sorgu sayısı deterministiktir; her artış gerilemedir (ör. N+1). Eşzamanlı
+            # senaryoda sayı iş parçacıklarının sırasına bağlı olduğu için karşılaştırılmaz.
+            if ad not in ESZAMANLI_SENARYOLAR and olcum['sorgu_sayisi'] > onceki['sorgu_sayisi']:
+                gerilemeler.append(f"{boyut}/{ad}: sorgu {onceki['sorgu_sayisi']} -> {olcum['sorgu_sayisi']}")
+    return gerilemeler
+
+def main():
+    parser = argparse.ArgumentParser(description="Staj Takip Sistemi performans testi")
+    parser.add_argument('--boyutlar', type=int, nargs='+', default=VARSAYILAN_BOYUTLAR,
+                        help="Ölçülecek öğrenci sayıları")
+    parser.add_argument('--senaryolar', nargs='+', choices=list(SENARYOLAR), default=list(SENARYOLAR),
+                        help="Ölçülecek yollar")
+    parser.add_argument('--referans', default=VARSAYILAN_REFERANS, help="Referans JSON dosyası")
+    parser.add_argument('--kaydet', action='store_true', help="Sonuçları referans olarak kaydet")
+    parser.add_argument('--esik', type=float, default=VARSAYILAN_ESIK,
+                        help="İzin verilen kötüleşme oranı (0.25 = %%25)")
+    parser.add_argument('--tekrar', type=int, default=TEKRAR, help="Süre ölçümü tekrar sayısı")
+    parser.add_argument('--profil', default=os.environ.get('VERITABANI_PROFILI', 'uretim'),
+                        help="Veritabanı profili (uretim/gelistirme)")
+    args = parser.parse_args()
+    
+    sonuclar = {}
+    tutarsizliklar = []
+    for boyut in args.boyutlar:
+        print("=" * 72)
+        sonuclar[str(boyut)], hatalar = boyut_olc(boyut, args.profil, args.tekrar, args.senaryolar)
+        tutarsizliklar.extend(hatalar)
+    print("=" * 72)
+    
+    # Tutarsız özetle ölçülen sonuçlar referans olarak kaydedilmez
+    if tutarsizliklar:
+        print(f"❌ Sınıf özetinde {len(tutarsizliklar)} tutarsızlık bulundu:")
+        for tutarsizlik in tutarsizliklar:
+            print(f"   - {tutarsizlik}")
+        return 1
+    
+    # Birden fazla boyut ölçüldüyse liste/dışa aktarma sorgu sayıları boyuttan bağımsız olmalı
+    sorgu_artislari = sorgu_artislarini_bul(sonuclar)
+    if sorgu_artislari:
+        print(f"❌ {len(sorgu_artislari)} yolda sorgu sayısı öğrenci sayısıyla değişiyor:")
+        for artis in sorgu_artislari:
+            print(f"   - {artis}")
+        return 1
+    
+    # Başarısız yazmalarla ölçülen sonuçlar da referans olarak kaydedilmez
+    basarisizlar = basarisiz_istekleri_bul(sonuclar)
+    if basarisizlar:
+        print(f"❌ {len(basarisizlar)} yolda başarısız istek var (profil: {args.profil}):")
+        for basarisiz in basarisizlar:
+            print(f"   - {basarisiz}")
+        return 1
+    
+    if args.kaydet:
+        with open(args.referans, 'w', encoding='utf-8') as f:
+            json.dump({
+                'tarih': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'profil': args.profil,
+                'sonuclar': sonuclar
+            }, f, indent=2, ensure_ascii=False)
+        print(f"💾 Referans kaydedildi: {args.referans}")
+        return 0
+    
+    # Referans yoksa gerileme kontrolü yapılamaz; başarılı sayılmaz
+    if not os.path.exists(args.referans):
+        print(f"❌ Referans dosyası yok ({args.referans}); önce --kaydet ile oluşturun.")
+        return 1
+    
+    with open(args.referans, encoding='utf-8') as f:
+        referans = json.load(f)['sonuclar']
+    
+    gerilemeler = gerilemeleri_bul(sonuclar, referans, args.esik)
+    if gerilemeler:
+        print(f"❌ {len(gerilemeler)} gerileme bulundu (eşik: %{args.esik * 100:.0f}):")
+        for gerileme in gerilemeler:
+            print(f"   - {gerileme}")
+        return 1
+    
+    print(f"✅ Referansa göre gerileme yok (eşik: %{args.esik * 100:.0f})")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+Sınıf rapor paketi performans scripti
+Her sınıf için staj ve normal dönem raporlarını tek süreçte sırayla oluşturmayı
+(sınıf sınıf indirmenin karşılığı) süreç havuzuyla paralel oluşturulan ZIP paketiyle,
+farklı çalışan sayılarında karşılaştırır. Hızlanma çekirdek sayısıyla sınırlıdır.
+Süreç havuzu istekler arasında paylaşıldığından her çalışan sayısı için bir ısınma
+çalıştırması (havuzun ve çalışan uygulamalarının kurulması) ölçüme dahil edilmez;
+tek çalışanda paket istek içinde sırayla oluşturulur.
+
+Kullanım:
+    python rapor_paketi_performansi.py                         # 20k öğrenci, 1..çekirdek sayısı çalışan
+    python rapor_paketi_performansi.py --ogrenci 50000 --calisanlar 1 2 4 8
+"""
+import argparse
+import io
+import os
+import tempfile
+import time
+import zipfile
+from app import create_app
+from database import db
+from performans_testi import ornek_veri_olustur, SINIF_SAYISI
+from services.excel_service import ExcelService
+from services.rapor_paketi_service import RaporPaketiService
+from services.staj_service import SinifService
+
+def sirali_paket():
+    """Raporları mevcut yöntemle tek süreçte sırayla oluşturup ZIP'e yaz"""
+    tampon = io.BytesIO()
+    with zipfile.ZipFile(tampon, 'w', compression=zipfile.ZIP_STORED) as arsiv:
+        for sinif in SinifService.tum_siniflari_getir():
+            for fonksiyon_adi, klasor in RaporPaketiService.RAPORLAR.values():
+                rapor = io.BytesIO()
+                getattr(ExcelService, fonksiyon_adi)(rapor, sinif_id=sinif.id)
+                arsiv.writestr(RaporPaketiService._dosya_adi(klasor, sinif), rapor.getvalue())
+    return tampon.getvalue()
+
+def paralel_paket(calisan_sayisi):
+    """Raporları süreç havuzunda oluşturan paket akışını sonuna kadar oku"""
+    return b''.join(RaporPaketiService.paket_parcalari(calisan_sayisi=calisan_sayisi))
+
+def olc(fonksiyon, *args):
+    """Fonksiyonun süresini (sn) ve ürettiği paketteki dosya sayısını getir"""
+    baslangic = time.perf_counter()
+    veri = fonksiyon(*args)
+    sure = time.perf_counter() - baslangic
+    return sure, len(zipfile.ZipFile(io.BytesIO(veri)).namelist())
+
+def main():
+    cekirdek = os.cpu_count() or 1
+    varsayilan_calisanlar = sorted({1, *(2 ** i for i in range(1, 7) if 2 ** i <= cekirdek), cekirdek})
+    
+    parser = argparse.ArgumentParser(description="Sınıf rapor paketi paralel oluşturma karşılaştırması")
+    parser.add_argument('--ogrenci', type=int, default=20000, help="Öğrenci sayısı")
+    parser.add_argument('--calisanlar', nargs='+', type=int, default=varsayilan_calisanlar,
+                        help="Denenecek çalışan süreç sayıları")
+    args = parser.parse_args()
+    
+    dizin = tempfile.mkdtemp(prefix='rapor_paketi_')
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(dizin, 'paket.db')}"})
+    
+    try:
+        with app.app_context():
+            print(f"📚 {args.ogrenci} öğrenci, {SINIF_SAYISI} sınıf oluşturuluyor... ({cekirdek} çekirdek)\n")
+            ornek_veri_olustur(args.ogrenci)
+            
+            sirali_sure, dosya_sayisi = olc(sirali_paket)
+            print("=" * 60)
+            print(f"   {'Sıralı (tek süreç)':<24} {sirali_sure:8.2f} sn   {dosya_sayisi} rapor")
+            
+            for calisan_sayisi in args.calisanlar:
+                paralel_paket(calisan_sayisi)
+                sure, dosya_sayisi = olc(paralel_paket, calisan_sayisi)
+                print(f"   {f'{calisan_sayisi} çalışan':<24} {sure:8.2f} sn   {dosya_sayisi} rapor   "
+                      f"x{sirali_sure / sure:.2f}")
+            print("=" * 60)
+    finally:
+        RaporPaketiService.havuzu_kapat()
+        with app.app_context():
+            db.engine.dispose()
+        for dosya in os.listdir(dizin):
+            os.remove(os.path.join(dizin, dosya))
+        os.rmdir(dizin)
+
+if __name__ == '__main__':
+    main()
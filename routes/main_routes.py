@@ -1,11 +1,68 @@
-from flask import Blueprint, render_template, request, jsonify, send_file
-from services.staj_service import OgrenciService, ZiyaretService, DegerlendirmeService, NormalDonemService, SinifService
+from flask import Blueprint, render_template, request, jsonify, send_file, make_response, current_app, Response, stream_with_context
+from services.staj_service import OgrenciService, ZiyaretService, DegerlendirmeService, NormalDonemService, SinifService, IstatistikService, SurumService
 from services.excel_service import ExcelService
+from services.disa_aktarma_service import DisaAktarmaService
+from services.rapor_paketi_service import RaporPaketiService
+from services.analiz_service import AnalizService
+from services.rapor_cache import rapor_cache
+from services.is_yoneticisi import is_yoneticisi
+from services.json_yanit import json_yaniti
+from models import Ogrenci, ZiyaretNotu
+import io
 import os
-from werkzeug.utils import secure_filename
 
 main_bp = Blueprint('main', __name__)
 
+EXCEL_MIMETYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+def _kosullu_yanit(tablolar, yanit_olustur):
+    """Tablo veri sürümlerinden güçlü ETag üretip koşullu GET'i yanıtla
+    
+    ETag yanıt gövdesinden değil, yanıtın bağlı olduğu tabloların sürüm sayaçlarından
+    hesaplanır. İstemcideki kopya güncelse (If-None-Match) gövde hiç oluşturulmadan
+    304 döner.
+    """
+    etag = 'v' + '-'.join(str(surum) for surum in SurumService.getir(*tablolar))
+    if request.if_none_match.contains(etag):
+        response = make_response('', 304)
+    else:
+        response = make_response(yanit_olustur())
+    
+    if response.status_code in (200, 304):
+        response.set_etag(etag)
+        # Tarayıcı her kullanımda sunucuya sorsun (değişmediyse 304 döner)
+        response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+LISTE_BICIMLERI = ('rows', 'columnar')
+
+def _liste_yaniti(anahtar, nesneler, model, **ekler):
+    """Liste yanıtını alan projeksiyonu ve istenen biçimle hızlı JSON olarak oluştur
+    
+    fields: virgülle ayrılmış alan adları (model.ALANLAR), verilmezse tüm alanlar
+    format=rows (varsayılan): her kayıt için bir nesne
+    format=columnar: her alan için bir dizi ({alan: [değerler]}); anahtarlar tekrarlanmaz
+    """
+    bicim = request.args.get('format', 'rows')
+    if bicim not in LISTE_BICIMLERI:
+        raise ValueError(f"Geçersiz biçim: {bicim}")
+    
+    alanlar = [alan.strip() for alan in request.args.get('fields', '').split(',') if alan.strip()]
+    bilinmeyenler = [alan for alan in alanlar if alan not in model.ALANLAR]
+    if bilinmeyenler:
+        raise ValueError(f"Geçersiz alan(lar): {', '.join(bilinmeyenler)}")
+    alanlar = alanlar or list(model.ALANLAR)
+    
+    veri = {'basarili': True}
+    if bicim == 'columnar':
+        veri['format'] = 'columnar'
+        veri['sayi'] = len(nesneler)
+        veri[anahtar] = {alan: list(map(model.ALANLAR[alan], nesneler)) for alan in alanlar}
+    else:
+        veri[anahtar] = [nesne.to_dict(alanlar) for nesne in nesneler]
+    veri.update(ekler)
+    return json_yaniti(veri)
+
 # Ana sayfa - Öğrenci listesi
 @main_bp.route('/')
 def index():
@@ -16,12 +73,15 @@ def index():
 @main_bp.route('/api/siniflar', methods=['GET'])
 def siniflari_getir():
     """Tüm sınıfları getir"""
-    try:
+    def yanit_olustur():
         siniflar = SinifService.tum_siniflari_getir()
         return jsonify({
             'basarili': True,
             'siniflar': [s.to_dict() for s in siniflar]
         })
+    
+    try:
+        return _kosullu_yanit(('siniflar',), yanit_olustur)
     except Exception as e:
         return jsonify({'basarili': False, 'hata': str(e)}), 500
 
@@ -74,41 +134,78 @@ def sinif_sil(sinif_id):
 # Öğrenci işlemleri
 @main_bp.route('/api/ogrenciler', methods=['GET'])
 def ogrencileri_getir():
-    """Tüm öğrencileri getir (opsiyonel: sınıf filtresi)"""
+    """Tüm öğrencileri getir (opsiyonel: sınıf filtresi)
+    
+    limit, cursor veya siralama parametrelerinden biri verilirse sonuçlar
+    imleç tabanlı sayfalanır; verilmezse tüm liste tek seferde döner.
+    """
+    sinif_id = request.args.get('sinif_id', type=int)
+    
+    def yanit_olustur():
+        if any(p in request.args for p in ('limit', 'cursor', 'siralama')):
+            ogrenciler, sonraki_cursor = OgrenciService.ogrencileri_sayfala(
+                sinif_id=sinif_id,
+                limit=request.args.get('limit', default=100, type=int),
+                cursor=request.args.get('cursor'),
+                siralama=request.args.get('siralama')
+            )
+            return _liste_yaniti('ogrenciler', ogrenciler, Ogrenci, sonraki_cursor=sonraki_cursor)
+        
+        ogrenciler = OgrenciService.tum_ogrencileri_getir(sinif_id=sinif_id, profil='liste')
+        return _liste_yaniti('ogrenciler', ogrenciler, Ogrenci)
+    
     try:
-        sinif_id = request.args.get('sinif_id', type=int)
-        ogrenciler = OgrenciService.tum_ogrencileri_getir(sinif_id=sinif_id)
-        return jsonify({
-            'basarili': True,
-            'ogrenciler': [o.to_dict() for o in ogrenciler]
-        })
+        # Harf notuna göre sıralama staj değerlendirmelerine de bağlıdır
+        tablolar = ('ogrenciler', 'siniflar')
+        if 'harf_notu' in request.args.get('siralama', ''):
+            tablolar += ('staj_degerlendirme',)
+        return _kosullu_yanit(tablolar, yanit_olustur)
+    except ValueError as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 400
     except Exception as e:
         return jsonify({'basarili': False, 'hata': str(e)}), 500
 
 @main_bp.route('/api/ogrenciler/<int:ogrenci_id>', methods=['GET'])
 def ogrenci_detay(ogrenci_id):
-    """Öğrenci detayları"""
-    try:
-        ogrenci = OgrenciService.ogrenci_getir(ogrenci_id)
-        if not ogrenci:
+    """Öğrenci detayları (en son ziyaret notları ve toplam ziyaret sayısıyla)"""
+    def yanit_olustur():
+        detay = OgrenciService.ogrenci_detay_getir(
+            ogrenci_id,
+            ziyaret_limiti=request.args.get('ziyaret_limiti', type=int)
+        )
+        if not detay:
             return jsonify({'basarili': False, 'hata': 'Öğrenci bulunamadı'}), 404
         
-        # Ziyaret notlarını al
-        ziyaretler = ZiyaretService.ogrenci_ziyaretlerini_getir(ogrenci_id)
-        
-        # Değerlendirmeyi al
-        degerlendirme = DegerlendirmeService.degerlendirme_getir(ogrenci_id)
-        
-        # Normal dönem değerlendirmesini al
-        normal_donem = NormalDonemService.degerlendirme_getir(ogrenci_id)
-        
         return jsonify({
             'basarili': True,
-            'ogrenci': ogrenci.to_dict(),
-            'ziyaretler': [z.to_dict() for z in ziyaretler],
-            'degerlendirme': degerlendirme.to_dict() if degerlendirme else None,
-            'normal_donem': normal_donem.to_dict() if normal_donem else None
+            'ogrenci': detay['ogrenci'].to_dict(),
+            'ziyaretler': [z.to_dict() for z in detay['ziyaretler']],
+            'toplam_ziyaret': detay['toplam_ziyaret'],
+            'ziyaret_cursor': detay['ziyaret_cursor'],
+            'degerlendirme': detay['degerlendirme'].to_dict(),
+            'normal_donem': detay['normal_donem'].to_dict()
         })
+    
+    try:
+        return _kosullu_yanit(
+            ('ogrenciler', 'siniflar', 'ziyaret_notlari', 'staj_degerlendirme', 'normal_donem_degerlendirme'),
+            yanit_olustur
+        )
+    except Exception as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 500
+
+@main_bp.route('/api/ogrenciler/<int:ogrenci_id>/ziyaretler', methods=['GET'])
+def ogrenci_ziyaretleri(ogrenci_id):
+    """Öğrencinin ziyaret notlarını sayfalı getir (en yeniden eskiye)"""
+    try:
+        ziyaretler, sonraki_cursor = ZiyaretService.ziyaretleri_sayfala(
+            ogrenci_id,
+            limit=request.args.get('limit', default=OgrenciService.DETAY_ZIYARET_SAYISI, type=int),
+            cursor=request.args.get('cursor')
+        )
+        return _liste_yaniti('ziyaretler', ziyaretler, ZiyaretNotu, sonraki_cursor=sonraki_cursor)
+    except ValueError as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 400
     except Exception as e:
         return jsonify({'basarili': False, 'hata': str(e)}), 500
 
@@ -170,6 +267,25 @@ def ogrenci_sil(ogrenci_id):
     except Exception as e:
         return jsonify({'basarili': False, 'hata': str(e)}), 500
 
+@main_bp.route('/api/ogrenciler/toplu-sil', methods=['POST'])
+def ogrenci_toplu_sil():
+    """Öğrenci listesini ({'ogrenci_idleri': [...]}) ya da bir sınıfın tüm öğrencilerini ({'sinif_id': 1}) sil"""
+    try:
+        data = request.get_json(silent=True) or {}
+        ogrenci_idleri = data.get('ogrenci_idleri')
+        if ogrenci_idleri is not None and not isinstance(ogrenci_idleri, list):
+            raise ValueError("ogrenci_idleri bir liste olmalı!")
+        sonuc = OgrenciService.toplu_ogrenci_sil(ogrenci_idleri=ogrenci_idleri, sinif_id=data.get('sinif_id'))
+        return jsonify({
+            'basarili': True,
+            'mesaj': f"{sonuc['silinen']} öğrenci silindi",
+            **sonuc
+        })
+    except ValueError as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 400
+    except Exception as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 500
+
 # Ziyaret notu işlemleri
 @main_bp.route('/api/ziyaretler', methods=['POST'])
 def ziyaret_notu_ekle():
@@ -191,6 +307,33 @@ def ziyaret_notu_ekle():
     except Exception as e:
         return jsonify({'basarili': False, 'hata': str(e)}), 500
 
+@main_bp.route('/api/ziyaretler/ara', methods=['GET'])
+def ziyaret_ara():
+    """Tüm ziyaret notlarında tam metin arama (alakaya göre sıralı, sayfalı)"""
+    try:
+        sonuclar, sonraki_cursor = ZiyaretService.ziyaret_ara(
+            request.args.get('q', ''),
+            limit=request.args.get('limit', type=int),
+            cursor=request.args.get('cursor')
+        )
+        return jsonify({
+            'basarili': True,
+            'sonuclar': [
+                {
+                    'ziyaret': ziyaret.to_dict(),
+                    'ogrenci': ziyaret.ogrenci.to_dict(),
+                    'ozet': ozet,
+                    'skor': skor
+                }
+                for ziyaret, ozet, skor in sonuclar
+            ],
+            'sonraki_cursor': sonraki_cursor
+        })
+    except ValueError as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 400
+    except Exception as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 500
+
 @main_bp.route('/api/ziyaretler/<int:ziyaret_id>', methods=['DELETE'])
 def ziyaret_sil(ziyaret_id):
     """Ziyaret notunu sil"""
@@ -232,6 +375,32 @@ def degerlendirme_guncelle(ogrenci_id):
             'mesaj': 'Değerlendirme başarıyla güncellendi',
             'degerlendirme': degerlendirme.to_dict()
         })
+    except ValueError as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 400
+    except Exception as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 500
+
+def _toplu_kayitlari_al():
+    """Toplu not girişi gövdesini ({'kayitlar': [...]} veya doğrudan liste) oku"""
+    data = request.get_json(silent=True)
+    kayitlar = data.get('kayitlar') if isinstance(data, dict) else data
+    if not isinstance(kayitlar, list):
+        raise ValueError("Kayıt listesi (kayitlar) gerekli!")
+    return kayitlar
+
+@main_bp.route('/api/degerlendirme/toplu', methods=['POST'])
+def degerlendirme_toplu_guncelle():
+    """Birden fazla öğrencinin staj değerlendirmesini tek seferde güncelle"""
+    try:
+        degerlendirmeler, hatalar = DegerlendirmeService.toplu_guncelle(_toplu_kayitlari_al())
+        return jsonify({
+            'basarili': True,
+            'mesaj': f'{len(degerlendirmeler)} değerlendirme güncellendi',
+            'degerlendirmeler': [d.to_dict() for d in degerlendirmeler],
+            'hatalar': hatalar
+        })
+    except ValueError as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 400
     except Exception as e:
         return jsonify({'basarili': False, 'hata': str(e)}), 500
 
@@ -262,6 +431,24 @@ def normal_donem_guncelle(ogrenci_id):
             'mesaj': 'Normal dönem değerlendirmesi başarıyla güncellendi',
             'degerlendirme': degerlendirme.to_dict()
         })
+    except ValueError as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 400
+    except Exception as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 500
+
+@main_bp.route('/api/normal-donem/toplu', methods=['POST'])
+def normal_donem_toplu_guncelle():
+    """Birden fazla öğrencinin normal dönem değerlendirmesini tek seferde güncelle"""
+    try:
+        degerlendirmeler, hatalar = NormalDonemService.toplu_guncelle(_toplu_kayitlari_al())
+        return jsonify({
+            'basarili': True,
+            'mesaj': f'{len(degerlendirmeler)} normal dönem değerlendirmesi güncellendi',
+            'degerlendirmeler': [d.to_dict() for d in degerlendirmeler],
+            'hatalar': hatalar
+        })
+    except ValueError as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 400
     except Exception as e:
         return jsonify({'basarili': False, 'hata': str(e)}), 500
 
@@ -271,15 +458,32 @@ def excel_export():
     """Öğrenci listesini Excel'e aktar (opsiyonel: sınıf filtresi)"""
     try:
         sinif_id = request.args.get('sinif_id', type=int)
-        dosya_yolu = ExcelService.ogrencileri_excel_aktar('ogrenci_listesi.xlsx', sinif_id=sinif_id)
-        return send_file(dosya_yolu, as_attachment=True, download_name='ogrenci_listesi.xlsx')
+        tampon = ExcelService.bellekte_olustur(ExcelService.ogrencileri_excel_aktar, sinif_id=sinif_id)
+        return send_file(tampon, as_attachment=True, download_name='ogrenci_listesi.xlsx', mimetype=EXCEL_MIMETYPE)
     except Exception as e:
         return jsonify({'basarili': False, 'hata': str(e)}), 500
 
+def _aktarma_secenekleri():
+    """İçe aktarma seçeneklerini oku: mode (insert/upsert), dry_run ve partial bayrakları"""
+    mod = request.values.get('mode', 'insert')
+    if mod not in OgrenciService.AKTARMA_MODLARI:
+        raise ValueError(f"Geçersiz içe aktarma modu: {mod}")
+    return {
+        'mod': mod,
+        'dry_run': request.values.get('dry_run', '').lower() in ('1', 'true', 'evet'),
+        'kismi': request.values.get('partial', '').lower() in ('1', 'true', 'evet')
+    }
+
 @main_bp.route('/api/excel/import', methods=['POST'])
 def excel_import():
-    """Excel'den öğrenci içe aktar"""
+    """Excel'den öğrenci içe aktar
+    
+    mode: insert (varsayılan) veya upsert. dry_run=1 seçilen modu kaydetmeden önizler.
+    Hatalı satır varsa hiçbir şey kaydedilmez; partial=1 geçerli satırları yine de kaydeder.
+    """
     try:
+        secenekler = _aktarma_secenekleri()
+        
         if 'file' not in request.files:
             return jsonify({'basarili': False, 'hata': 'Dosya bulunamadı'}), 400
         
@@ -287,42 +491,159 @@ def excel_import():
         if file.filename == '':
             return jsonify({'basarili': False, 'hata': 'Dosya seçilmedi'}), 400
         
-        if file and file.filename.endswith(('.xlsx', '.xls')):
-            filename = secure_filename(file.filename)
-            dosya_yolu = os.path.join('uploads', filename)
-            
-            # uploads klasörü yoksa oluştur
-            os.makedirs('uploads', exist_ok=True)
-            
-            file.save(dosya_yolu)
-            sonuc = ExcelService.ogrencileri_excel_ice_aktar(dosya_yolu)
-            
-            # Geçici dosyayı sil
-            os.remove(dosya_yolu)
-            
-            return jsonify(sonuc)
-        else:
+        if not file.filename.lower().endswith(ExcelService.ICE_AKTARMA_UZANTILARI):
             return jsonify({'basarili': False, 'hata': 'Geçersiz dosya formatı'}), 400
+        
+        # Dosya diske kaydedilmeden doğrudan yükleme akışından okunur
+        # (Werkzeug büyük yüklemeleri zaten benzersiz bir geçici dosyada tutar)
+        sonuc = ExcelService.ogrencileri_excel_ice_aktar(file.stream, **secenekler)
+        return jsonify(sonuc)
+    except ValueError as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 400
     except Exception as e:
         return jsonify({'basarili': False, 'hata': str(e)}), 500
 
+def _rapor_gonder(rapor_turu, dosya_adi):
+    """Raporu önbellek üzerinden oluşturup indirme olarak gönder"""
+    sinif_id = request.args.get('sinif_id', type=int)
+    veri, onbellekten = ExcelService.onbellekli_rapor(rapor_turu, sinif_id=sinif_id)
+    response = send_file(io.BytesIO(veri), as_attachment=True, download_name=dosya_adi, mimetype=EXCEL_MIMETYPE)
+    response.headers['X-Rapor-Cache'] = 'HIT' if onbellekten else 'MISS'
+    return response
+
 @main_bp.route('/api/excel/rapor', methods=['GET'])
 def excel_rapor():
     """Staj değerlendirme raporu oluştur (opsiyonel: sınıf filtresi)"""
     try:
-        sinif_id = request.args.get('sinif_id', type=int)
-        dosya_yolu = ExcelService.degerlendirme_raporu_olustur('staj_degerlendirme_raporu.xlsx', sinif_id=sinif_id)
-        return send_file(dosya_yolu, as_attachment=True, download_name='staj_degerlendirme_raporu.xlsx')
+        return _rapor_gonder('staj', 'staj_degerlendirme_raporu.xlsx')
     except Exception as e:
         return jsonify({'basarili': False, 'hata': str(e)}), 500
 
 @main_bp.route('/api/excel/rapor/normal-donem', methods=['GET'])
 def excel_rapor_normal_donem():
     """Normal dönem notları raporu oluştur (opsiyonel: sınıf filtresi)"""
+    try:
+        return _rapor_gonder('normal_donem', 'normal_donem_raporu.xlsx')
+    except Exception as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 500
+
+@main_bp.route('/api/excel/rapor/paket', methods=['GET'])
+def excel_rapor_paketi():
+    """Her sınıf için staj ve normal dönem raporlarını paralel oluşturup tek ZIP olarak akıt
+    
+    Opsiyonel: tur=staj / tur=normal_donem (birden fazla verilebilir)
+    """
+    try:
+        parcalar = RaporPaketiService.paket_parcalari(rapor_turleri=request.args.getlist('tur'))
+        return Response(
+            stream_with_context(parcalar),
+            mimetype='application/zip',
+            headers={'Content-Disposition': 'attachment; filename=sinif_raporlari.zip'}
+        )
+    except ValueError as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 400
+    except Exception as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 500
+
+@main_bp.route('/api/excel/rapor/cache', methods=['GET'])
+def excel_rapor_cache():
+    """Rapor önbelleğinin isabet/ıska sayaçlarını getir"""
+    return jsonify({
+        'basarili': True,
+        'cache': rapor_cache.istatistikler()
+    })
+
+# CSV / NDJSON dışa aktarma (akış halinde)
+@main_bp.route('/api/disa-aktar/<veri_seti>.<bicim>', methods=['GET'])
+def disa_aktar(veri_seti, bicim):
+    """Öğrenci listesi veya değerlendirme raporunu CSV/NDJSON olarak akıt (opsiyonel: sınıf filtresi)
+    
+    Yanıt parça parça (chunked) gönderilir; ilk bayt sorgu tamamlanmadan ulaşır.
+    """
     try:
         sinif_id = request.args.get('sinif_id', type=int)
-        dosya_yolu = ExcelService.normal_donem_raporu_olustur('normal_donem_raporu.xlsx', sinif_id=sinif_id)
-        return send_file(dosya_yolu, as_attachment=True, download_name='normal_donem_raporu.xlsx')
+        parcalar, mimetype, dosya_adi = DisaAktarmaService.akis_olustur(veri_seti, bicim, sinif_id=sinif_id)
+        return Response(
+            stream_with_context(parcalar),
+            mimetype=mimetype,
+            headers={'Content-Disposition': f'attachment; filename={dosya_adi}'}
+        )
+    except ValueError as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 400
+    except Exception as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 500
+
+# Arka plan işleri (uzun süren rapor ve içe aktarma işlemleri)
+@main_bp.route('/api/isler/rapor', methods=['POST'])
+def rapor_isi_baslat():
+    """Excel raporunu arka planda oluşturmak için iş başlat, iş bilgisini hemen döndür"""
+    try:
+        data = request.get_json(silent=True) or {}
+        rapor_turu = data.get('tur')
+        if rapor_turu not in ExcelService.RAPOR_ISLERI:
+            raise ValueError(f"Geçersiz rapor türü: {rapor_turu}")
+        
+        # Önbellek anahtarı senkron endpoint'lerle aynı olsun diye sınıf ID'si tam sayıya çevrilir
+        try:
+            sinif_id = int(data['sinif_id']) if data.get('sinif_id') else None
+        except (ValueError, TypeError):
+            raise ValueError(f"Geçersiz sınıf ID: {data.get('sinif_id')}")
+        
+        is_ = is_yoneticisi.olustur('rapor')
+        is_yoneticisi.baslat(
+            current_app._get_current_object(), is_, ExcelService.rapor_isi,
+            rapor_turu, sinif_id=sinif_id
+        )
+        return jsonify({'basarili': True, 'is': is_.to_dict()}), 202
+    except ValueError as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 400
+    except Exception as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 500
+
+@main_bp.route('/api/isler/ice-aktar', methods=['POST'])
+def ice_aktarma_isi_baslat():
+    """Excel'den öğrenci içe aktarmayı arka planda başlat, iş bilgisini hemen döndür
+    
+    Seçenekler /api/excel/import ile aynıdır (mode, dry_run, partial).
+    """
+    try:
+        secenekler = _aktarma_secenekleri()
+        
+        if 'file' not in request.files:
+            return jsonify({'basarili': False, 'hata': 'Dosya bulunamadı'}), 400
+        
+        file = request.files['file']
+        if not file.filename.lower().endswith(ExcelService.ICE_AKTARMA_UZANTILARI):
+            return jsonify({'basarili': False, 'hata': 'Geçersiz dosya formatı'}), 400
+        
+        is_ = is_yoneticisi.olustur('ice_aktarma', yazar=not secenekler['dry_run'])
+        dosya_yolu = is_yoneticisi.dosya_yolu(is_, os.path.splitext(file.filename)[1])
+        file.save(dosya_yolu)
+        is_yoneticisi.baslat(current_app._get_current_object(), is_, ExcelService.ice_aktarma_isi, dosya_yolu, **secenekler)
+        return jsonify({'basarili': True, 'is': is_.to_dict()}), 202
+    except ValueError as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 400
+    except Exception as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 500
+
+@main_bp.route('/api/isler/<is_id>', methods=['GET'])
+def is_durumu(is_id):
+    """İşin durumunu ve ilerlemesini getir"""
+    is_ = is_yoneticisi.getir(is_id)
+    if not is_:
+        return jsonify({'basarili': False, 'hata': 'İş bulunamadı'}), 404
+    return jsonify({'basarili': True, 'is': is_.to_dict()})
+
+@main_bp.route('/api/isler/<is_id>/indir', methods=['GET'])
+def is_sonucu_indir(is_id):
+    """Tamamlanan işin sonuç dosyasını indir"""
+    try:
+        is_ = is_yoneticisi.getir(is_id)
+        if not is_:
+            return jsonify({'basarili': False, 'hata': 'İş bulunamadı'}), 404
+        if not is_.indirilebilir:
+            return jsonify({'basarili': False, 'hata': 'İşin indirilecek bir sonucu yok'}), 409
+        return send_file(is_.dosya_yolu, as_attachment=True, download_name=is_.dosya_adi)
     except Exception as e:
         return jsonify({'basarili': False, 'hata': str(e)}), 500
 
@@ -333,31 +654,50 @@ def ogrenci_detay_sayfa(ogrenci_id):
     return render_template('ogrenci_detay.html', ogrenci_id=ogrenci_id)
 
 # İstatistik API'leri
-@main_bp.route('/api/istatistikler/harf-notlari', methods=['GET'])
-def harf_notu_istatistikleri():
-    """Harf notu dağılımını getir (opsiyonel: sınıf filtresi)"""
+@main_bp.route('/api/istatistikler/ozet', methods=['GET'])
+def istatistik_ozeti():
+    """Öğrenci, değerlendirme ve ziyaret toplamlarını getir (opsiyonel: sınıf filtresi)"""
     try:
-        from models import StajDegerlendirme, Ogrenci
-        
         sinif_id = request.args.get('sinif_id', type=int)
-        
-        # Sınıf filtresi varsa uygula
-        if sinif_id:
-            ogrenci_ids = [o.id for o in Ogrenci.query.filter_by(sinif_id=sinif_id).all()]
-            degerlendirmeler = StajDegerlendirme.query.filter(StajDegerlendirme.ogrenci_id.in_(ogrenci_ids)).all()
-        else:
-            degerlendirmeler = StajDegerlendirme.query.all()
-        
-        # Harf notlarını say
-        harf_notu_sayilari = {}
-        for deg in degerlendirmeler:
-            if deg.harf_notu:
-                harf_notu_sayilari[deg.harf_notu] = harf_notu_sayilari.get(deg.harf_notu, 0) + 1
-        
+        ozet = IstatistikService.ozet_getir(sinif_id=sinif_id)
+        return jsonify({
+            'basarili': True,
+            'ozet': ozet
+        })
+    except Exception as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 500
+
+@main_bp.route('/api/istatistikler/analiz', methods=['GET'])
+def not_analizi():
+    """Kriter ortalamaları, puan histogramları ve geçme oranları (opsiyonel: sınıf filtresi)"""
+    try:
+        sinif_id = request.args.get('sinif_id', type=int)
+        analiz = AnalizService.not_analizi(sinif_id=sinif_id)
         return jsonify({
             'basarili': True,
-            'harf_notlari': harf_notu_sayilari
+            'analiz': analiz
         })
     except Exception as e:
         return jsonify({'basarili': False, 'hata': str(e)}), 500
 
+@main_bp.route('/api/istatistikler/harf-notlari', methods=['GET'])
+def harf_notu_istatistikleri():
+    """Harf notu dağılımını getir
+    
+    Opsiyonel parametreler: sinif_id (sınıf filtresi), tur (staj | normal_donem),
+    sinif_bazinda (1 ise sınıf bazında dağılım da döner)
+    """
+    try:
+        dagilim = IstatistikService.harf_notu_dagilimi(
+            tur=request.args.get('tur', 'staj'),
+            sinif_id=request.args.get('sinif_id', type=int),
+            sinif_bazinda=request.args.get('sinif_bazinda', '').lower() in ('1', 'true', 'evet')
+        )
+        return jsonify({
+            'basarili': True,
+            **dagilim
+        })
+    except ValueError as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 400
+    except Exception as e:
+        return jsonify({'basarili': False, 'hata': str(e)}), 500
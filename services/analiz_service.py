@@ -0,0 +1,126 @@
+import warnings
+import numpy as np
+import pandas as pd
+from database import db
+from models import Ogrenci, StajDegerlendirme, NormalDonemDegerlendirme
+
+class AnalizService:
+    """Not analizi servisi
+    
+    Puan sütunları ORM nesnesi oluşturulmadan tek sorguda sütun dizileri olarak
+    çekilir; tüm hesaplamalar pandas/NumPy üzerinde vektörel yapılır.
+    """
+    
+    STAJ_KRITERLERI = [
+        'isyeren_notu', 'icindekiler', 'firma_bilgisi', 'yazim_duzeni', 'resim_sekil',
+        'dil_kullanimi', 'sonuc_bolumu', 'defter_duzeni_mulakat', 'toplam'
+    ]
+    
+    NORMAL_DONEM_KRITERLERI = [
+        'vize_notu', 'vize_toplam', 'final_notu', 'final_toplam',
+        'butunleme_notu', 'butunleme_toplam', 'genel_toplam'
+    ]
+    
+    # Bu harf notlarını alan öğrenciler dersten kalmış sayılır
+    KALAN_HARF_NOTLARI = ('FD', 'FF')
+    
+    # Histogram aralıklarının puan genişliği
+    HISTOGRAM_ARALIK_GENISLIGI = 10
+    
+    # Toplam puanların üst sınırı (histogram aralığı); staj kriterlerinin maksimumları
+    # 30+10+10+10+10+20+10+30 = 130 eder
+    STAJ_MAKSIMUM_TOPLAM = 130
+    NORMAL_DONEM_MAKSIMUM_TOPLAM = 100
+    
+    @staticmethod
+    def _sutunlari_getir(model, kriterler, sinif_id=None):
+        """Değerlendirme puanlarını sınıf bilgisiyle birlikte DataFrame olarak getir
+        
+        Harf notu hesaplanmamış (hiç not girilmemiş) kayıtlar analize katılmaz.
+        """
+        kolonlar = [Ogrenci.sinif_id, model.harf_notu] + [getattr(model, k) for k in kriterler]
+        sorgu = db.session.query(*kolonlar) \
+            .join(Ogrenci, model.ogrenci_id == Ogrenci.id) \
+            .filter(model.harf_notu.isnot(None))
+        if sinif_id:
+            sorgu = sorgu.filter(Ogrenci.sinif_id == sinif_id)
+        
+        df = pd.DataFrame.from_records(sorgu.all(), columns=['sinif_id', 'harf_notu'] + kriterler)
+        df[kriterler] = df[kriterler].astype(float)
+        return df
+    
+    @staticmethod
+    def _sayi(deger):
+        """NumPy sayısını JSON'a uygun hale getir (NaN -> None)"""
+        if deger is None or pd.isna(deger):
+            return None
+        return round(float(deger), 2)
+    
+    @staticmethod
+    def _analiz_et(df, kriterler, toplam_kolonu, maksimum_toplam):
+        """Kriter istatistiklerini, toplam histogramını ve sınıf geçme oranlarını hesapla
+        
+        Histogram 0..maksimum_toplam aralığında 10 puanlık aralıklardan oluşur (son aralık
+        üst sınırı da içerir); aralık dışındaki toplamlar ilk ya da son aralığa sayılır,
+        böylece aralık sayılarının toplamı öğrenci sayısına eşittir.
+        """
+        with warnings.catch_warnings():
+            # Hiç değeri olmayan sütunlar (ör. bütünleme) için NaN beklenen sonuçtur
+            warnings.simplefilter('ignore', RuntimeWarning)
+            ozet = df[kriterler].agg(['mean', 'median', 'std'])
+        kriter_istatistikleri = {
+            kriter: {
+                'ortalama': AnalizService._sayi(ozet.at['mean', kriter]),
+                'medyan': AnalizService._sayi(ozet.at['median', kriter]),
+                'standart_sapma': AnalizService._sayi(ozet.at['std', kriter])
+            }
+            for kriter in kriterler
+        }
+        
+        toplamlar = np.clip(df[toplam_kolonu].fillna(0).to_numpy(), 0, maksimum_toplam)
+        genislik = AnalizService.HISTOGRAM_ARALIK_GENISLIGI
+        sayilar, sinirlar = np.histogram(toplamlar, bins=np.arange(0, maksimum_toplam + genislik, genislik))
+        histogram = [
+            {'alt': float(sinirlar[i]), 'ust': float(sinirlar[i + 1]), 'sayi': int(sayilar[i])}
+            for i in range(len(sayilar))
+        ]
+        
+        gecen = ~df['harf_notu'].isin(AnalizService.KALAN_HARF_NOTLARI)
+        gruplar = gecen.groupby(df['sinif_id'].fillna(0).astype(int)).agg(['size', 'sum'])
+        gecme_oranlari = [
+            {
+                'sinif_id': int(sinif_id) or None,
+                'ogrenci_sayisi': int(satir['size']),
+                'gecen': int(satir['sum']),
+                'oran': round(satir['sum'] / satir['size'] * 100, 2)
+            }
+            for sinif_id, satir in gruplar.iterrows()
+        ]
+        
+        return {
+            'ogrenci_sayisi': int(len(df)),
+            'kriterler': kriter_istatistikleri,
+            'histogram': histogram,
+            'gecme_oranlari': gecme_oranlari,
+            'genel_gecme_orani': round(float(gecen.mean()) * 100, 2) if len(df) else None
+        }
+    
+    @staticmethod
+    def not_analizi(sinif_id=None):
+        """Staj ve normal dönem notlarının analizini getir (opsiyonel: sınıf filtresi)"""
+        staj = AnalizService._sutunlari_getir(
+            StajDegerlendirme, AnalizService.STAJ_KRITERLERI, sinif_id=sinif_id
+        )
+        normal_donem = AnalizService._sutunlari_getir(
+            NormalDonemDegerlendirme, AnalizService.NORMAL_DONEM_KRITERLERI, sinif_id=sinif_id
+        )
+        
+        return {
+            'staj': AnalizService._analiz_et(
+                staj, AnalizService.STAJ_KRITERLERI, 'toplam', AnalizService.STAJ_MAKSIMUM_TOPLAM
+            ),
+            'normal_donem': AnalizService._analiz_et(
+                normal_donem, AnalizService.NORMAL_DONEM_KRITERLERI, 'genel_toplam',
+                AnalizService.NORMAL_DONEM_MAKSIMUM_TOPLAM
+            )
+        }
@@ -0,0 +1,92 @@
+import csv
+import io
+import json
+from services.excel_service import ExcelService
+
+class DisaAktarmaService:
+    """CSV ve NDJSON dışa aktarma servisi
+    
+    Satırlar Excel raporlarıyla aynı üreticilerden (ExcelService.*_satirlari)
+    veritabanından partiler halinde okunur ve parça parça metne çevrilir;
+    dosyanın tamamı hiçbir zaman bellekte tutulmaz.
+    """
+    
+    # Her parça bu kadar satır içerir (veritabanı parti boyutuyla aynı)
+    PARCA_BOYUTU = ExcelService.PARTI_BOYUTU
+    
+    # biçim: (mimetype, dosya uzantısı)
+    BICIMLER = {
+        'csv': ('text/csv; charset=utf-8', 'csv'),
+        'ndjson': ('application/x-ndjson; charset=utf-8', 'ndjson')
+    }
+    
+    # veri seti: (sütun başlıkları, satır üreticisi, indirme adı)
+    VERI_SETLERI = {
+        'ogrenciler': (
+            ExcelService.OGRENCI_LISTESI_BASLIKLARI, ExcelService.ogrenci_listesi_satirlari, 'ogrenci_listesi'
+        ),
+        'staj': (
+            ExcelService.STAJ_RAPORU_BASLIKLARI, ExcelService.staj_raporu_satirlari, 'staj_degerlendirme_raporu'
+        ),
+        'normal_donem': (
+            ExcelService.NORMAL_DONEM_BASLIKLARI, ExcelService.normal_donem_satirlari, 'normal_donem_raporu'
+        )
+    }
+    
+    @staticmethod
+    def _parcalara_bol(satirlar, parca_boyutu):
+        parca = []
+        for satir in satirlar:
+            parca.append(satir)
+            if len(parca) >= parca_boyutu:
+                yield parca
+                parca = []
+        if parca:
+            yield parca
+    
+    @staticmethod
+    def csv_parcalari(basliklar, satirlar, parca_boyutu=None):
+        """Başlık satırını hemen, ardından satırları parçalar halinde CSV metni olarak üret"""
+        tampon = io.StringIO()
+        yazici = csv.writer(tampon, lineterminator='\n')
+        
+        yazici.writerow(basliklar)
+        yield tampon.getvalue()
+        
+        for parca in DisaAktarmaService._parcalara_bol(satirlar, parca_boyutu or DisaAktarmaService.PARCA_BOYUTU):
+            tampon.seek(0)
+            tampon.truncate()
+            yazici.writerows(parca)
+            yield tampon.getvalue()
+    
+    @staticmethod
+    def ndjson_parcalari(basliklar, satirlar, parca_boyutu=None):
+        """Her satırı başlıkları anahtar alan bir JSON nesnesi olarak (satır başına bir nesne) üret"""
+        for parca in DisaAktarmaService._parcalara_bol(satirlar, parca_boyutu or DisaAktarmaService.PARCA_BOYUTU):
+            yield ''.join(
+                json.dumps(dict(zip(basliklar, satir)), ensure_ascii=False) + '\n'
+                for satir in parca
+            )
+    
+    @staticmethod
+    def akis_olustur(veri_seti, bicim, sinif_id=None):
+        """Dışa aktarma akışını hazırla
+        
+        Dönüş: (metin parçası üreticisi, mimetype, indirme adı)
+        Sorgu, üretici ilk kez okunduğunda çalışır.
+        """
+        if veri_seti not in DisaAktarmaService.VERI_SETLERI:
+            raise ValueError(f"Geçersiz veri seti: {veri_seti}")
+        if bicim not in DisaAktarmaService.BICIMLER:
+            raise ValueError(f"Geçersiz biçim: {bicim}")
+        
+        basliklar, satir_ureticisi, dosya_adi = DisaAktarmaService.VERI_SETLERI[veri_seti]
+        mimetype, uzanti = DisaAktarmaService.BICIMLER[bicim]
+        
+        satirlar = satir_ureticisi(sinif_id=sinif_id)
+        if bicim == 'csv':
+            parcalar = DisaAktarmaService.csv_parcalari(basliklar, satirlar)
+        else:
+            parcalar = DisaAktarmaService.ndjson_parcalari(basliklar, satirlar)
+        
+        return parcalar, mimetype, f"{dosya_adi}.{uzanti}"
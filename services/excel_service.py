@@ -1,40 +1,147 @@
-import pandas as pd
-from openpyxl import Workbook
+import os
+import tempfile
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment, PatternFill
-from models import Ogrenci, ZiyaretNotu, StajDegerlendirme
-from services.staj_service import OgrenciService
+from openpyxl.utils import get_column_letter
+from models import Ogrenci, StajDegerlendirme, NormalDonemDegerlendirme
+from services.staj_service import OgrenciService, SinifService, SurumService
+from services.rapor_cache import rapor_cache
+from services.is_yoneticisi import is_yoneticisi
 
 class ExcelService:
     """Excel import/export işlemleri servisi"""
     
+    # Dışa aktarmalar veritabanından bu büyüklükte partiler halinde okunur
+    PARTI_BOYUTU = 500
+    
+    # Bellekteki tampon bu boyutu aşarsa sistemin geçici dizinine taşınır
+    TAMPON_BOYUTU = 8 * 1024 * 1024
+    
+    OGRENCI_LISTESI_BASLIKLARI = [
+        'ID', 'Sınıf', 'Ad', 'Soyad', 'Öğrenci No', 'Telefon', 'Kayıt Tarihi',
+        'Toplam Ziyaret', 'Staj Notu', 'Harf Notu'
+    ]
+    
+    STAJ_RAPORU_BASLIKLARI = [
+        'Sınıf', 'Öğrenci No', 'Ad Soyad',
+        'İşyeren Notu (30p)', 'İçindekiler (10p)', 'Firma Bilgisi (10p)',
+        'Yazım Düzeni (10p)', 'Resim/Şekil (10p)', 'Dil Kullanımı (20p)',
+        'Sonuç Bölümü (10p)', 'Defter Düzeni/Mülakat (30p)',
+        'TOPLAM', 'HARF NOTU'
+    ]
+    
+    NORMAL_DONEM_BASLIKLARI = [
+        'Sınıf', 'Öğrenci No', 'Ad Soyad',
+        'Vize Notu', 'Vize Ödev', 'Vize Ödev %', 'Vize Toplam',
+        'Final Notu', 'Final Ödev', 'Final Ödev %', 'Final Toplam',
+        'Devamsızlık Durumu',
+        'Bütünleme Notu', 'Büt Ödev', 'Büt Ödev %', 'Bütünleme Toplam',
+        'Genel Toplam', 'Harf Notu'
+    ]
+    
+    # Önbelleğe alınan raporlar: (oluşturan metot, raporun bağlı olduğu tablolar)
+    ONBELLEKLI_RAPORLAR = {
+        'ogrenci_listesi': (
+            'ogrencileri_excel_aktar', ('siniflar', 'ogrenciler', 'ziyaret_notlari', 'staj_degerlendirme')
+        ),
+        'staj': ('degerlendirme_raporu_olustur', ('siniflar', 'ogrenciler', 'staj_degerlendirme')),
+        'normal_donem': ('normal_donem_raporu_olustur', ('siniflar', 'ogrenciler', 'normal_donem_degerlendirme'))
+    }
+    
+    # Arka plan işi olarak oluşturulabilen raporlar (oluşturan metot ONBELLEKLI_RAPORLAR'dadır):
+    # (satırı olan öğrencilerin değerlendirme modeli, indirme adı)
+    RAPOR_ISLERI = {
+        'ogrenci_listesi': (None, 'ogrenci_listesi.xlsx'),
+        'staj': (StajDegerlendirme, 'staj_degerlendirme_raporu.xlsx'),
+        'normal_donem': (NormalDonemDegerlendirme, 'normal_donem_raporu.xlsx')
+    }
+    
     @staticmethod
-    def ogrencileri_excel_aktar(dosya_yolu='ogrenci_listesi.xlsx', sinif_id=None):
-        """Öğrencileri Excel'e aktar (opsiyonel: sınıf filtresi)"""
-        ogrenciler = OgrenciService.tum_ogrencileri_getir(sinif_id=sinif_id)
+    def bellekte_olustur(rapor_fonksiyonu, **kwargs):
+        """Raporu diske (çalışma dizinine) yazmadan bir tampon dosyaya oluştur
+        
+        Dönen tampon başa sarılmıştır ve doğrudan send_file'a verilebilir.
+        """
+        tampon = tempfile.SpooledTemporaryFile(max_size=ExcelService.TAMPON_BOYUTU)
+        rapor_fonksiyonu(tampon, **kwargs)
+        tampon.seek(0)
+        return tampon
+    
+    @staticmethod
+    def onbellekli_rapor(rapor_turu, sinif_id=None, ilerleme=None):
+        """Raporu (rapor türü, sınıf, veri sürümü) anahtarıyla önbellekten getir
+        
+        Önbellekte yoksa rapor oluşturulup önbelleğe konur (ilerleme oluşturucuya iletilir).
+        Dönüş: (rapor_baytlari, onbellekten_mi)
+        """
+        if rapor_turu not in ExcelService.ONBELLEKLI_RAPORLAR:
+            raise ValueError(f"Geçersiz rapor türü: {rapor_turu}")
+        
+        fonksiyon_adi, tablolar = ExcelService.ONBELLEKLI_RAPORLAR[rapor_turu]
+        anahtar = (rapor_turu, sinif_id, SurumService.getir(*tablolar))
+        
+        veri = rapor_cache.getir(anahtar)
+        if veri is not None:
+            return veri, True
+        
+        tampon = ExcelService.bellekte_olustur(
+            getattr(ExcelService, fonksiyon_adi), sinif_id=sinif_id, ilerleme=ilerleme
+        )
+        with tampon:
+            veri = tampon.read()
+        rapor_cache.kaydet(anahtar, veri)
+        return veri, False
+    
+    @staticmethod
+    def _calisma_kitabi_yaz(dosya_yolu, sayfa_adi, basliklar, satirlar, baslik_rengi,
+                            baslik_font_boyutu=None, sutun_genislikleri=None, ilerleme=None):
+        """Satırları write-only çalışma kitabına akıtarak yaz
         
-        # Workbook oluştur
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Öğrenci Listesi"
+        dosya_yolu bir dosya yolu ya da yazılabilir dosya nesnesi olabilir.
+        ilerleme verilirse her partide yazılan satır sayısıyla çağrılır.
+        """
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(sayfa_adi)
         
-        # Başlık satırı
-        headers = ['ID', 'Sınıf', 'Ad', 'Soyad', 'Öğrenci No', 'Telefon', 'Kayıt Tarihi', 
-                   'Toplam Ziyaret', 'Staj Notu', 'Harf Notu']
-        ws.append(headers)
+        # Sütun genişlikleri satırlar yazılmadan önce ayarlanmalı
+        for index, genislik in enumerate(sutun_genislikleri or [], start=1):
+            ws.column_dimensions[get_column_letter(index)].width = genislik
         
-        # Başlık stilini ayarla
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF")
+        # Başlık stili
+        header_fill = PatternFill(start_color=baslik_rengi, end_color=baslik_rengi, fill_type="solid")
+        header_font = Font(bold=True, color="FFFFFF", size=baslik_font_boyutu)
+        header_alignment = Alignment(horizontal='center', vertical='center')
         
-        for cell in ws[1]:
+        baslik_hucreleri = []
+        for baslik in basliklar:
+            cell = WriteOnlyCell(ws, value=baslik)
             cell.fill = header_fill
             cell.font = header_font
-            cell.alignment = Alignment(horizontal='center', vertical='center')
+            cell.alignment = header_alignment
+            baslik_hucreleri.append(cell)
+        ws.append(baslik_hucreleri)
         
-        # Öğrenci verilerini ekle
-        for ogrenci in ogrenciler:
-            ziyaret_sayisi = len(ogrenci.ziyaret_notlari)
-            
+        yazilan = 0
+        for satir in satirlar:
+            ws.append(satir)
+            yazilan += 1
+            if ilerleme and yazilan % ExcelService.PARTI_BOYUTU == 0:
+                ilerleme(yazilan)
+        if ilerleme:
+            ilerleme(yazilan)
+        
+        wb.save(dosya_yolu)
+        return dosya_yolu
+    
+    @staticmethod
+    def ogrenci_listesi_satirlari(sinif_id=None):
+        """Öğrenci listesi satırlarını partiler halinde üret"""
+        ogrenciler = OgrenciService.ziyaret_sayilariyla_getir(
+            sinif_id=sinif_id, profil='export', parti_boyutu=ExcelService.PARTI_BOYUTU
+        )
+        
+        for ogrenci, ziyaret_sayisi in ogrenciler:
             if ogrenci.staj_degerlendirme:
                 toplam = ogrenci.staj_degerlendirme.toplam
                 harf = ogrenci.staj_degerlendirme.harf_notu
@@ -42,7 +149,7 @@ class ExcelService:
                 toplam = '-'
                 harf = '-'
             
-            ws.append([
+            yield [
                 ogrenci.id,
                 ogrenci.sinif.ad if ogrenci.sinif else '-',
                 ogrenci.ad,
@@ -53,98 +160,20 @@ class ExcelService:
                 ziyaret_sayisi,
                 toplam,
                 harf
-            ])
-        
-        # Sütun genişliklerini ayarla
-        ws.column_dimensions['A'].width = 8
-        ws.column_dimensions['B'].width = 15
-        ws.column_dimensions['C'].width = 15
-        ws.column_dimensions['D'].width = 15
-        ws.column_dimensions['E'].width = 15
-        ws.column_dimensions['F'].width = 15
-        ws.column_dimensions['G'].width = 15
-        ws.column_dimensions['H'].width = 15
-        ws.column_dimensions['I'].width = 12
-        ws.column_dimensions['J'].width = 12
-        
-        # Kaydet
-        wb.save(dosya_yolu)
-        return dosya_yolu
+            ]
     
     @staticmethod
-    def ogrencileri_excel_ice_aktar(dosya_yolu):
-        """Excel'den öğrenci listesi içe aktar"""
-        try:
-            df = pd.read_excel(dosya_yolu)
-            
-            eklenen = 0
-            hatalar = []
-            
-            for index, row in df.iterrows():
-                try:
-                    ad = str(row.get('Ad', row.get('ad', ''))).strip()
-                    soyad = str(row.get('Soyad', row.get('soyad', ''))).strip()
-                    ogrenci_no = str(row.get('Öğrenci No', row.get('ogrenci_no', ''))).strip()
-                    telefon = str(row.get('Telefon', row.get('telefon', ''))) if pd.notna(row.get('Telefon', row.get('telefon', ''))) else None
-                    
-                    if not ad or not soyad or not ogrenci_no:
-                        hatalar.append(f"Satır {index + 2}: Eksik bilgi")
-                        continue
-                    
-                    OgrenciService.ogrenci_ekle(ad, soyad, ogrenci_no, telefon)
-                    eklenen += 1
-                    
-                except ValueError as e:
-                    hatalar.append(f"Satır {index + 2}: {str(e)}")
-                except Exception as e:
-                    hatalar.append(f"Satır {index + 2}: Beklenmeyen hata - {str(e)}")
-            
-            return {
-                'basarili': True,
-                'eklenen': eklenen,
-                'hatalar': hatalar
-            }
-            
-        except Exception as e:
-            return {
-                'basarili': False,
-                'hata': str(e)
-            }
-    
-    @staticmethod
-    def degerlendirme_raporu_olustur(dosya_yolu='degerlendirme_raporu.xlsx', sinif_id=None):
-        """Detaylı değerlendirme raporu oluştur (opsiyonel: sınıf filtresi)"""
-        ogrenciler = OgrenciService.tum_ogrencileri_getir(sinif_id=sinif_id)
-        
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Staj Değerlendirme"
-        
-        # Başlık satırı
-        headers = [
-            'Sınıf', 'Öğrenci No', 'Ad Soyad', 
-            'İşyeren Notu (30p)', 'İçindekiler (10p)', 'Firma Bilgisi (10p)',
-            'Yazım Düzeni (10p)', 'Resim/Şekil (10p)', 'Dil Kullanımı (20p)',
-            'Sonuç Bölümü (10p)', 'Defter Düzeni/Mülakat (30p)',
-            'TOPLAM', 'HARF NOTU'
-        ]
-        ws.append(headers)
-        
-        # Başlık stili
-        header_fill = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=11)
+    def staj_raporu_satirlari(sinif_id=None):
+        """Staj değerlendirme raporu satırlarını partiler halinde üret"""
+        ogrenciler = OgrenciService.tum_ogrencileri_getir(
+            sinif_id=sinif_id, profil='staj_raporu', parti_boyutu=ExcelService.PARTI_BOYUTU
+        )
         
-        for cell in ws[1]:
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-        
-        # Öğrenci verilerini ekle
         for ogrenci in ogrenciler:
             deg = ogrenci.staj_degerlendirme
             
             if deg:
-                ws.append([
+                yield [
                     ogrenci.sinif.ad if ogrenci.sinif else '-',
                     ogrenci.ogrenci_no,
                     f"{ogrenci.ad} {ogrenci.soyad}",
@@ -158,54 +187,22 @@ class ExcelService:
                     deg.defter_duzeni_mulakat,
                     deg.toplam,
                     deg.harf_notu
-                ])
-        
-        # Sütun genişliklerini ayarla
-        for col in ws.columns:
-            ws.column_dimensions[col[0].column_letter].width = 18
-        
-        wb.save(dosya_yolu)
-        return dosya_yolu
+                ]
     
     @staticmethod
-    def normal_donem_raporu_olustur(dosya_yolu='normal_donem_raporu.xlsx', sinif_id=None):
-        """Normal dönem notları raporu oluştur (opsiyonel: sınıf filtresi)"""
-        from models import NormalDonemDegerlendirme
-        
-        ogrenciler = OgrenciService.tum_ogrencileri_getir(sinif_id=sinif_id)
-        
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Normal Dönem Notları"
-        
-        # Başlık satırı
-        headers = [
-            'Sınıf', 'Öğrenci No', 'Ad Soyad',
-            'Vize Notu', 'Vize Ödev', 'Vize Ödev %', 'Vize Toplam',
-            'Final Notu', 'Final Ödev', 'Final Ödev %', 'Final Toplam',
-            'Devamsızlık Durumu',
-            'Bütünleme Notu', 'Büt Ödev', 'Büt Ödev %', 'Bütünleme Toplam',
-            'Genel Toplam', 'Harf Notu'
-        ]
-        ws.append(headers)
+    def normal_donem_satirlari(sinif_id=None):
+        """Normal dönem raporu satırlarını partiler halinde üret"""
+        ogrenciler = OgrenciService.tum_ogrencileri_getir(
+            sinif_id=sinif_id, profil='normal_donem_raporu', parti_boyutu=ExcelService.PARTI_BOYUTU
+        )
         
-        # Başlık stili
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=11)
-        
-        for cell in ws[1]:
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-        
-        # Öğrenci verilerini ekle
         for ogrenci in ogrenciler:
             deg = ogrenci.normal_donem_degerlendirme
             
             if deg:
                 devamsizlik_durumu = "Geçti" if deg.devamsizlik_durumu else "Kaldı"
                 
-                ws.append([
+                yield [
                     ogrenci.sinif.ad if ogrenci.sinif else '-',
                     ogrenci.ogrenci_no,
                     f"{ogrenci.ad} {ogrenci.soyad}",
@@ -224,32 +221,264 @@ class ExcelService:
                     round(deg.butunleme_toplam, 2) if deg.butunleme_toplam is not None else '-',
                     round(deg.genel_toplam, 2) if deg.genel_toplam else 0,
                     deg.harf_notu if deg.harf_notu else '-'
-                ])
-        
-        # Sütun genişliklerini ayarla
-        column_widths = {
-            'A': 15,  # Sınıf
-            'B': 15,  # Öğrenci No
-            'C': 20,  # Ad Soyad
-            'D': 12,  # Vize Notu
-            'E': 12,  # Vize Ödev
-            'F': 12,  # Vize Ödev %
-            'G': 12,  # Vize Toplam
-            'H': 12,  # Final Notu
-            'I': 12,  # Final Ödev
-            'J': 12,  # Final Ödev %
-            'K': 12,  # Final Toplam
-            'L': 18,  # Devamsızlık
-            'M': 15,  # Bütünleme Notu
-            'N': 12,  # Büt Ödev
-            'O': 12,  # Büt Ödev %
-            'P': 15,  # Bütünleme Toplam
-            'Q': 15,  # Genel Toplam
-            'R': 12   # Harf Notu
+                ]
+    
+    @staticmethod
+    def ogrencileri_excel_aktar(dosya_yolu='ogrenci_listesi.xlsx', sinif_id=None, ilerleme=None):
+        """Öğrencileri Excel'e aktar (opsiyonel: sınıf filtresi)"""
+        return ExcelService._calisma_kitabi_yaz(
+            dosya_yolu,
+            sayfa_adi="Öğrenci Listesi",
+            basliklar=ExcelService.OGRENCI_LISTESI_BASLIKLARI,
+            satirlar=ExcelService.ogrenci_listesi_satirlari(sinif_id=sinif_id),
+            baslik_rengi="4472C4",
+            sutun_genislikleri=[8, 15, 15, 15, 15, 15, 15, 15, 12, 12],
+            ilerleme=ilerleme
+        )
+    
+    # İçe aktarmada kabul edilen sütun adları (ilk bulunan kullanılır)
+    ICE_AKTARMA_SUTUNLARI = {
+        'ad': ('Ad', 'ad'),
+        'soyad': ('Soyad', 'soyad'),
+        'ogrenci_no': ('Öğrenci No', 'ogrenci_no'),
+        'telefon': ('Telefon', 'telefon'),
+        'sinif': ('Sınıf', 'sinif')
+    }
+    ZORUNLU_SUTUNLAR = ('ad', 'soyad', 'ogrenci_no')
+    
+    # Dışa aktarılan listelerde boş alanlar '-' olarak yazılır; içe aktarmada boş sayılır
+    BOS_DEGERLER = ('', '-')
+    
+    # openpyxl'in okuyabildiği biçimler (.xls desteklenmez)
+    ICE_AKTARMA_UZANTILARI = ('.xlsx', '.xlsm')
+    
+    @staticmethod
+    def _hucre_metni(deger):
+        """Hücre değerini metne çevir (tam sayı değerli ondalıklar '.0' olmadan)"""
+        if deger is None:
+            return ''
+        if isinstance(deger, float) and deger.is_integer():
+            deger = int(deger)
+        return str(deger).strip()
+    
+    @staticmethod
+    def _ice_aktarma_sutunlari(baslik):
+        """Başlık satırındaki sütun adlarını alan -> sütun indeksi olarak bir kez eşle
+        
+        Zorunlu sütunlardan biri yoksa hiçbir satır okunmadan ValueError fırlatılır.
+        """
+        adlar = [ExcelService._hucre_metni(hucre) for hucre in baslik or ()]
+        indeksler = {
+            alan: next((adlar.index(ad) for ad in sutun_adlari if ad in adlar), None)
+            for alan, sutun_adlari in ExcelService.ICE_AKTARMA_SUTUNLARI.items()
         }
-        for col, width in column_widths.items():
-            ws.column_dimensions[col].width = width
         
-        wb.save(dosya_yolu)
-        return dosya_yolu
-
+        eksikler = [
+            ExcelService.ICE_AKTARMA_SUTUNLARI[alan][0]
+            for alan in ExcelService.ZORUNLU_SUTUNLAR if indeksler[alan] is None
+        ]
+        if eksikler:
+            raise ValueError(f"Eksik sütun(lar): {', '.join(eksikler)}")
+        return indeksler
+    
+    @staticmethod
+    def _ice_aktarma_satirlari(satirlar, indeksler, sinif_idleri, hatalar):
+        """Veri satırlarını OgrenciService.toplu_ogrenci_aktar'ın beklediği sözlükler olarak üret
+        
+        satirlar: başlıktan sonraki hücre değeri demetleri (iter_rows(values_only=True))
+        sinif_idleri: sınıf adı -> id. Eksik bilgili veya bilinmeyen sınıflı satırlar
+        (satir, mesaj) olarak hatalar listesine eklenir, tamamen boş satırlar atlanır.
+        """
+        for satir_no, hucreler in enumerate(satirlar, start=2):
+            degerler = {
+                alan: ExcelService._hucre_metni(hucreler[indeks]) if indeks is not None and indeks < len(hucreler) else ''
+                for alan, indeks in indeksler.items()
+            }
+            if not any(degerler.values()):
+                continue
+            if not all(degerler[alan] for alan in ExcelService.ZORUNLU_SUTUNLAR):
+                hatalar.append((satir_no, "Eksik bilgi"))
+                continue
+            
+            sinif = degerler.pop('sinif')
+            if sinif in ExcelService.BOS_DEGERLER:
+                degerler['sinif_id'] = None
+            elif sinif in sinif_idleri:
+                degerler['sinif_id'] = sinif_idleri[sinif]
+            else:
+                hatalar.append((satir_no, f"Sınıf bulunamadı: {sinif}"))
+                continue
+            
+            if degerler['telefon'] in ExcelService.BOS_DEGERLER:
+                degerler['telefon'] = None
+            degerler['satir'] = satir_no
+            yield degerler
+    
+    @staticmethod
+    def ogrencileri_excel_ice_aktar(dosya, mod='insert', dry_run=False, kismi=False, ilerleme=None):
+        """Excel'den öğrenci listesi içe aktar
+        
+        dosya bir dosya yolu ya da okunabilir dosya nesnesi (ör. yüklenen dosyanın
+        akışı) olabilir. Satırlar openpyxl read-only modunda tek tek okunur ve
+        OgrenciService.toplu_ogrenci_aktar'a sabit boyutlu partiler halinde verilir;
+        bellek kullanımı dosya boyutundan bağımsızdır. Tüm işlem tek transaction'dır.
+        
+        mod: insert (yalnızca yeni öğrenciler) veya upsert (mevcut öğrencilerin ad, soyad,
+        telefon ve sınıfı da güncellenir). Eklenen/güncellenen/değişmeyen öğrencilerin tam
+        listesi 'fark' altında döner. dry_run'da aynı mod çalıştırılıp geri alınır; fark ve
+        hatalar gerçek aktarmanın önizlemesidir. Herhangi bir satırda hata varsa hiçbir şey
+        kaydedilmez (basarili False); kismi=True ise geçerli satırlar yine de kaydedilir.
+        """
+        if mod not in OgrenciService.AKTARMA_MODLARI:
+            raise ValueError(f"Geçersiz içe aktarma modu: {mod}")
+        
+        try:
+            wb = load_workbook(dosya, read_only=True, data_only=True)
+        except Exception as e:
+            return {
+                'basarili': False,
+                'hata': f"Excel dosyası okunamadı: {e}"
+            }
+        
+        try:
+            ws = wb.active
+            satirlar = ws.iter_rows(values_only=True)
+            indeksler = ExcelService._ice_aktarma_sutunlari(next(satirlar, None))
+            sinif_idleri = {sinif.ad: sinif.id for sinif in SinifService.tum_siniflari_getir()}
+            
+            hatalar = []
+            ogrenciler = ExcelService._ice_aktarma_satirlari(satirlar, indeksler, sinif_idleri, hatalar)
+            
+            if ilerleme:
+                # Toplam, sayfanın boyut bilgisinden (başlık hariç) tahmin edilir;
+                # işlenen sayısına geçersiz satırlar da dahildir
+                ilerleme(0, max(ws.max_row - 1, 0) if ws.max_row else None)
+                parti_ilerlemesi = lambda islenen: ilerleme(islenen + len(hatalar))
+            else:
+                parti_ilerlemesi = None
+            
+            fark = OgrenciService.toplu_ogrenci_aktar(
+                ogrenciler, mod=mod, dry_run=dry_run, kismi=kismi, dogrulama_hatalari=hatalar,
+                parca_boyutu=ExcelService.PARTI_BOYUTU, ilerleme=parti_ilerlemesi
+            )
+            hatalar.extend(fark.pop('hatalar'))
+            kaydedildi = fark.pop('kaydedildi')
+            
+            sonuc = {
+                'basarili': dry_run or kaydedildi,
+                'mode': mod,
+                'dry_run': dry_run,
+                'kaydedildi': kaydedildi,
+                'eklenen': len(fark['eklenen']),
+                'guncellenen': len(fark['guncellenen']),
+                'degismeyen': len(fark['degismeyen']),
+                'hatalar': [f"Satır {satir}: {mesaj}" for satir, mesaj in sorted(hatalar)],
+                'fark': fark
+            }
+            if not sonuc['basarili']:
+                sonuc['hata'] = (f"{len(hatalar)} satırda hata var, hiçbir öğrenci kaydedilmedi "
+                                 f"(geçerli satırları yine de aktarmak için partial=1)")
+            return sonuc
+        
+        except Exception as e:
+            return {
+                'basarili': False,
+                'hata': str(e)
+            }
+        finally:
+            wb.close()
+    
+    @staticmethod
+    def degerlendirme_raporu_olustur(dosya_yolu='degerlendirme_raporu.xlsx', sinif_id=None, ilerleme=None):
+        """Detaylı değerlendirme raporu oluştur (opsiyonel: sınıf filtresi)"""
+        return ExcelService._calisma_kitabi_yaz(
+            dosya_yolu,
+            sayfa_adi="Staj Değerlendirme",
+            basliklar=ExcelService.STAJ_RAPORU_BASLIKLARI,
+            satirlar=ExcelService.staj_raporu_satirlari(sinif_id=sinif_id),
+            baslik_rengi="70AD47",
+            baslik_font_boyutu=11,
+            sutun_genislikleri=[18] * len(ExcelService.STAJ_RAPORU_BASLIKLARI),
+            ilerleme=ilerleme
+        )
+    
+    @staticmethod
+    def normal_donem_raporu_olustur(dosya_yolu='normal_donem_raporu.xlsx', sinif_id=None, ilerleme=None):
+        """Normal dönem notları raporu oluştur (opsiyonel: sınıf filtresi)"""
+        return ExcelService._calisma_kitabi_yaz(
+            dosya_yolu,
+            sayfa_adi="Normal Dönem Notları",
+            basliklar=ExcelService.NORMAL_DONEM_BASLIKLARI,
+            satirlar=ExcelService.normal_donem_satirlari(sinif_id=sinif_id),
+            baslik_rengi="4472C4",
+            baslik_font_boyutu=11,
+            sutun_genislikleri=[
+                15,  # Sınıf
+                15,  # Öğrenci No
+                20,  # Ad Soyad
+                12,  # Vize Notu
+                12,  # Vize Ödev
+                12,  # Vize Ödev %
+                12,  # Vize Toplam
+                12,  # Final Notu
+                12,  # Final Ödev
+                12,  # Final Ödev %
+                12,  # Final Toplam
+                18,  # Devamsızlık
+                15,  # Bütünleme Notu
+                12,  # Büt Ödev
+                12,  # Büt Ödev %
+                15,  # Bütünleme Toplam
+                15,  # Genel Toplam
+                12   # Harf Notu
+            ],
+            ilerleme=ilerleme
+        )
+    
+    @staticmethod
+    def _rapor_satir_sayisi(model, sinif_id=None):
+        """Raporda yer alacak satır (öğrenci) sayısını getir"""
+        query = OgrenciService.ogrenci_sorgusu(sinif_id=sinif_id).order_by(None)
+        if model is not None:
+            query = query.join(model, model.ogrenci_id == Ogrenci.id)
+        return query.count()
+    
+    @staticmethod
+    def rapor_isi(is_, rapor_turu, sinif_id=None):
+        """Raporu arka plan işinde sonuç dosyasına yaz (IsYoneticisi tarafından çalıştırılır)
+        
+        Rapor, senkron endpoint'lerle aynı önbellekten (veri sürümü anahtarlı) okunur;
+        önbellekte yoksa oluşturulup önbelleğe de konur.
+        """
+        model, dosya_adi = ExcelService.RAPOR_ISLERI[rapor_turu]
+        toplam = ExcelService._rapor_satir_sayisi(model, sinif_id=sinif_id)
+        is_.ilerleme(0, toplam)
+        
+        veri, onbellekten = ExcelService.onbellekli_rapor(rapor_turu, sinif_id=sinif_id, ilerleme=is_.ilerleme)
+        if onbellekten:
+            is_.ilerleme(toplam)
+        
+        dosya_yolu = is_yoneticisi.dosya_yolu(is_, '.xlsx')
+        with open(dosya_yolu, 'wb') as f:
+            f.write(veri)
+        is_.dosya_yolu = dosya_yolu
+        is_.dosya_adi = dosya_adi
+    
+    @staticmethod
+    def ice_aktarma_isi(is_, dosya_yolu, mod='insert', dry_run=False, kismi=False):
+        """Yüklenen Excel dosyasını arka plan işinde içe aktar, ardından dosyayı sil
+        
+        İçe aktarma başarısızsa hata fırlatılır; iş 'hata' durumuyla biter. Hatalı satırlar
+        yüzünden hiçbir şey kaydedilmediyse satır hataları iş sonucunda kalır.
+        """
+        try:
+            sonuc = ExcelService.ogrencileri_excel_ice_aktar(
+                dosya_yolu, mod=mod, dry_run=dry_run, kismi=kismi, ilerleme=is_.ilerleme
+            )
+        finally:
+            os.remove(dosya_yolu)
+        if not sonuc['basarili']:
+            if 'hatalar' in sonuc:
+                is_.sonuc = sonuc
+            raise ValueError(sonuc['hata'])
+        return sonuc
@@ -0,0 +1,138 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from database import yazma_kilidi_kullan
+
+class Is:
+    """Arka planda çalışan tek bir iş (rapor oluşturma, içe aktarma...)"""
+    
+    def __init__(self, tur, yazar=False):
+        self.id = uuid.uuid4().hex
+        self.tur = tur
+        self.yazar = yazar           # Veritabanına yazan iş (ör. içe aktarma); transaction'lar yazma kilidiyle başlar
+        self.durum = 'bekliyor'      # bekliyor, calisiyor, tamamlandi, hata
+        self.islenen = 0
+        self.toplam = None
+        self.sonuc = None            # İşin döndürdüğü JSON uyumlu özet (ör. içe aktarma sonucu)
+        self.dosya_yolu = None       # İndirilecek sonuç dosyası (varsa)
+        self.dosya_adi = None
+        self.hata = None
+        self.olusturma = time.time()
+        self.bitis = None
+    
+    def ilerleme(self, islenen, toplam=None):
+        """İşlenen satır sayısını güncelle (iş fonksiyonu tarafından çağrılır)"""
+        self.islenen = islenen
+        if toplam is not None:
+            self.toplam = toplam
+    
+    @property
+    def bitti(self):
+        return self.durum in ('tamamlandi', 'hata')
+    
+    @property
+    def indirilebilir(self):
+        return self.durum == 'tamamlandi' and self.dosya_yolu is not None
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'tur': self.tur,
+            'durum': self.durum,
+            'islenen': self.islenen,
+            'toplam': self.toplam,
+            'sonuc': self.sonuc,
+            'indirilebilir': self.indirilebilir,
+            'hata': self.hata,
+            'olusturma': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.olusturma)),
+            'sure': round((self.bitis or time.time()) - self.olusturma, 2)
+        }
+
+class IsYoneticisi:
+    """Harici bir kuyruk/broker gerektirmeyen, süreç içi arka plan iş yöneticisi
+    
+    İşler bir iş parçacığı havuzunda uygulama bağlamı (app context) içinde çalışır.
+    Sonuç dosyaları geçici bir dizinde tutulur; biten işler sonuc_omru saniye
+    sonra (dosyalarıyla birlikte) silinir.
+    """
+    
+    def __init__(self, calisan_sayisi=2, sonuc_omru=3600):
+        self.calisan_sayisi = calisan_sayisi
+        self.sonuc_omru = sonuc_omru
+        self._isler = {}
+        self._kilit = threading.Lock()
+        self._havuz = None
+        self._dizin = None
+    
+    def _hazirla(self):
+        # Havuz ve dizin ilk iş gönderildiğinde oluşturulur
+        if self._havuz is None:
+            self._havuz = ThreadPoolExecutor(max_workers=self.calisan_sayisi, thread_name_prefix='is')
+            self._dizin = tempfile.mkdtemp(prefix='staj_isler_')
+    
+    def dosya_yolu(self, is_, uzanti):
+        """İşin sonuç (veya girdi) dosyası için geçici dizinde yol üret"""
+        with self._kilit:
+            self._hazirla()
+        return os.path.join(self._dizin, f"{is_.id}{uzanti}")
+    
+    def olustur(self, tur, yazar=False):
+        """Henüz başlatılmamış yeni bir iş kaydı oluştur (yazar: iş veritabanına yazar)"""
+        is_ = Is(tur, yazar=yazar)
+        with self._kilit:
+            self._suresi_dolanlari_temizle()
+            self._isler[is_.id] = is_
+        return is_
+    
+    def baslat(self, app, is_, fonksiyon, *args, **kwargs):
+        """İşi havuzda çalıştır: fonksiyon(is_, *args, **kwargs) app context içinde çağrılır"""
+        with self._kilit:
+            self._hazirla()
+            self._havuz.submit(self._calistir, app, is_, fonksiyon, args, kwargs)
+        return is_
+    
+    def _calistir(self, app, is_, fonksiyon, args, kwargs):
+        is_.durum = 'calisiyor'
+        try:
+            with app.app_context():
+                if is_.yazar:
+                    # Yazma isteklerindeki gibi okunan önceki durum yazılana kadar değişmesin
+                    yazma_kilidi_kullan()
+                is_.sonuc = fonksiyon(is_, *args, **kwargs)
+            durum = 'tamamlandi'
+        except Exception as e:
+            is_.hata = str(e)
+            durum = 'hata'
+        # Temizlik bitiş zamanına baktığı için durum en son güncellenir
+        is_.bitis = time.time()
+        is_.durum = durum
+    
+    def getir(self, is_id):
+        """İşi getir (yoksa veya süresi dolduysa None)"""
+        with self._kilit:
+            self._suresi_dolanlari_temizle()
+            return self._isler.get(is_id)
+    
+    def _suresi_dolanlari_temizle(self):
+        # Kilit tutulurken çağrılır
+        sinir = time.time() - self.sonuc_omru
+        for is_id in [i.id for i in self._isler.values() if i.bitti and i.bitis < sinir]:
+            is_ = self._isler.pop(is_id)
+            if is_.dosya_yolu and os.path.exists(is_.dosya_yolu):
+                os.remove(is_.dosya_yolu)
+    
+    def kapat(self):
+        """Havuzu durdur ve geçici dizini sil"""
+        with self._kilit:
+            if self._havuz is not None:
+                self._havuz.shutdown(wait=True)
+                shutil.rmtree(self._dizin, ignore_errors=True)
+                self._havuz = None
+                self._dizin = None
+            self._isler.clear()
+
+is_yoneticisi = IsYoneticisi()
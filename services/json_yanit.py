@@ -0,0 +1,23 @@
+"""
+Hızlı JSON yanıtları
+Büyük liste yanıtları jsonify yerine buradan serileştirilir: anahtarlar sıralanmaz,
+boşluk ve \\uXXXX kaçışları yazılmaz. orjson kuruluysa o kullanılır, değilse
+standart json modülüne düşülür (orjson zorunlu bir bağımlılık değildir).
+"""
+import json
+from flask import current_app
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_baytlari(veri):
+    """Veriyi UTF-8 kodlanmış, boşluksuz JSON baytlarına çevir"""
+    if orjson is not None:
+        return orjson.dumps(veri)
+    return json.dumps(veri, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def json_yaniti(veri, durum=200):
+    """jsonify'ın hızlı karşılığı"""
+    return current_app.response_class(json_baytlari(veri), status=durum, mimetype='application/json')
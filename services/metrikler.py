@@ -0,0 +1,175 @@
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from flask import Response, g, has_request_context, request
+from sqlalchemy import event
+from database import db
+
+class Histogram:
+    """Prometheus histogramı: aralık sayaçları, toplam ve gözlem sayısı"""
+    
+    def __init__(self, araliklar):
+        self.araliklar = araliklar
+        self.sayaclar = [0] * (len(araliklar) + 1)  # son eleman +Inf
+        self.toplam = 0.0
+        self.sayi = 0
+    
+    def gozlemle(self, deger):
+        self.sayaclar[bisect_left(self.araliklar, deger)] += 1
+        self.toplam += deger
+        self.sayi += 1
+    
+    def kumulatif(self):
+        """(üst sınır, birikimli sayı) çiftleri"""
+        birikimli = 0
+        for sinir, sayi in zip(list(self.araliklar) + ['+Inf'], self.sayaclar):
+            birikimli += sayi
+            yield sinir, birikimli
+
+class MetrikDeposu:
+    """Endpoint bazında istek süresi, yanıt boyutu ve SQL metrikleri
+    
+    Değerler bellekte tutulur ve Prometheus metin formatında dışa verilir.
+    """
+    
+    ONEK = 'staj_takip'
+    SURE_ARALIKLARI = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+    BOYUT_ARALIKLARI = tuple(1024 * 4 ** i for i in range(9))  # 1 KB - 64 MB
+    
+    def __init__(self):
+        self._kilit = threading.Lock()
+        self.temizle()
+    
+    def temizle(self):
+        """Tüm metrikleri sıfırla"""
+        with self._kilit:
+            self._istek_sayilari = defaultdict(int)                 # (endpoint, metot, durum)
+            self._sureler = {}                                      # (endpoint, metot)
+            self._boyutlar = {}                                     # (endpoint, metot)
+            self._sql_sayilari = defaultdict(int)                   # endpoint
+            self._sql_sureleri = defaultdict(float)                 # endpoint
+    
+    def istek_kaydet(self, endpoint, metot, durum, sure, boyut, sql_sayisi, sql_suresi):
+        """Tamamlanan bir isteğin ölçümlerini ekle (boyut bilinmiyorsa None)"""
+        anahtar = (endpoint, metot)
+        with self._kilit:
+            self._istek_sayilari[(endpoint, metot, durum)] += 1
+            self._sureler.setdefault(anahtar, Histogram(self.SURE_ARALIKLARI)).gozlemle(sure)
+            if boyut is not None:
+                self._boyutlar.setdefault(anahtar, Histogram(self.BOYUT_ARALIKLARI)).gozlemle(boyut)
+            self._sql_sayilari[endpoint] += sql_sayisi
+            self._sql_sureleri[endpoint] += sql_suresi
+    
+    @staticmethod
+    def _etiketler(**etiketler):
+        return ','.join(f'{ad}="{deger}"' for ad, deger in etiketler.items())
+    
+    def _histogram_satirlari(self, ad, aciklama, histogramlar):
+        satirlar = [f"# HELP {ad} {aciklama}", f"# TYPE {ad} histogram"]
+        for (endpoint, metot), histogram in sorted(histogramlar.items()):
+            etiketler = self._etiketler(endpoint=endpoint, method=metot)
+            for sinir, sayi in histogram.kumulatif():
+                satirlar.append(f'{ad}_bucket{{{etiketler},le="{sinir}"}} {sayi}')
+            satirlar.append(f"{ad}_sum{{{etiketler}}} {histogram.toplam}")
+            satirlar.append(f"{ad}_count{{{etiketler}}} {histogram.sayi}")
+        return satirlar
+    
+    def prometheus_metni(self):
+        """Metrikleri Prometheus metin formatında (0.0.4) getir"""
+        onek = self.ONEK
+        with self._kilit:
+            satirlar = [
+                f"# HELP {onek}_http_requests_total Tamamlanan HTTP istekleri",
+                f"# TYPE {onek}_http_requests_total counter"
+            ]
+            for (endpoint, metot, durum), sayi in sorted(self._istek_sayilari.items()):
+                etiketler = self._etiketler(endpoint=endpoint, method=metot, status=durum)
+                satirlar.append(f"{onek}_http_requests_total{{{etiketler}}} {sayi}")
+            
+            satirlar += self._histogram_satirlari(
+                f"{onek}_http_request_duration_seconds", "İstek süresi (saniye)", self._sureler
+            )
+            satirlar += self._histogram_satirlari(
+                f"{onek}_http_response_size_bytes", "Yanıt boyutu (bayt)", self._boyutlar
+            )
+            
+            satirlar += [
+                f"# HELP {onek}_sql_queries_total İstekler sırasında çalıştırılan SQL ifadeleri",
+                f"# TYPE {onek}_sql_queries_total counter"
+            ]
+            for endpoint, sayi in sorted(self._sql_sayilari.items()):
+                satirlar.append(f'{onek}_sql_queries_total{{endpoint="{endpoint}"}} {sayi}')
+            
+            satirlar += [
+                f"# HELP {onek}_sql_duration_seconds_total İstekler sırasında SQL'de geçen toplam süre",
+                f"# TYPE {onek}_sql_duration_seconds_total counter"
+            ]
+            for endpoint, sure in sorted(self._sql_sureleri.items()):
+                satirlar.append(f'{onek}_sql_duration_seconds_total{{endpoint="{endpoint}"}} {sure}')
+        
+        return '\n'.join(satirlar) + '\n'
+
+metrikler = MetrikDeposu()
+
+def _sql_baslangic(baglanti, cursor, ifade, parametreler, context, executemany):
+    if has_request_context():
+        baglanti.info.setdefault('metrik_baslangic', []).append(time.perf_counter())
+
+def _sql_bitis(baglanti, cursor, ifade, parametreler, context, executemany):
+    if has_request_context() and baglanti.info.get('metrik_baslangic'):
+        sure = time.perf_counter() - baglanti.info['metrik_baslangic'].pop()
+        g.metrik_sql_sayisi = g.get('metrik_sql_sayisi', 0) + 1
+        g.metrik_sql_suresi = g.get('metrik_sql_suresi', 0.0) + sure
+
+def _sql_hata(hata_baglami):
+    # Hata veren ifadede after_cursor_execute çalışmaz; başlangıç zamanını at
+    baglanti = hata_baglami.connection
+    if baglanti is not None and baglanti.info.get('metrik_baslangic'):
+        baglanti.info['metrik_baslangic'].pop()
+
+def _istek_basladi():
+    g.metrik_baslangic = time.perf_counter()
+
+def _yanit_hazir(response):
+    # Akış halinde gönderilen yanıtların boyutu önceden bilinmez (None)
+    g.metrik_durum = response.status_code
+    g.metrik_boyut = response.content_length
+    return response
+
+def _istek_bitti(hata):
+    # teardown, akış halindeki yanıtlar tamamen gönderildikten sonra çalışır;
+    # süre ve SQL sayıları yanıt üretiminin tamamını kapsar
+    if 'metrik_baslangic' not in g:
+        return
+    metrikler.istek_kaydet(
+        endpoint=request.endpoint or 'bilinmeyen',
+        metot=request.method,
+        durum=g.get('metrik_durum', 500),
+        sure=time.perf_counter() - g.metrik_baslangic,
+        boyut=g.get('metrik_boyut'),
+        sql_sayisi=g.get('metrik_sql_sayisi', 0),
+        sql_suresi=g.get('metrik_sql_suresi', 0.0)
+    )
+
+def _metrikleri_goster():
+    return Response(metrikler.prometheus_metni(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+def metrikleri_etkinlestir(app):
+    """METRIKLER_ACIK ayarı açıksa istek/SQL ölçümünü ve /metrics endpoint'ini kaydet
+    
+    Ayar kapalıyken hiçbir hook veya engine olayı kaydedilmez, ek maliyet olmaz.
+    """
+    if not app.config.get('METRIKLER_ACIK'):
+        return False
+    
+    app.before_request(_istek_basladi)
+    app.after_request(_yanit_hazir)
+    app.teardown_request(_istek_bitti)
+    app.add_url_rule('/metrics', 'metrikler', _metrikleri_goster)
+    
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute', _sql_baslangic)
+        event.listen(db.engine, 'after_cursor_execute', _sql_bitis)
+        event.listen(db.engine, 'handle_error', _sql_hata)
+    return True
@@ -0,0 +1,68 @@
+import threading
+from collections import OrderedDict
+
+class RaporCache:
+    """Oluşturulan Excel raporları için boyutu sınırlı LRU önbellek
+    
+    Anahtar (rapor türü, sınıf ID, veri sürümü) üçlüsüdür; veri değiştiğinde
+    sürüm de değiştiği için eski kayıtlar bir daha okunmaz ve LRU ile atılır.
+    """
+    
+    def __init__(self, maksimum_kayit=32, maksimum_bayt=64 * 1024 * 1024):
+        self.maksimum_kayit = maksimum_kayit
+        self.maksimum_bayt = maksimum_bayt
+        self._kayitlar = OrderedDict()
+        self._toplam_bayt = 0
+        self._kilit = threading.Lock()
+        self.isabet = 0
+        self.iska = 0
+    
+    def getir(self, anahtar):
+        """Önbellekteki raporu getir (yoksa None)"""
+        with self._kilit:
+            veri = self._kayitlar.get(anahtar)
+            if veri is None:
+                self.iska += 1
+                return None
+            self._kayitlar.move_to_end(anahtar)
+            self.isabet += 1
+            return veri
+    
+    def kaydet(self, anahtar, veri):
+        """Raporu önbelleğe koy, sınırlar aşılırsa en eski kayıtları at"""
+        if len(veri) > self.maksimum_bayt:
+            return
+        
+        with self._kilit:
+            eski = self._kayitlar.pop(anahtar, None)
+            if eski is not None:
+                self._toplam_bayt -= len(eski)
+            
+            self._kayitlar[anahtar] = veri
+            self._toplam_bayt += len(veri)
+            
+            while len(self._kayitlar) > self.maksimum_kayit or self._toplam_bayt > self.maksimum_bayt:
+                _, atilan = self._kayitlar.popitem(last=False)
+                self._toplam_bayt -= len(atilan)
+    
+    def temizle(self):
+        """Önbelleği ve sayaçları sıfırla"""
+        with self._kilit:
+            self._kayitlar.clear()
+            self._toplam_bayt = 0
+            self.isabet = 0
+            self.iska = 0
+    
+    def istatistikler(self):
+        """İsabet/ıska sayaçlarını ve doluluk bilgisini getir"""
+        with self._kilit:
+            return {
+                'isabet': self.isabet,
+                'iska': self.iska,
+                'kayit_sayisi': len(self._kayitlar),
+                'toplam_bayt': self._toplam_bayt,
+                'maksimum_kayit': self.maksimum_kayit,
+                'maksimum_bayt': self.maksimum_bayt
+            }
+
+rapor_cache = RaporCache()
@@ -0,0 +1,177 @@
+import io
+import os
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from flask import current_app
+from services.excel_service import ExcelService
+from services.staj_service import SinifService
+
+# Çalışan süreçteki uygulama (her süreçte bir kez oluşturulur)
+_calisan_uygulamasi = None
+
+# İstekler arasında paylaşılan süreç havuzu; ilk paket isteğinde oluşturulur ve ayarlar
+# (veritabanı) ya da çalışan sayısı değişmedikçe yeniden kullanılır
+_havuz = None
+_havuz_anahtari = None
+_havuz_kilidi = threading.Lock()
+
+def _calisan_hazirla(ayarlar):
+    """Çalışan sürecin kendi uygulamasını ve veritabanı bağlantısını oluştur"""
+    global _calisan_uygulamasi
+    from app import create_app
+    _calisan_uygulamasi = create_app(ayarlar)
+
+def _sinif_raporu_olustur(rapor_turu, sinif_id):
+    """Çalışan süreçte tek bir sınıfın raporunu oluşturup baytlarını döndür"""
+    fonksiyon_adi = RaporPaketiService.RAPORLAR[rapor_turu][0]
+    with _calisan_uygulamasi.app_context():
+        tampon = io.BytesIO()
+        getattr(ExcelService, fonksiyon_adi)(tampon, sinif_id=sinif_id)
+        return tampon.getvalue()
+
+class _AkisTamponu:
+    """ZipFile'ın yazdığı baytları biriktiren, geri sarılamayan (seek/tell desteklemeyen) dosya
+    
+    ZipFile bu durumda her girdiyi veri tanımlayıcılarıyla (data descriptor) yazar,
+    böylece arşiv baştan sona tek geçişte üretilip parça parça gönderilebilir.
+    """
+    
+    def __init__(self):
+        self._parcalar = []
+    
+    def write(self, veri):
+        self._parcalar.append(bytes(veri))
+        return len(veri)
+    
+    def flush(self):
+        pass
+    
+    def al(self):
+        """Biriken baytları getir ve tamponu boşalt"""
+        veri = b''.join(self._parcalar)
+        self._parcalar = []
+        return veri
+
+class RaporPaketiService:
+    """Tüm sınıfların raporlarını paralel oluşturup tek bir ZIP olarak sunan servis"""
+    
+    # rapor türü: (ExcelService metodu, ZIP içindeki klasör)
+    RAPORLAR = {
+        'staj': ('degerlendirme_raporu_olustur', 'staj_degerlendirme'),
+        'normal_donem': ('normal_donem_raporu_olustur', 'normal_donem')
+    }
+    
+    # Bundan az sınıf varsa (ya da tek çalışan kalıyorsa) raporlar istek içinde sırayla
+    # oluşturulur; süreçlere dağıtmanın maliyeti kazancı aşar
+    MINIMUM_PARALEL_SINIF = 4
+    
+    @staticmethod
+    def calisan_ayarlari(app):
+        """Çalışan süreçlerin aynı veritabanına bağlanması için gereken ayarlar"""
+        uri = app.config['SQLALCHEMY_DATABASE_URI']
+        if uri in ('sqlite://', 'sqlite:///:memory:'):
+            raise ValueError("Bellek içi veritabanı çalışan süreçlerle paylaşılamaz")
+        return {
+            'SQLALCHEMY_DATABASE_URI': uri,
+            'VERITABANI_PROFILI': app.config['VERITABANI_PROFILI'],
+            'METRIKLER_ACIK': False
+        }
+    
+    @staticmethod
+    def _dosya_adi(klasor, sinif):
+        """Arşivdeki dosya adı; sınıf id'si, temizlenince aynı kalan adları (ör. A/B ve A-B) ayırır"""
+        ad = sinif.ad.replace('/', '-').replace('\\', '-')
+        return f"{klasor}/{sinif.id}_{ad}.xlsx"
+    
+    @staticmethod
+    def paket_parcalari(rapor_turleri=None, calisan_sayisi=None):
+        """Her sınıf ve rapor türü için bir çalışma kitabını süreç havuzunda oluştur,
+        biten raporları sırayla ZIP arşivine ekleyerek baytları parça parça üret
+        
+        Sınıf listesi ve çalışan ayarları çağrıldığı anda (istek içinde) okunur. Tek
+        çekirdekte, tek çalışanda ya da az sınıfta raporlar istek içinde sırayla oluşturulur.
+        """
+        rapor_turleri = rapor_turleri or list(RaporPaketiService.RAPORLAR)
+        for rapor_turu in rapor_turleri:
+            if rapor_turu not in RaporPaketiService.RAPORLAR:
+                raise ValueError(f"Geçersiz rapor türü: {rapor_turu}")
+        
+        siniflar = SinifService.tum_siniflari_getir()
+        gorevler = [
+            (rapor_turu, sinif.id, RaporPaketiService._dosya_adi(RaporPaketiService.RAPORLAR[rapor_turu][1], sinif))
+            for sinif in siniflar
+            for rapor_turu in rapor_turleri
+        ]
+        calisan_sayisi = max(1, min(calisan_sayisi or os.cpu_count() or 1, len(gorevler)))
+        
+        if calisan_sayisi == 1 or len(siniflar) < RaporPaketiService.MINIMUM_PARALEL_SINIF:
+            return RaporPaketiService._zip_akisi(RaporPaketiService._sirali_raporlar(gorevler))
+        havuz = RaporPaketiService._havuz_getir(RaporPaketiService.calisan_ayarlari(current_app), calisan_sayisi)
+        return RaporPaketiService._zip_akisi(RaporPaketiService._paralel_raporlar(havuz, gorevler))
+    
+    @staticmethod
+    def _havuz_getir(ayarlar, calisan_sayisi):
+        """Paylaşılan süreç havuzunu getir; yoksa ya da ayarlar değiştiyse yeniden oluştur
+        
+        Çalışanlar uygulamalarını initializer'da bir kez kurar ve sonraki isteklerde de kullanılır.
+        """
+        global _havuz, _havuz_anahtari
+        anahtar = (tuple(sorted(ayarlar.items())), calisan_sayisi)
+        with _havuz_kilidi:
+            if _havuz is None or _havuz_anahtari != anahtar:
+                if _havuz is not None:
+                    # Eski havuzdaki işler bitince çalışanları kapanır
+                    _havuz.shutdown(wait=False)
+                _havuz = ProcessPoolExecutor(
+                    max_workers=calisan_sayisi, initializer=_calisan_hazirla, initargs=(ayarlar,)
+                )
+                _havuz_anahtari = anahtar
+            return _havuz
+    
+    @staticmethod
+    def havuzu_kapat():
+        """Paylaşılan süreç havuzunu durdur (bir sonraki paket isteği yenisini oluşturur)"""
+        global _havuz, _havuz_anahtari
+        with _havuz_kilidi:
+            if _havuz is not None:
+                _havuz.shutdown(wait=True)
+                _havuz = None
+                _havuz_anahtari = None
+    
+    @staticmethod
+    def _sirali_raporlar(gorevler):
+        """Raporları istek içinde sırayla oluşturup (dosya adı, bayt) olarak üret"""
+        for rapor_turu, sinif_id, dosya_adi in gorevler:
+            tampon = io.BytesIO()
+            getattr(ExcelService, RaporPaketiService.RAPORLAR[rapor_turu][0])(tampon, sinif_id=sinif_id)
+            yield dosya_adi, tampon.getvalue()
+    
+    @staticmethod
+    def _paralel_raporlar(havuz, gorevler):
+        """Raporları süreç havuzunda oluşturup bittikçe (dosya adı, bayt) olarak üret"""
+        islemler = {}
+        try:
+            for rapor_turu, sinif_id, dosya_adi in gorevler:
+                islemler[havuz.submit(_sinif_raporu_olustur, rapor_turu, sinif_id)] = dosya_adi
+            for islem in as_completed(islemler):
+                yield islemler[islem], islem.result()
+        except BrokenProcessPool:
+            # Çökmüş havuz tekrar kullanılmaz; sonraki istek yenisini oluşturur
+            RaporPaketiService.havuzu_kapat()
+            raise
+        finally:
+            # İstemci bağlantıyı keserse bekleyen raporlar iptal edilir (havuz açık kalır)
+            for islem in islemler:
+                islem.cancel()
+    
+    @staticmethod
+    def _zip_akisi(raporlar):
+        akis = _AkisTamponu()
+        # Çalışma kitapları zaten sıkıştırılmış olduğundan tekrar sıkıştırılmaz
+        with zipfile.ZipFile(akis, 'w', compression=zipfile.ZIP_STORED) as arsiv:
+            for dosya_adi, veri in raporlar:
+                arsiv.writestr(dosya_adi, veri)
+                yield akis.al()
+        yield akis.al()
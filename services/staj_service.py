@@ -1,22 +1,485 @@
+import base64
+import json
+import math
+from datetime import datetime
+from sqlalchemy import and_, or_, insert, update, text, bindparam
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import joinedload
 from database import db
-from models import Ogrenci, ZiyaretNotu, StajDegerlendirme, NormalDonemDegerlendirme, Sinif
+from models import Ogrenci, ZiyaretNotu, StajDegerlendirme, NormalDonemDegerlendirme, Sinif, VeriSurumu, SinifOzet, SinifHarfOzet
+from migrations import SINIF_OZET_SAYIMI, SINIF_HARF_OZET_SAYIMI, sinif_ozetini_yeniden_olustur
+
+class SurumService:
+    """Veri sürümü işlemleri servisi
+    
+    Her yazma işlemi etkilediği tabloların sürümünü aynı transaction içinde
+    artırır; önbellekler bu sürümleri anahtar olarak kullanır.
+    """
+    
+    @staticmethod
+    def artir(*tablolar):
+        """Tabloların veri sürümünü bir artır (commit çağıran serviste yapılır)"""
+        for tablo in tablolar:
+            ifade = sqlite_insert(VeriSurumu.__table__).values(tablo=tablo, surum=1)
+            ifade = ifade.on_conflict_do_update(
+                index_elements=['tablo'],
+                set_={'surum': VeriSurumu.__table__.c.surum + 1}
+            )
+            db.session.execute(ifade)
+    
+    @staticmethod
+    def getir(*tablolar):
+        """Tabloların güncel veri sürümlerini verilen sırayla getir"""
+        surumler = dict(
+            db.session.query(VeriSurumu.tablo, VeriSurumu.surum)
+            .filter(VeriSurumu.tablo.in_(tablolar)).all()
+        )
+        return tuple(surumler.get(tablo, 0) for tablo in tablolar)
+
+class OzetFarki:
+    """Bir yazma işleminin sınıf özetlerine (sinif_ozet, sinif_harf_ozet) etkisini biriktirir
+    
+    Servisler değişiklikleri fark olarak ekler; uygula() farkları sınıf başına tek bir
+    UPSERT ile aynı transaction içinde yazar (commit çağıran serviste yapılır).
+    Sınıfı olmayan öğrenciler 0 numaralı satırda tutulur.
+    """
+    
+    # Harf dağılımı tutulan değerlendirme modelleri
+    TURLER = {StajDegerlendirme: 'staj', NormalDonemDegerlendirme: 'normal_donem'}
+    
+    def __init__(self):
+        self._sayilar = {}   # sinif_id: {alan: fark}
+        self._harfler = {}   # (sinif_id, tur, harf_notu): fark
+    
+    @staticmethod
+    def durum(degerlendirme):
+        """Değerlendirmenin özete katkısı: (toplam, harf_notu) ya da None (kayıt yok)"""
+        if degerlendirme is None:
+            return None
+        return getattr(degerlendirme, 'toplam', None), degerlendirme.harf_notu
+    
+    def ekle(self, sinif_id, **farklar):
+        satir = self._sayilar.setdefault(sinif_id or 0, {})
+        for alan, fark in farklar.items():
+            satir[alan] = satir.get(alan, 0) + fark
+    
+    def harf(self, sinif_id, tur, harf_notu, fark):
+        if harf_notu is None:
+            return
+        anahtar = (sinif_id or 0, tur, harf_notu)
+        self._harfler[anahtar] = self._harfler.get(anahtar, 0) + fark
+    
+    def degerlendirme(self, sinif_id, tur, onceki, sonraki):
+        """Değerlendirmenin önceki durumunu çıkar, sonraki durumunu ekle (OzetFarki.durum)"""
+        for durum, isaret in ((onceki, -1), (sonraki, 1)):
+            if durum is None:
+                continue
+            toplam, harf_notu = durum
+            if tur == 'staj':
+                toplam = toplam or 0
+                self.ekle(sinif_id, staj_degerlendirilen=isaret if toplam > 0 else 0,
+                          staj_toplam_toplami=isaret * toplam)
+            self.harf(sinif_id, tur, harf_notu, isaret)
+    
+    def ogrenci(self, sinif_id, isaret, ziyaret_sayisi=0, staj=None, normal_donem=None):
+        """Öğrencinin tüm katkısını sınıfın özetine ekle (isaret=1) ya da çıkar (isaret=-1)"""
+        self.ekle(sinif_id, ogrenci_sayisi=isaret, ziyaret_sayisi=isaret * ziyaret_sayisi)
+        for tur, durum in (('staj', staj), ('normal_donem', normal_donem)):
+            if isaret > 0:
+                self.degerlendirme(sinif_id, tur, None, durum)
+            else:
+                self.degerlendirme(sinif_id, tur, durum, None)
+    
+    # sinif_ozet'te farkı tutulan sütunlar
+    SAYI_ALANLARI = ('ogrenci_sayisi', 'ziyaret_sayisi', 'staj_degerlendirilen', 'staj_toplam_toplami')
+    
+    def uygula(self):
+        """Biriken farkları her özet tablosuna tek bir çok satırlı UPSERT (executemany) ile yaz"""
+        sayi_satirlari = [
+            dict({alan: farklar.get(alan, 0) for alan in OzetFarki.SAYI_ALANLARI}, sinif_id=sinif_id)
+            for sinif_id, farklar in self._sayilar.items() if any(farklar.values())
+        ]
+        if sayi_satirlari:
+            tablo = SinifOzet.__table__
+            ifade = sqlite_insert(tablo)
+            ifade = ifade.on_conflict_do_update(
+                index_elements=['sinif_id'],
+                set_={alan: tablo.c[alan] + ifade.excluded[alan] for alan in OzetFarki.SAYI_ALANLARI}
+            )
+            db.session.execute(ifade, sayi_satirlari)
+        
+        harf_satirlari = [
+            {'sinif_id': sinif_id, 'tur': tur, 'harf_notu': harf_notu, 'sayi': fark}
+            for (sinif_id, tur, harf_notu), fark in self._harfler.items() if fark
+        ]
+        if harf_satirlari:
+            tablo = SinifHarfOzet.__table__
+            ifade = sqlite_insert(tablo)
+            ifade = ifade.on_conflict_do_update(
+                index_elements=['sinif_id', 'tur', 'harf_notu'],
+                set_={'sayi': tablo.c.sayi + ifade.excluded.sayi}
+            )
+            db.session.execute(ifade, harf_satirlari)
+        
+        self._sayilar.clear()
+        self._harfler.clear()
+
+class OzetService:
+    """Sınıf özet tabloları servisi"""
+    
+    # Ortalama toplamlarının karşılaştırılmasında kabul edilen kayan nokta farkı
+    TOPLAM_TOLERANSI = 1e-6
+    
+    @staticmethod
+    def ogrenci_katkilari(ogrenci_idleri):
+        """Öğrencilerin özete katkılarını IN sorgularıyla getir
+        
+        Dönüş: {ogrenci_id: {'ziyaret_sayisi', 'staj', 'normal_donem'}} (durumlar OzetFarki.durum biçiminde)
+        """
+        katkilar = {i: {'ziyaret_sayisi': 0, 'staj': None, 'normal_donem': None} for i in ogrenci_idleri}
+        for parca in _parcalara_bol(katkilar):
+            for ogrenci_id, sayi in db.session.query(ZiyaretNotu.ogrenci_id, db.func.count(ZiyaretNotu.id)) \
+                    .filter(ZiyaretNotu.ogrenci_id.in_(parca)).group_by(ZiyaretNotu.ogrenci_id):
+                katkilar[ogrenci_id]['ziyaret_sayisi'] = sayi
+            for ogrenci_id, toplam, harf_notu in db.session.query(
+                    StajDegerlendirme.ogrenci_id, StajDegerlendirme.toplam, StajDegerlendirme.harf_notu
+            ).filter(StajDegerlendirme.ogrenci_id.in_(parca)):
+                katkilar[ogrenci_id]['staj'] = (toplam, harf_notu)
+            for ogrenci_id, harf_notu in db.session.query(
+                    NormalDonemDegerlendirme.ogrenci_id, NormalDonemDegerlendirme.harf_notu
+            ).filter(NormalDonemDegerlendirme.ogrenci_id.in_(parca)):
+                katkilar[ogrenci_id]['normal_donem'] = (None, harf_notu)
+        return katkilar
+    
+    @staticmethod
+    def yeniden_olustur():
+        """Özet tablolarını kaynak tablolardan baştan oluştur
+        
+        Servis dışından (ör. toplu veri yükleme scriptleri) yazılan veriler için kullanılır.
+        """
+        sinif_ozetini_yeniden_olustur(db.session.connection())
+        db.session.commit()
+    
+    @staticmethod
+    def _sayilari_getir(sorgu, anahtar_sayisi):
+        return {
+            tuple(satir[:anahtar_sayisi]): tuple(satir[anahtar_sayisi:])
+            for satir in db.session.execute(text(sorgu)).all()
+        }
+    
+    @staticmethod
+    def tutarlilik_kontrolu():
+        """Özet tablolarını tam bir yeniden sayımla karşılaştır (veritabanına yazmaz)
+        
+        Sıfır satırlar yok sayılır. Dönüş: [{'tablo', 'anahtar', 'ozet', 'sayim'}, ...]
+        (liste boşsa özetler tutarlıdır)
+        """
+        karsilastirmalar = (
+            ('sinif_ozet', 1,
+             "SELECT sinif_id, ogrenci_sayisi, ziyaret_sayisi, staj_degerlendirilen, staj_toplam_toplami FROM sinif_ozet",
+             SINIF_OZET_SAYIMI),
+            ('sinif_harf_ozet', 3, "SELECT sinif_id, tur, harf_notu, sayi FROM sinif_harf_ozet", SINIF_HARF_OZET_SAYIMI),
+        )
+        
+        farklar = []
+        for tablo, anahtar_sayisi, ozet_sorgusu, sayim_sorgusu in karsilastirmalar:
+            ozet = OzetService._sayilari_getir(ozet_sorgusu, anahtar_sayisi)
+            sayim = OzetService._sayilari_getir(sayim_sorgusu, anahtar_sayisi)
+            for anahtar in sorted(set(ozet) | set(sayim), key=str):
+                ozet_degeri, sayim_degeri = ozet.get(anahtar), sayim.get(anahtar)
+                bos = (0,) * len(ozet_degeri or sayim_degeri)
+                ozet_degeri, sayim_degeri = ozet_degeri or bos, sayim_degeri or bos
+                if not all(math.isclose(a, b, rel_tol=1e-9, abs_tol=OzetService.TOPLAM_TOLERANSI)
+                           for a, b in zip(ozet_degeri, sayim_degeri)):
+                    farklar.append({
+                        'tablo': tablo, 'anahtar': list(anahtar),
+                        'ozet': list(ozet_degeri), 'sayim': list(sayim_degeri)
+                    })
+        return farklar
+
+def _parcalara_bol(ogeler, boyut=500):
+    """Listeyi IN sorguları için SQLite parametre sınırının altında kalan parçalara böl"""
+    ogeler = list(ogeler)
+    for i in range(0, len(ogeler), boyut):
+        yield ogeler[i:i + boyut]
+
+def _varsayilanlarla_olustur(model, ogrenci_id):
+    """Değerlendirme nesnesini sütun varsayılanları doldurulmuş halde oluştur
+    
+    Sütun varsayılanları normalde INSERT sırasında uygulanır; hesaplama metotlarının
+    henüz kaydedilmemiş nesnede de çalışabilmesi için burada önceden atanır.
+    """
+    degerlendirme = model(ogrenci_id=ogrenci_id)
+    for kolon in model.__table__.columns:
+        if kolon.default is not None and kolon.default.is_scalar:
+            setattr(degerlendirme, kolon.key, kolon.default.arg)
+    return degerlendirme
+
+def _yazmak_icin_getir(model, ogrenci_id):
+    """Güncellenecek değerlendirmeyi getir; yoksa yeni kaydı oturuma ekle
+    
+    Satır yalnızca bir güncelleme sırasında oluşturulur, okuma yolları kayıt eklemez.
+    """
+    degerlendirme = model.query.filter_by(ogrenci_id=ogrenci_id).first()
+    if not degerlendirme:
+        degerlendirme = _varsayilanlarla_olustur(model, ogrenci_id)
+        db.session.add(degerlendirme)
+    return degerlendirme
+
+def _toplu_degerlendirme_guncelle(model, kayitlar, kriterleri_uygula):
+    """Değerlendirmeleri tek transaction içinde toplu güncelle
+    
+    kayitlar: [{'ogrenci_id': 1, <kriter>: <değer>, ...}, ...]
+    Öğrenciler ve mevcut değerlendirmeler IN sorgularıyla tek seferde yüklenir,
+    olmayan değerlendirmeler oluşturulur ve en sonda tek COMMIT yapılır.
+    Dönüş: (guncellenen_degerlendirmeler, [{'sira', 'ogrenci_id', 'hata'}, ...])
+    """
+    hatalar = []
+    gecerli_kayitlar = []
+    for sira, kayit in enumerate(kayitlar):
+        try:
+            gecerli_kayitlar.append((sira, int(kayit['ogrenci_id']), kayit))
+        except (KeyError, ValueError, TypeError):
+            ogrenci_id = kayit.get('ogrenci_id') if isinstance(kayit, dict) else None
+            hatalar.append({'sira': sira, 'ogrenci_id': ogrenci_id, 'hata': 'Geçersiz öğrenci ID!'})
+    
+    ogrenci_idleri = {ogrenci_id for _, ogrenci_id, _ in gecerli_kayitlar}
+    ogrenci_siniflari = {}
+    degerlendirmeler = {}
+    for parca in _parcalara_bol(ogrenci_idleri):
+        ogrenci_siniflari.update(db.session.query(Ogrenci.id, Ogrenci.sinif_id).filter(Ogrenci.id.in_(parca)))
+        degerlendirmeler.update((d.ogrenci_id, d) for d in model.query.filter(model.ogrenci_id.in_(parca)))
+    
+    tur = OzetFarki.TURLER[model]
+    ozet = OzetFarki()
+    guncellenenler = []
+    for sira, ogrenci_id, kayit in gecerli_kayitlar:
+        if ogrenci_id not in ogrenci_siniflari:
+            hatalar.append({'sira': sira, 'ogrenci_id': ogrenci_id, 'hata': 'Öğrenci bulunamadı!'})
+            continue
+        
+        degerlendirme = degerlendirmeler.get(ogrenci_id)
+        yeni = degerlendirme is None
+        if yeni:
+            degerlendirme = _varsayilanlarla_olustur(model, ogrenci_id)
+        onceki = None if yeni else OzetFarki.durum(degerlendirme)
+        
+        try:
+            kriterleri_uygula(degerlendirme, kayit)
+        except ValueError as e:
+            hatalar.append({'sira': sira, 'ogrenci_id': ogrenci_id, 'hata': str(e)})
+            continue
+        
+        ozet.degerlendirme(ogrenci_siniflari[ogrenci_id], tur, onceki, OzetFarki.durum(degerlendirme))
+        if yeni:
+            db.session.add(degerlendirme)
+            degerlendirmeler[ogrenci_id] = degerlendirme
+        guncellenenler.append(degerlendirme)
+    
+    if guncellenenler:
+        try:
+            ozet.uygula()
+            SurumService.artir(model.__tablename__)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        
+        # Commit sonrası süresi dolan nesneleri satır satır değil tek sorguda yenile
+        for parca in _parcalara_bol(ogrenci_idleri):
+            model.query.filter(model.ogrenci_id.in_(parca)).all()
+    
+    return guncellenenler, sorted(hatalar, key=lambda h: h['sira'])
+
+def _degerlendirme_ozetine_yaz(degerlendirme, onceki):
+    """Tek bir değerlendirmenin değişikliğini öğrencinin sınıf özetine yaz (commit çağıran serviste yapılır)"""
+    # Yeni değerlendirme öğrenci kontrolünden önce flush edilirse yabancı anahtar hatası verir
+    with db.session.no_autoflush:
+        ogrenci = db.session.query(Ogrenci.sinif_id).filter(Ogrenci.id == degerlendirme.ogrenci_id).first()
+    if ogrenci is None:
+        # Yabancı anahtar öğrencisi olmayan değerlendirmeye zaten izin vermez
+        db.session.rollback()
+        raise ValueError("Öğrenci bulunamadı!")
+    ozet = OzetFarki()
+    ozet.degerlendirme(ogrenci.sinif_id, OzetFarki.TURLER[type(degerlendirme)], onceki, OzetFarki.durum(degerlendirme))
+    ozet.uygula()
 
 class OgrenciService:
     """Öğrenci işlemleri servisi"""
     
+    # Yükleme profilleri: her çağıranın ihtiyaç duyduğu ilişkiler tek seferde yüklenir
+    YUKLEME_PROFILLERI = {
+        # Bire bir ilişkiler aynı sorguda JOIN ile gelir; selectinload partiler halinde (yield_per)
+        # okunan dışa aktarmalarda her parti için ek sorgu çalıştırırdı
+        'liste': {'sinif': joinedload},
+        'export': {'sinif': joinedload, 'staj_degerlendirme': joinedload},
+        'staj_raporu': {'sinif': joinedload, 'staj_degerlendirme': joinedload},
+        'normal_donem_raporu': {'sinif': joinedload, 'normal_donem_degerlendirme': joinedload},
+        'detay': {'sinif': joinedload, 'staj_degerlendirme': joinedload, 'normal_donem_degerlendirme': joinedload}
+    }
+    
+    # Sayfalı listelemede izin verilen sıralama anahtarları
+    SIRALAMA_ANAHTARLARI = ('kayit_tarihi', 'ogrenci_no', 'soyad', 'harf_notu')
+    VARSAYILAN_SIRALAMA = '-kayit_tarihi'
+    MAKSIMUM_SAYFA_BOYUTU = 500
+    
+    # Detay sayfasında ilk yüklemede gösterilen son ziyaret sayısı
+    DETAY_ZIYARET_SAYISI = 20
+    
     @staticmethod
-    def tum_ogrencileri_getir(sinif_id=None):
-        """Tüm öğrencileri getir (opsiyonel: sınıf filtresi)"""
+    def ogrenci_sorgusu(sinif_id=None, profil=None):
+        """Öğrenci sorgusunu oluştur (opsiyonel: sınıf filtresi ve yükleme profili)"""
         query = Ogrenci.query
+        if profil:
+            if profil not in OgrenciService.YUKLEME_PROFILLERI:
+                raise ValueError(f"Geçersiz yükleme profili: {profil}")
+            query = query.options(*[
+                yukleyici(getattr(Ogrenci, iliski))
+                for iliski, yukleyici in OgrenciService.YUKLEME_PROFILLERI[profil].items()
+            ])
         if sinif_id:
             query = query.filter_by(sinif_id=sinif_id)
-        return query.order_by(Ogrenci.kayit_tarihi.desc()).all()
+        return query.order_by(Ogrenci.kayit_tarihi.desc())
+    
+    @staticmethod
+    def tum_ogrencileri_getir(sinif_id=None, profil=None, parti_boyutu=None):
+        """Tüm öğrencileri getir (opsiyonel: sınıf filtresi ve yükleme profili)
+        
+        parti_boyutu verilirse liste yerine veritabanından partiler halinde
+        okuyan (yield_per) bir iterator döner.
+        """
+        query = OgrenciService.ogrenci_sorgusu(sinif_id=sinif_id, profil=profil)
+        if parti_boyutu:
+            return query.yield_per(parti_boyutu)
+        return query.all()
+    
+    @staticmethod
+    def _cursor_olustur(deger, kayit_id):
+        """Sıralama değeri ve kayıt ID'sinden sayfa imleci oluştur"""
+        if isinstance(deger, datetime):
+            deger = deger.isoformat()
+        veri = json.dumps([deger, kayit_id]).encode('utf-8')
+        return base64.urlsafe_b64encode(veri).decode('ascii')
+    
+    @staticmethod
+    def _cursor_coz(cursor, anahtar):
+        """Sayfa imlecini (sıralama değeri, kayıt ID) ikilisine çöz"""
+        try:
+            deger, kayit_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+            if anahtar in ('kayit_tarihi', 'tarih'):
+                deger = datetime.fromisoformat(deger)
+            return deger, int(kayit_id)
+        except (ValueError, TypeError):
+            raise ValueError("Geçersiz sayfa imleci (cursor)!")
+    
+    @staticmethod
+    def ogrencileri_sayfala(sinif_id=None, limit=100, cursor=None, siralama=None):
+        """Öğrencileri imleç (keyset) tabanlı sayfalayarak getir
+        
+        Sıralama (sıralama değeri, id) ikilisi üzerinden yapılır; imleç bir önceki
+        sayfanın son satırını gösterir. '-' ön eki azalan sıralama demektir.
+        Dönüş: (ogrenciler, sonraki_cursor)
+        """
+        siralama = siralama or OgrenciService.VARSAYILAN_SIRALAMA
+        azalan = siralama.startswith('-')
+        anahtar = siralama.lstrip('-')
+        if anahtar not in OgrenciService.SIRALAMA_ANAHTARLARI:
+            raise ValueError(f"Geçersiz sıralama anahtarı: {anahtar}")
+        limit = max(1, min(limit, OgrenciService.MAKSIMUM_SAYFA_BOYUTU))
+        
+        query = OgrenciService.ogrenci_sorgusu(sinif_id=sinif_id, profil='liste').order_by(None)
+        if anahtar == 'harf_notu':
+            # Değerlendirmesi olmayan öğrenciler boş harf notuyla sıralanır
+            query = query.outerjoin(StajDegerlendirme, StajDegerlendirme.ogrenci_id == Ogrenci.id)
+            kolon = db.func.coalesce(StajDegerlendirme.harf_notu, '')
+        else:
+            kolon = getattr(Ogrenci, anahtar)
+        
+        if cursor:
+            deger, son_id = OgrenciService._cursor_coz(cursor, anahtar)
+            if azalan:
+                query = query.filter(or_(kolon < deger, and_(kolon == deger, Ogrenci.id < son_id)))
+            else:
+                query = query.filter(or_(kolon > deger, and_(kolon == deger, Ogrenci.id > son_id)))
+        
+        if azalan:
+            query = query.order_by(kolon.desc(), Ogrenci.id.desc())
+        else:
+            query = query.order_by(kolon.asc(), Ogrenci.id.asc())
+        
+        # Sonraki sayfa olup olmadığını anlamak için bir satır fazla çek
+        satirlar = query.add_columns(kolon).limit(limit + 1).all()
+        
+        sonraki_cursor = None
+        if len(satirlar) > limit:
+            satirlar = satirlar[:limit]
+            son_ogrenci, son_deger = satirlar[-1]
+            sonraki_cursor = OgrenciService._cursor_olustur(son_deger, son_ogrenci.id)
+        
+        return [ogrenci for ogrenci, _ in satirlar], sonraki_cursor
+    
+    @staticmethod
+    def ziyaret_sayisi_alt_sorgusu():
+        """Öğrenci başına ziyaret sayısını veren gruplu alt sorgu"""
+        return db.session.query(
+            ZiyaretNotu.ogrenci_id.label('ogrenci_id'),
+            db.func.count(ZiyaretNotu.id).label('ziyaret_sayisi')
+        ).group_by(ZiyaretNotu.ogrenci_id).subquery()
+    
+    @staticmethod
+    def ziyaret_sayilariyla_getir(sinif_id=None, profil=None, parti_boyutu=None):
+        """Öğrencileri ziyaret sayılarıyla birlikte getir: [(ogrenci, ziyaret_sayisi), ...]"""
+        alt_sorgu = OgrenciService.ziyaret_sayisi_alt_sorgusu()
+        query = OgrenciService.ogrenci_sorgusu(sinif_id=sinif_id, profil=profil) \
+            .outerjoin(alt_sorgu, alt_sorgu.c.ogrenci_id == Ogrenci.id) \
+            .add_columns(db.func.coalesce(alt_sorgu.c.ziyaret_sayisi, 0))
+        if parti_boyutu:
+            return query.yield_per(parti_boyutu)
+        return query.all()
     
     @staticmethod
     def ogrenci_getir(ogrenci_id):
         """ID'ye göre öğrenci getir"""
         return Ogrenci.query.get(ogrenci_id)
     
+    @staticmethod
+    def ogrenci_detay_getir(ogrenci_id, ziyaret_limiti=None):
+        """Detay sayfası verilerini iki sorguda getir
+        
+        Öğrenci, sınıfı, iki değerlendirmesi ve toplam ziyaret sayısı tek sorguda;
+        en son ziyaret notları ikinci sorguda okunur. Değerlendirmesi olmayan öğrenci
+        için kaydedilmemiş varsayılan değerlendirme döner. Öğrenci yoksa None döner.
+        """
+        toplam_ziyaret = db.session.query(db.func.count(ZiyaretNotu.id)) \
+            .filter(ZiyaretNotu.ogrenci_id == Ogrenci.id) \
+            .correlate(Ogrenci) \
+            .scalar_subquery()
+        satir = OgrenciService.ogrenci_sorgusu(profil='detay') \
+            .order_by(None) \
+            .filter(Ogrenci.id == ogrenci_id) \
+            .add_columns(toplam_ziyaret) \
+            .first()
+        if not satir:
+            return None
+        ogrenci, toplam_ziyaret = satir
+        
+        ziyaretler, ziyaret_cursor = [], None
+        if toplam_ziyaret:
+            ziyaretler, ziyaret_cursor = ZiyaretService.ziyaretleri_sayfala(
+                ogrenci_id, limit=ziyaret_limiti or OgrenciService.DETAY_ZIYARET_SAYISI
+            )
+        
+        return {
+            'ogrenci': ogrenci,
+            'ziyaretler': ziyaretler,
+            'toplam_ziyaret': toplam_ziyaret,
+            'ziyaret_cursor': ziyaret_cursor,
+            'degerlendirme': ogrenci.staj_degerlendirme
+                or _varsayilanlarla_olustur(StajDegerlendirme, ogrenci_id),
+            'normal_donem': ogrenci.normal_donem_degerlendirme
+                or _varsayilanlarla_olustur(NormalDonemDegerlendirme, ogrenci_id)
+        }
+    
     @staticmethod
     def ogrenci_ekle(ad, soyad, ogrenci_no, telefon=None, sinif_id=None):
         """Yeni öğrenci ekle"""
@@ -24,6 +487,9 @@ class OgrenciService:
         mevcut = Ogrenci.query.filter_by(ogrenci_no=ogrenci_no).first()
         if mevcut:
             raise ValueError(f"Bu öğrenci numarası ({ogrenci_no}) zaten kayıtlı!")
+        # foreign_keys=ON ile bilinmeyen sınıf IntegrityError verir; önce kontrol edilir
+        if sinif_id and not Sinif.query.get(sinif_id):
+            raise ValueError("Sınıf bulunamadı!")
         
         ogrenci = Ogrenci(
             ad=ad,
@@ -33,9 +499,152 @@ class OgrenciService:
             sinif_id=sinif_id
         )
         db.session.add(ogrenci)
+        ozet = OzetFarki()
+        ozet.ogrenci(sinif_id, 1)
+        ozet.uygula()
+        SurumService.artir('ogrenciler')
         db.session.commit()
         return ogrenci
     
+    # Toplu aktarma modları: insert yalnızca yeni öğrencileri ekler, upsert mevcut öğrencilerin
+    # ad, soyad, telefon ve sınıfını da günceller (her ikisi de dry_run ile önizlenebilir)
+    AKTARMA_MODLARI = ('insert', 'upsert')
+    GUNCELLENEBILIR_ALANLAR = ('ad', 'soyad', 'telefon', 'sinif_id')
+    
+    @staticmethod
+    def toplu_ogrenci_aktar(satirlar, mod='insert', dry_run=False, kismi=False, dogrulama_hatalari=(),
+                            parca_boyutu=500, ilerleme=None):
+        """Birden fazla öğrenciyi tek transaction içinde toplu ekle/güncelle
+        
+        satirlar: {'satir': 2, 'ad': ..., 'soyad': ..., 'ogrenci_no': ..., 'telefon': ..., 'sinif_id': ...}
+        sözlüklerinden oluşan herhangi bir iterable (liste ya da üretici).
+        Satırlar parca_boyutu'luk partiler halinde okunur; her partide dosya içi tekrarlar
+        kümelerle, veritabanındaki mevcut öğrenciler tek bir IN sorgusuyla bulunur. Yeni
+        öğrenciler toplu INSERT, değişen öğrenciler (upsert) toplu UPDATE ile yazılır.
+        Bellekte aynı anda tek parti tutulur, en sonda tek COMMIT yapılır. upsert'te
+        değeri boş (None) olan alanlar değiştirilmez. ilerleme verilirse her partiden
+        sonra işlenen satır sayısıyla çağrılır.
+        
+        Satır hataları (satir, mesaj) olarak 'hatalar' altında döner. dogrulama_hatalari, çağıranın
+        satirlar'ı üretirken bulduğu hatalardır (tüm satırlar okunduktan sonra bakılır).
+        Herhangi bir hata varsa hiçbir şey kaydedilmez (rollback); kismi=True ise geçerli
+        satırlar yine de kaydedilir. dry_run'da verilen mod aynen uygulanıp sonunda geri alınır.
+        Dönüş: {'eklenen': [...], 'guncellenen': [...], 'degismeyen': [...],
+        'hatalar': [(satir, mesaj), ...], 'kaydedildi': bool}
+        """
+        if mod not in OgrenciService.AKTARMA_MODLARI:
+            raise ValueError(f"Geçersiz içe aktarma modu: {mod}")
+        
+        rapor = {'eklenen': [], 'guncellenen': [], 'degismeyen': [], 'hatalar': [], 'kaydedildi': False}
+        gorulen = set()
+        ozet = OzetFarki()
+        islenen = 0
+        
+        try:
+            for parca in OgrenciService._partilere_bol(satirlar, parca_boyutu):
+                numaralar = {s['ogrenci_no'] for s in parca}
+                mevcutlar = {
+                    satir.ogrenci_no: satir for satir in db.session.query(
+                        Ogrenci.id, Ogrenci.ogrenci_no, Ogrenci.ad, Ogrenci.soyad, Ogrenci.telefon, Ogrenci.sinif_id
+                    ).filter(Ogrenci.ogrenci_no.in_(numaralar)).all()
+                }
+                sinif_idleri = {satir['sinif_id'] for satir in parca if satir.get('sinif_id')}
+                mevcut_siniflar = {
+                    sinif_id for (sinif_id,) in db.session.query(Sinif.id).filter(Sinif.id.in_(sinif_idleri)).all()
+                } if sinif_idleri else set()
+                
+                yeni_satirlar = []
+                guncellemeler = []
+                for satir in parca:
+                    ogrenci_no = satir['ogrenci_no']
+                    mevcut = mevcutlar.get(ogrenci_no)
+                    
+                    # Önceki partilerde eklenenler de mevcutlar arasında döner; önce dosya içi tekrar kontrol edilir
+                    if ogrenci_no in gorulen:
+                        rapor['hatalar'].append((satir['satir'], f"Bu öğrenci numarası ({ogrenci_no}) dosyada birden fazla kez geçiyor!"))
+                        continue
+                    gorulen.add(ogrenci_no)
+                    
+                    if satir.get('sinif_id') and satir['sinif_id'] not in mevcut_siniflar:
+                        rapor['hatalar'].append((satir['satir'], f"Sınıf bulunamadı: {satir['sinif_id']}"))
+                        continue
+                    
+                    if mevcut is None:
+                        yeni = {'ogrenci_no': ogrenci_no}
+                        yeni.update({alan: satir.get(alan) for alan in OgrenciService.GUNCELLENEBILIR_ALANLAR})
+                        yeni_satirlar.append(yeni)
+                        rapor['eklenen'].append(dict(yeni, satir=satir['satir']))
+                    elif mod == 'insert':
+                        rapor['hatalar'].append((satir['satir'], f"Bu öğrenci numarası ({ogrenci_no}) zaten kayıtlı!"))
+                    else:
+                        degisiklikler = {
+                            alan: {'eski': getattr(mevcut, alan), 'yeni': satir[alan]}
+                            for alan in OgrenciService.GUNCELLENEBILIR_ALANLAR
+                            if satir.get(alan) is not None and satir[alan] != getattr(mevcut, alan)
+                        }
+                        if degisiklikler:
+                            guncelleme = {'id': mevcut.id}
+                            guncelleme.update({alan: deger['yeni'] for alan, deger in degisiklikler.items()})
+                            guncellemeler.append(guncelleme)
+                            rapor['guncellenen'].append({
+                                'satir': satir['satir'], 'ogrenci_no': ogrenci_no, 'degisiklikler': degisiklikler
+                            })
+                        else:
+                            rapor['degismeyen'].append({'satir': satir['satir'], 'ogrenci_no': ogrenci_no})
+                
+                if not dry_run:
+                    OgrenciService._aktarma_ozet_farki(ozet, yeni_satirlar, guncellemeler, mevcutlar)
+                    # Core INSERT: ORM toplu ekleme None alanlara göre satırları ayrı ifadelere böler
+                    if yeni_satirlar:
+                        db.session.execute(insert(Ogrenci.__table__), yeni_satirlar)
+                    # ORM birincil anahtarla toplu UPDATE (aynı alanları değişen satırlar tek ifadede)
+                    if guncellemeler:
+                        db.session.execute(update(Ogrenci), guncellemeler)
+                
+                islenen += len(parca)
+                if ilerleme:
+                    ilerleme(islenen)
+            
+            if dry_run or ((rapor['hatalar'] or dogrulama_hatalari) and not kismi):
+                db.session.rollback()
+            else:
+                if rapor['eklenen'] or rapor['guncellenen']:
+                    ozet.uygula()
+                    SurumService.artir('ogrenciler')
+                db.session.commit()
+                rapor['kaydedildi'] = True
+        except Exception:
+            db.session.rollback()
+            raise
+        
+        return rapor
+    
+    @staticmethod
+    def _aktarma_ozet_farki(ozet, yeni_satirlar, guncellemeler, mevcutlar):
+        """Bir partinin sınıf özetine etkisini ekle: yeni öğrenciler sayılır, sınıfı
+        değişen öğrencilerin tüm katkısı eski sınıftan yenisine taşınır (yazmadan önce çağrılır)"""
+        for yeni in yeni_satirlar:
+            ozet.ogrenci(yeni['sinif_id'], 1)
+        
+        eski_siniflar = {m.id: m.sinif_id for m in mevcutlar.values()}
+        tasinanlar = {g['id']: g['sinif_id'] for g in guncellemeler if 'sinif_id' in g}
+        if tasinanlar:
+            for ogrenci_id, katki in OzetService.ogrenci_katkilari(tasinanlar).items():
+                ozet.ogrenci(eski_siniflar[ogrenci_id], -1, **katki)
+                ozet.ogrenci(tasinanlar[ogrenci_id], 1, **katki)
+    
+    @staticmethod
+    def _partilere_bol(satirlar, parca_boyutu):
+        """Iterable'ı en fazla parca_boyutu elemanlı listeler halinde üret"""
+        parca = []
+        for satir in satirlar:
+            parca.append(satir)
+            if len(parca) >= parca_boyutu:
+                yield parca
+                parca = []
+        if parca:
+            yield parca
+    
     @staticmethod
     def ogrenci_guncelle(ogrenci_id, ad=None, soyad=None, telefon=None, sinif_id=None):
         """Öğrenci bilgilerini güncelle"""
@@ -43,6 +652,7 @@ class OgrenciService:
         if not ogrenci:
             raise ValueError("Öğrenci bulunamadı!")
         
+        eski_sinif_id = ogrenci.sinif_id
         if ad:
             ogrenci.ad = ad
         if soyad:
@@ -50,25 +660,193 @@ class OgrenciService:
         if telefon is not None:
             ogrenci.telefon = telefon
         if sinif_id is not None:
+            if sinif_id and not Sinif.query.get(sinif_id):
+                raise ValueError("Sınıf bulunamadı!")
             ogrenci.sinif_id = sinif_id if sinif_id else None
         
+        if ogrenci.sinif_id != eski_sinif_id:
+            # Öğrencinin ziyaret ve not katkısı da yeni sınıfa taşınır
+            katki = OzetService.ogrenci_katkilari([ogrenci_id])[ogrenci_id]
+            ozet = OzetFarki()
+            ozet.ogrenci(eski_sinif_id, -1, **katki)
+            ozet.ogrenci(ogrenci.sinif_id, 1, **katki)
+            ozet.uygula()
+        SurumService.artir('ogrenciler')
         db.session.commit()
         return ogrenci
     
     @staticmethod
     def ogrenci_sil(ogrenci_id):
         """Öğrenciyi sil"""
-        ogrenci = Ogrenci.query.get(ogrenci_id)
+        ogrenci = db.session.query(Ogrenci.id, Ogrenci.sinif_id).filter(Ogrenci.id == ogrenci_id).first()
         if not ogrenci:
             raise ValueError("Öğrenci bulunamadı!")
         
-        db.session.delete(ogrenci)
+        OgrenciService._ogrencileri_sil({ogrenci.id: ogrenci.sinif_id})
+        SurumService.artir('ogrenciler', 'ziyaret_notlari', 'staj_degerlendirme', 'normal_donem_degerlendirme')
         db.session.commit()
         return True
+    
+    @staticmethod
+    def toplu_ogrenci_sil(ogrenci_idleri=None, sinif_id=None):
+        """Öğrenci listesini ya da bir sınıfın tüm öğrencilerini tek transaction içinde sil
+        
+        Öğrenciler IN sorgularıyla parça parça silinir; ziyaret notları ve değerlendirmeler
+        veritabanında ON DELETE CASCADE ile silinir, hiçbiri belleğe yüklenmez.
+        Dönüş: {'silinen': sayı, 'bulunamayan': [ogrenci_id, ...]}
+        """
+        if (ogrenci_idleri is None) == (sinif_id is None):
+            raise ValueError("Öğrenci listesi (ogrenci_idleri) ya da sınıf (sinif_id) gerekli!")
+        
+        bulunamayan = []
+        if sinif_id is not None:
+            if not Sinif.query.get(sinif_id):
+                raise ValueError("Sınıf bulunamadı!")
+            ogrenciler = dict(
+                db.session.query(Ogrenci.id, Ogrenci.sinif_id).filter(Ogrenci.sinif_id == sinif_id).all()
+            )
+        else:
+            try:
+                idler = {int(ogrenci_id) for ogrenci_id in ogrenci_idleri}
+            except (ValueError, TypeError):
+                raise ValueError("Geçersiz öğrenci ID!")
+            ogrenciler = {}
+            for parca in _parcalara_bol(idler):
+                ogrenciler.update(db.session.query(Ogrenci.id, Ogrenci.sinif_id).filter(Ogrenci.id.in_(parca)).all())
+            bulunamayan = sorted(idler - set(ogrenciler))
+        
+        if ogrenciler:
+            try:
+                OgrenciService._ogrencileri_sil(ogrenciler)
+                SurumService.artir('ogrenciler', 'ziyaret_notlari', 'staj_degerlendirme', 'normal_donem_degerlendirme')
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+        
+        return {'silinen': len(ogrenciler), 'bulunamayan': bulunamayan}
+    
+    @staticmethod
+    def _ogrencileri_sil(ogrenciler):
+        """Öğrencileri sil; alt kayıtlar CASCADE ile silinir, sınıf özetleri ve arama
+        indeksi aynı transaction içinde güncellenir (commit çağıran serviste yapılır)
+        
+        ogrenciler: {ogrenci_id: sinif_id}
+        """
+        ozet = OzetFarki()
+        for ogrenci_id, katki in OzetService.ogrenci_katkilari(ogrenciler).items():
+            ozet.ogrenci(ogrenciler[ogrenci_id], -1, **katki)
+        ozet.uygula()
+        
+        for parca in _parcalara_bol(ogrenciler):
+            ZiyaretService._ogrenci_notlarini_aramadan_sil(parca)
+            db.session.query(Ogrenci).filter(Ogrenci.id.in_(parca)).delete(synchronize_session=False)
 
 class ZiyaretService:
     """Ziyaret notu işlemleri servisi"""
     
+    # FTS5 arama tablosu (migrasyon 2); rowid ziyaret notunun id'sidir
+    ARAMA_TABLOSU = 'ziyaret_notlari_fts'
+    ARAMA_SAYFA_BOYUTU = 20
+    
+    @staticmethod
+    def _arama_indeksine_ekle(ziyaret):
+        """Ziyaret notunu arama indeksine ekle (commit çağıran serviste yapılır)"""
+        db.session.execute(
+            text(f"INSERT INTO {ZiyaretService.ARAMA_TABLOSU} (rowid, not_metni, ogretmen_adi) "
+                 "VALUES (:id, :not_metni, :ogretmen_adi)"),
+            {'id': ziyaret.id, 'not_metni': ziyaret.not_metni, 'ogretmen_adi': ziyaret.ogretmen_adi}
+        )
+    
+    @staticmethod
+    def _arama_indeksinden_sil(ziyaret_idleri):
+        """Ziyaret notlarını arama indeksinden çıkar (commit çağıran serviste yapılır)"""
+        ifade = text(f"DELETE FROM {ZiyaretService.ARAMA_TABLOSU} WHERE rowid IN :idler") \
+            .bindparams(bindparam('idler', expanding=True))
+        for parca in _parcalara_bol(ziyaret_idleri):
+            db.session.execute(ifade, {'idler': parca})
+    
+    @staticmethod
+    def _ogrenci_notlarini_aramadan_sil(ogrenci_idleri):
+        """Öğrencilerin tüm ziyaret notlarını arama indeksinden çıkar (notlar silinmeden önce çağrılır)"""
+        ifade = text(
+            f"DELETE FROM {ZiyaretService.ARAMA_TABLOSU} WHERE rowid IN "
+            "(SELECT id FROM ziyaret_notlari WHERE ogrenci_id IN :idler)"
+        ).bindparams(bindparam('idler', expanding=True))
+        for parca in _parcalara_bol(ogrenci_idleri):
+            db.session.execute(ifade, {'idler': parca})
+    
+    @staticmethod
+    def arama_indeksini_yeniden_olustur():
+        """Arama indeksini ziyaret_notlari tablosundan baştan oluştur
+        
+        Servis dışından (ör. toplu veri yükleme scriptleri) eklenen notlar için kullanılır.
+        """
+        db.session.execute(text(f"DELETE FROM {ZiyaretService.ARAMA_TABLOSU}"))
+        db.session.execute(text(
+            f"INSERT INTO {ZiyaretService.ARAMA_TABLOSU} (rowid, not_metni, ogretmen_adi) "
+            "SELECT id, not_metni, ogretmen_adi FROM ziyaret_notlari"
+        ))
+        db.session.commit()
+    
+    @staticmethod
+    def _arama_ifadesi(sorgu):
+        """Kullanıcı metnini güvenli bir FTS5 sorgusuna çevir
+        
+        Her kelime tırnak içine alınır (FTS5 operatörleri yorumlanmaz) ve önek olarak
+        aranır; kelimelerin hepsi notta geçmelidir: 'abc yazıl' -> "abc"* "yazıl"*
+        """
+        kelimeler = [k.replace('"', '""') for k in sorgu.split()]
+        if not kelimeler:
+            raise ValueError("Arama metni gerekli!")
+        return ' '.join(f'"{kelime}"*' for kelime in kelimeler)
+    
+    @staticmethod
+    def ziyaret_ara(sorgu, limit=None, cursor=None):
+        """Tüm ziyaret notlarında tam metin arama yap
+        
+        Sonuçlar bm25 skoruna göre (en alakalıdan başlayarak) sıralanır ve (skor, id)
+        ikilisi üzerinden sayfalanır. Dönüş: ([(ziyaret, ozet, skor), ...], sonraki_cursor)
+        ozet, eşleşen kelimeleri <mark> ile işaretlenmiş kısa metin parçasıdır.
+        """
+        limit = max(1, min(limit or ZiyaretService.ARAMA_SAYFA_BOYUTU, OgrenciService.MAKSIMUM_SAYFA_BOYUTU))
+        parametreler = {'ifade': ZiyaretService._arama_ifadesi(sorgu), 'limit': limit + 1}
+        
+        kosul = ''
+        if cursor:
+            parametreler['skor'], parametreler['son_id'] = OgrenciService._cursor_coz(cursor, 'skor')
+            kosul = "AND (skor > :skor OR (skor = :skor AND rowid > :son_id))"
+        
+        tablo = ZiyaretService.ARAMA_TABLOSU
+        satirlar = db.session.execute(text(f"""
+            SELECT * FROM (
+                SELECT rowid, bm25({tablo}) AS skor,
+                       snippet({tablo}, 0, '<mark>', '</mark>', '…', 16) AS ozet
+                FROM {tablo}
+                WHERE {tablo} MATCH :ifade
+            )
+            WHERE 1 = 1 {kosul}
+            ORDER BY skor, rowid
+            LIMIT :limit
+        """), parametreler).all()
+        
+        sonraki_cursor = None
+        if len(satirlar) > limit:
+            satirlar = satirlar[:limit]
+            sonraki_cursor = OgrenciService._cursor_olustur(satirlar[-1].skor, satirlar[-1].rowid)
+        
+        # Notları öğrenci ve sınıf bilgileriyle tek sorguda yükle
+        ziyaretler = {
+            z.id: z for z in ZiyaretNotu.query
+            .options(joinedload(ZiyaretNotu.ogrenci).joinedload(Ogrenci.sinif))
+            .filter(ZiyaretNotu.id.in_([satir.rowid for satir in satirlar]))
+        }
+        sonuclar = [
+            (ziyaretler[satir.rowid], satir.ozet, satir.skor)
+            for satir in satirlar if satir.rowid in ziyaretler
+        ]
+        return sonuclar, sonraki_cursor
+    
     @staticmethod
     def ziyaret_notu_ekle(ogrenci_id, not_metni, ogretmen_adi=None):
         """Yeni ziyaret notu ekle"""
@@ -82,6 +860,12 @@ class ZiyaretService:
             ogretmen_adi=ogretmen_adi
         )
         db.session.add(ziyaret)
+        db.session.flush()
+        ZiyaretService._arama_indeksine_ekle(ziyaret)
+        ozet = OzetFarki()
+        ozet.ekle(ogrenci.sinif_id, ziyaret_sayisi=1)
+        ozet.uygula()
+        SurumService.artir('ziyaret_notlari')
         db.session.commit()
         return ziyaret
     
@@ -90,6 +874,33 @@ class ZiyaretService:
         """Öğrencinin tüm ziyaret notlarını getir"""
         return ZiyaretNotu.query.filter_by(ogrenci_id=ogrenci_id).order_by(ZiyaretNotu.tarih.desc()).all()
     
+    @staticmethod
+    def ziyaretleri_sayfala(ogrenci_id, limit=20, cursor=None):
+        """Öğrencinin ziyaret notlarını en yeniden eskiye sayfalayarak getir
+        
+        Sıralama (tarih, id) ikilisi üzerinden yapılır ve (ogrenci_id, tarih) indeksini
+        kullanır. Dönüş: (ziyaretler, sonraki_cursor)
+        """
+        limit = max(1, min(limit, OgrenciService.MAKSIMUM_SAYFA_BOYUTU))
+        query = ZiyaretNotu.query.filter(ZiyaretNotu.ogrenci_id == ogrenci_id)
+        
+        if cursor:
+            tarih, son_id = OgrenciService._cursor_coz(cursor, 'tarih')
+            query = query.filter(or_(
+                ZiyaretNotu.tarih < tarih,
+                and_(ZiyaretNotu.tarih == tarih, ZiyaretNotu.id < son_id)
+            ))
+        
+        # Sonraki sayfa olup olmadığını anlamak için bir satır fazla çek
+        ziyaretler = query.order_by(ZiyaretNotu.tarih.desc(), ZiyaretNotu.id.desc()).limit(limit + 1).all()
+        
+        sonraki_cursor = None
+        if len(ziyaretler) > limit:
+            ziyaretler = ziyaretler[:limit]
+            sonraki_cursor = OgrenciService._cursor_olustur(ziyaretler[-1].tarih, ziyaretler[-1].id)
+        
+        return ziyaretler, sonraki_cursor
+    
     @staticmethod
     def ziyaret_sil(ziyaret_id):
         """Ziyaret notunu sil"""
@@ -97,28 +908,42 @@ class ZiyaretService:
         if not ziyaret:
             raise ValueError("Ziyaret notu bulunamadı!")
         
+        ZiyaretService._arama_indeksinden_sil([ziyaret.id])
+        if ziyaret.ogrenci:
+            ozet = OzetFarki()
+            ozet.ekle(ziyaret.ogrenci.sinif_id, ziyaret_sayisi=-1)
+            ozet.uygula()
         db.session.delete(ziyaret)
+        SurumService.artir('ziyaret_notlari')
         db.session.commit()
         return True
 
 class DegerlendirmeService:
     """Staj değerlendirme işlemleri servisi"""
     
+    # Toplu not girişinde kabul edilen kriterler
+    KRITERLER = (
+        'ziyaretci_ogretim_elemani_notu', 'isyeren_notu', 'icindekiler', 'firma_bilgisi',
+        'yazim_duzeni', 'resim_sekil', 'dil_kullanimi', 'sonuc_bolumu', 'defter_duzeni_mulakat'
+    )
+    
     @staticmethod
     def degerlendirme_getir(ogrenci_id):
-        """Öğrencinin staj değerlendirmesini getir"""
+        """Öğrencinin staj değerlendirmesini getir
+        
+        Kayıt yoksa varsayılan değerlerle kaydedilmemiş bir nesne döner (id None);
+        veritabanına yazılmaz.
+        """
         degerlendirme = StajDegerlendirme.query.filter_by(ogrenci_id=ogrenci_id).first()
         if not degerlendirme:
-            # Yoksa yeni oluştur
-            degerlendirme = StajDegerlendirme(ogrenci_id=ogrenci_id)
-            db.session.add(degerlendirme)
-            db.session.commit()
+            degerlendirme = _varsayilanlarla_olustur(StajDegerlendirme, ogrenci_id)
         return degerlendirme
     
     @staticmethod
     def degerlendirme_guncelle(ogrenci_id, **kriterler):
         """Staj değerlendirmesini güncelle"""
-        degerlendirme = DegerlendirmeService.degerlendirme_getir(ogrenci_id)
+        degerlendirme = _yazmak_icin_getir(StajDegerlendirme, ogrenci_id)
+        onceki = OzetFarki.durum(degerlendirme)
         
         # Kriterleri güncelle
         for key, value in kriterler.items():
@@ -128,27 +953,67 @@ class DegerlendirmeService:
         # Toplam ve harf notunu hesapla
         degerlendirme.hesapla_toplam()
         
+        _degerlendirme_ozetine_yaz(degerlendirme, onceki)
+        SurumService.artir('staj_degerlendirme')
         db.session.commit()
         return degerlendirme
+    
+    @staticmethod
+    def _kriterleri_uygula(degerlendirme, kriterler):
+        """Kriterleri doğrulayıp uygula ve toplamı hesapla
+        
+        Geçersiz bir değer varsa hiçbir kriter değiştirilmeden ValueError fırlatılır.
+        """
+        degerler = {}
+        for key, value in kriterler.items():
+            if key in DegerlendirmeService.KRITERLER and value is not None:
+                try:
+                    degerler[key] = float(value)
+                except (ValueError, TypeError):
+                    raise ValueError(f"Geçersiz değer: {key}={value}")
+        
+        for key, value in degerler.items():
+            setattr(degerlendirme, key, value)
+        degerlendirme.hesapla_toplam()
+    
+    @staticmethod
+    def toplu_guncelle(kayitlar):
+        """Birden fazla öğrencinin staj değerlendirmesini tek transaction içinde güncelle"""
+        return _toplu_degerlendirme_guncelle(
+            StajDegerlendirme, kayitlar, DegerlendirmeService._kriterleri_uygula
+        )
 
 class NormalDonemService:
     """Normal dönem değerlendirme işlemleri servisi"""
     
+    # Toplu not girişinde kabul edilen kriterler
+    KRITERLER = (
+        'vize_notu', 'vize_odev_puani', 'vize_odev_yuzdesi',
+        'final_notu', 'final_odev_puani', 'final_odev_yuzdesi',
+        'devamsizlik_durumu',
+        'butunleme_notu', 'butunleme_odev_puani', 'butunleme_odev_yuzdesi'
+    )
+    
+    # Toplu not girişinde devamsizlik_durumu için kabul edilen metin değerleri
+    MANTIKSAL_DEGERLER = {'true': True, 'false': False, '1': True, '0': False}
+    
     @staticmethod
     def degerlendirme_getir(ogrenci_id):
-        """Öğrencinin normal dönem değerlendirmesini getir"""
+        """Öğrencinin normal dönem değerlendirmesini getir
+        
+        Kayıt yoksa varsayılan değerlerle kaydedilmemiş bir nesne döner (id None);
+        veritabanına yazılmaz.
+        """
         degerlendirme = NormalDonemDegerlendirme.query.filter_by(ogrenci_id=ogrenci_id).first()
         if not degerlendirme:
-            # Yoksa yeni oluştur
-            degerlendirme = NormalDonemDegerlendirme(ogrenci_id=ogrenci_id)
-            db.session.add(degerlendirme)
-            db.session.commit()
+            degerlendirme = _varsayilanlarla_olustur(NormalDonemDegerlendirme, ogrenci_id)
         return degerlendirme
     
     @staticmethod
     def degerlendirme_guncelle(ogrenci_id, **kriterler):
         """Normal dönem değerlendirmesini güncelle"""
-        degerlendirme = NormalDonemService.degerlendirme_getir(ogrenci_id)
+        degerlendirme = _yazmak_icin_getir(NormalDonemDegerlendirme, ogrenci_id)
+        onceki = OzetFarki.durum(degerlendirme)
         
         # Kriterleri güncelle
         for key, value in kriterler.items():
@@ -169,8 +1034,53 @@ class NormalDonemService:
         # Tüm notları hesapla
         degerlendirme.hesapla_tum_notlar()
         
+        _degerlendirme_ozetine_yaz(degerlendirme, onceki)
+        SurumService.artir('normal_donem_degerlendirme')
         db.session.commit()
         return degerlendirme
+    
+    @staticmethod
+    def _kriterleri_uygula(degerlendirme, kriterler):
+        """Kriterleri doğrulayıp uygula ve tüm notları hesapla
+        
+        Boş bırakılan alanlar değiştirilmez. Geçersiz bir değer varsa hiçbir kriter
+        değiştirilmeden ValueError fırlatılır.
+        """
+        degerler = {}
+        for key, value in kriterler.items():
+            if key not in NormalDonemService.KRITERLER:
+                continue
+            if key == 'devamsizlik_durumu':
+                degerler[key] = NormalDonemService._mantiksal_deger(key, value)
+            elif value is not None and value != '':
+                try:
+                    degerler[key] = float(value)
+                except (ValueError, TypeError):
+                    raise ValueError(f"Geçersiz değer: {key}={value}")
+        
+        for key, value in degerler.items():
+            setattr(degerlendirme, key, value)
+        degerlendirme.hesapla_tum_notlar()
+    
+    @staticmethod
+    def _mantiksal_deger(key, value):
+        """true/false, 1/0 (metin ya da sayı) değerini bool'a çevir; None False sayılır"""
+        if value is None:
+            return False
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, (int, float)) and value in (0, 1):
+            return bool(value)
+        if isinstance(value, str) and value.strip().lower() in NormalDonemService.MANTIKSAL_DEGERLER:
+            return NormalDonemService.MANTIKSAL_DEGERLER[value.strip().lower()]
+        raise ValueError(f"Geçersiz değer: {key}={value}")
+    
+    @staticmethod
+    def toplu_guncelle(kayitlar):
+        """Birden fazla öğrencinin normal dönem değerlendirmesini tek transaction içinde güncelle"""
+        return _toplu_degerlendirme_guncelle(
+            NormalDonemDegerlendirme, kayitlar, NormalDonemService._kriterleri_uygula
+        )
 
 class SinifService:
     """Sınıf işlemleri servisi"""
@@ -195,6 +1105,7 @@ class SinifService:
         
         sinif = Sinif(ad=ad)
         db.session.add(sinif)
+        SurumService.artir('siniflar')
         db.session.commit()
         return sinif
     
@@ -211,6 +1122,7 @@ class SinifService:
             raise ValueError(f"Bu sınıf adı ({ad}) zaten başka bir sınıfta kullanılıyor!")
         
         sinif.ad = ad
+        SurumService.artir('siniflar')
         db.session.commit()
         return sinif
     
@@ -226,7 +1138,89 @@ class SinifService:
         if ogrenci_sayisi > 0:
             raise ValueError(f"Bu sınıfta {ogrenci_sayisi} öğrenci bulunuyor. Önce öğrencileri başka sınıfa taşıyın veya silin!")
         
+        # Öğrencisi kalmayan sınıfın (sıfırlanmış) özet satırları da silinir
+        SinifOzet.query.filter_by(sinif_id=sinif_id).delete()
+        SinifHarfOzet.query.filter_by(sinif_id=sinif_id).delete()
         db.session.delete(sinif)
+        SurumService.artir('siniflar')
         db.session.commit()
         return True
 
+
+class IstatistikService:
+    """İstatistik işlemleri servisi"""
+    
+    @staticmethod
+    def _sinif_id(ozet_sinif_id):
+        # Özet tablolarında sınıfsız öğrenciler 0 ile tutulur
+        return ozet_sinif_id or None
+    
+    @staticmethod
+    def _ortalama(toplam, sayi):
+        return round(toplam / sayi, 2) if sayi else None
+    
+    @staticmethod
+    def ozet_getir(sinif_id=None):
+        """Öğrenci, değerlendirme ve ziyaret toplamlarını getir (opsiyonel: sınıf filtresi)
+        
+        Sayılar her istekte yeniden sayılmaz, yazma işlemlerinde güncel tutulan
+        sinif_ozet tablosundan okunur; genel toplamlar sınıf satırlarının toplamıdır.
+        """
+        sorgu = SinifOzet.query.filter(SinifOzet.ogrenci_sayisi > 0)
+        if sinif_id:
+            sorgu = sorgu.filter(SinifOzet.sinif_id == sinif_id)
+        ozetler = sorgu.order_by(SinifOzet.sinif_id).all()
+        
+        sinif_listesi = [
+            {
+                'sinif_id': IstatistikService._sinif_id(o.sinif_id),
+                'ogrenci_sayisi': o.ogrenci_sayisi,
+                'degerlendirilen': o.staj_degerlendirilen,
+                'ziyaret_sayisi': o.ziyaret_sayisi,
+                'staj_ortalamasi': IstatistikService._ortalama(o.staj_toplam_toplami, o.staj_degerlendirilen)
+            }
+            for o in ozetler
+        ]
+        degerlendirilen = sum(o.staj_degerlendirilen for o in ozetler)
+        return {
+            'toplam_ogrenci': sum(o.ogrenci_sayisi for o in ozetler),
+            'degerlendirilen': degerlendirilen,
+            'toplam_ziyaret': sum(o.ziyaret_sayisi for o in ozetler),
+            'staj_ortalamasi': IstatistikService._ortalama(sum(o.staj_toplam_toplami for o in ozetler), degerlendirilen),
+            'siniflar': sinif_listesi
+        }
+    
+    # Harf notu istatistiklerinde kullanılabilen değerlendirme türleri
+    DEGERLENDIRME_TURLERI = {
+        'staj': StajDegerlendirme,
+        'normal_donem': NormalDonemDegerlendirme
+    }
+    
+    @staticmethod
+    def harf_notu_dagilimi(tur='staj', sinif_id=None, sinif_bazinda=False):
+        """Harf notu dağılımını sinif_harf_ozet tablosundan getir
+        
+        sinif_bazinda=True ise genel dağılımın yanında sınıf bazındaki dağılımlar da döner.
+        Dönüş: {'harf_notlari': {...}, 'siniflar': [{'sinif_id', 'harf_notlari'}, ...]}
+        """
+        if tur not in IstatistikService.DEGERLENDIRME_TURLERI:
+            raise ValueError(f"Geçersiz değerlendirme türü: {tur}")
+        
+        sorgu = db.session.query(SinifHarfOzet.sinif_id, SinifHarfOzet.harf_notu, SinifHarfOzet.sayi) \
+            .filter(SinifHarfOzet.tur == tur, SinifHarfOzet.sayi > 0)
+        if sinif_id:
+            sorgu = sorgu.filter(SinifHarfOzet.sinif_id == sinif_id)
+        
+        harf_notlari = {}
+        siniflar = {}
+        for grup_sinif_id, harf_notu, sayi in sorgu.order_by(SinifHarfOzet.sinif_id, SinifHarfOzet.harf_notu):
+            harf_notlari[harf_notu] = harf_notlari.get(harf_notu, 0) + sayi
+            if sinif_bazinda:
+                grup_sinif_id = IstatistikService._sinif_id(grup_sinif_id)
+                sinif = siniflar.setdefault(grup_sinif_id, {'sinif_id': grup_sinif_id, 'harf_notlari': {}})
+                sinif['harf_notlari'][harf_notu] = sayi
+        
+        sonuc = {'harf_notlari': harf_notlari}
+        if sinif_bazinda:
+            sonuc['siniflar'] = list(siniflar.values())
+        return sonuc
@@ -0,0 +1,39 @@
+"""
+Sınıf özet tabloları bakım scripti
+sinif_ozet ve sinif_harf_ozet tabloları yazma işlemlerinde farklarla güncel tutulur.
+Bu script tabloları kaynak tablolardan baştan oluşturur ya da tam bir yeniden
+sayımla karşılaştırır (tutarsızlık varsa 1 çıkış koduyla sonlanır).
+
+Kullanım:
+    python sinif_ozeti.py kontrol             # özetleri yeniden sayımla karşılaştır
+    python sinif_ozeti.py yeniden-olustur     # özetleri baştan oluştur
+"""
+import argparse
+import sys
+from app import create_app
+from services.staj_service import OzetService
+
+def main():
+    parser = argparse.ArgumentParser(description="Sınıf özet tabloları bakımı")
+    parser.add_argument('komut', choices=['kontrol', 'yeniden-olustur'], help="Çalıştırılacak işlem")
+    args = parser.parse_args()
+    
+    app = create_app()
+    with app.app_context():
+        if args.komut == 'yeniden-olustur':
+            OzetService.yeniden_olustur()
+            print("✅ Sınıf özetleri yeniden oluşturuldu")
+            return 0
+        
+        farklar = OzetService.tutarlilik_kontrolu()
+        if not farklar:
+            print("✅ Sınıf özetleri yeniden sayımla tutarlı")
+            return 0
+        
+        print(f"❌ {len(farklar)} tutarsızlık bulundu (düzeltmek için: python sinif_ozeti.py yeniden-olustur)")
+        for fark in farklar:
+            print(f"   - {fark['tablo']} {fark['anahtar']}: özet={fark['ozet']} sayım={fark['sayim']}")
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
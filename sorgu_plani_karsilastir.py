@@ -0,0 +1,111 @@
+"""
+Sorgu planı karşılaştırma scripti
+İndekssiz (eski) şema ile migrasyonlar uygulanmış şema üzerinde sık kullanılan
+sorguların planlarını (EXPLAIN QUERY PLAN) ve sürelerini karşılaştırır.
+
+Kullanım:
+    python sorgu_plani_karsilastir.py [ogrenci_sayisi]
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, select, text, insert
+from database import db
+from models import Ogrenci, ZiyaretNotu, Sinif
+from migrations import migrasyonlari_uygula
+
+SINIF_SAYISI = 40
+OGRENCI_BASINA_ZIYARET = 3
+TEKRAR = 20
+
+def ornek_veri_olustur(engine, ogrenci_sayisi):
+    """İndekssiz eski şemayı oluştur ve örnek verilerle doldur"""
+    db.metadata.create_all(engine)
+    
+    with engine.begin() as baglanti:
+        # Eski bir üretim veritabanını taklit etmek için migrasyon indekslerini kaldır
+        for tablo in db.metadata.sorted_tables:
+            for indeks in tablo.indexes:
+                baglanti.execute(text(f"DROP INDEX IF EXISTS {indeks.name}"))
+        baglanti.execute(text("PRAGMA user_version = 0"))
+        
+        baglanti.execute(insert(Sinif.__table__), [{'ad': f"Sınıf {i + 1}"} for i in range(SINIF_SAYISI)])
+        
+        simdi = datetime.utcnow()
+        baglanti.execute(insert(Ogrenci.__table__), [
+            {
+                'ad': f"Ad{i}",
+                'soyad': f"Soyad{i}",
+                'ogrenci_no': f"{20000000 + i}",
+                'sinif_id': i % SINIF_SAYISI + 1,
+                'kayit_tarihi': simdi - timedelta(minutes=i)
+            }
+            for i in range(ogrenci_sayisi)
+        ])
+        
+        baglanti.execute(insert(ZiyaretNotu.__table__), [
+            {
+                'ogrenci_id': i % ogrenci_sayisi + 1,
+                'not_metni': "Staj yerine ziyaret yapıldı.",
+                'tarih': simdi - timedelta(hours=i)
+            }
+            for i in range(ogrenci_sayisi * OGRENCI_BASINA_ZIYARET)
+        ])
+
+def sorgular(ogrenci_sayisi):
+    """Karşılaştırılacak sorgular (servislerin ürettiği sorgularla aynı biçimde)"""
+    return {
+        'Sınıfa göre öğrenci listesi': select(Ogrenci)
+            .where(Ogrenci.sinif_id == SINIF_SAYISI // 2)
+            .order_by(Ogrenci.kayit_tarihi.desc()),
+        'Varsayılan sıralamayla ilk sayfa': select(Ogrenci)
+            .order_by(Ogrenci.kayit_tarihi.desc(), Ogrenci.id.desc())
+            .limit(100),
+        'Öğrencinin ziyaret notları': select(ZiyaretNotu)
+            .where(ZiyaretNotu.ogrenci_id == ogrenci_sayisi // 2)
+            .order_by(ZiyaretNotu.tarih.desc()),
+    }
+
+def olc(engine, ifade):
+    """Sorgu planını ve ortalama süresini (ms) getir"""
+    sql = str(ifade.compile(engine, compile_kwargs={'literal_binds': True}))
+    with engine.connect() as baglanti:
+        plan = [satir[-1] for satir in baglanti.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+        
+        baslangic = time.perf_counter()
+        for _ in range(TEKRAR):
+            baglanti.execute(text(sql)).fetchall()
+        sure = (time.perf_counter() - baslangic) / TEKRAR * 1000
+    
+    return plan, sure
+
+def sorgu_planlarini_karsilastir(ogrenci_sayisi=20000):
+    """Migrasyon öncesi ve sonrası sorgu planlarını karşılaştır"""
+    dosya = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+    dosya.close()
+    engine = create_engine(f"sqlite:///{dosya.name}")
+    
+    try:
+        print(f"📚 {ogrenci_sayisi} öğrenci ile örnek veritabanı oluşturuluyor...\n")
+        ornek_veri_olustur(engine, ogrenci_sayisi)
+        
+        onceki = {ad: olc(engine, ifade) for ad, ifade in sorgular(ogrenci_sayisi).items()}
+        uygulananlar = migrasyonlari_uygula(engine)
+        sonraki = {ad: olc(engine, ifade) for ad, ifade in sorgular(ogrenci_sayisi).items()}
+        
+        print(f"✅ Uygulanan migrasyonlar: {', '.join(f'{s} ({a})' for s, a in uygulananlar)}\n")
+        
+        for ad in onceki:
+            print("=" * 60)
+            print(f"🔎 {ad}")
+            print(f"   Önce  ({onceki[ad][1]:8.3f} ms): {' | '.join(onceki[ad][0])}")
+            print(f"   Sonra ({sonraki[ad][1]:8.3f} ms): {' | '.join(sonraki[ad][0])}")
+        print("=" * 60)
+    finally:
+        engine.dispose()
+        os.remove(dosya.name)
+
+if __name__ == '__main__':
+    sorgu_planlarini_karsilastir(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -1,4 +1,9 @@
 // API yardımcı fonksiyonları
+// GET yanıtları ETag'leriyle saklanır; veri değişmediyse sunucu gövdesiz 304 döner
+// ve saklanan yanıt kullanılır
+const API_ONBELLEK_BOYUTU = 50;
+const apiOnbellek = new Map();
+
 async function apiCall(url, method = 'GET', data = null) {
     const options = {
         method: method,
@@ -11,9 +16,35 @@ async function apiCall(url, method = 'GET', data = null) {
         options.body = JSON.stringify(data);
     }
     
+    const onbellekte = method === 'GET' ? apiOnbellek.get(url) : null;
+    if (method === 'GET') {
+        // Koşullu isteği tarayıcı önbelleği değil bu fonksiyon yönetir
+        options.cache = 'no-store';
+        if (onbellekte) {
+            options.headers['If-None-Match'] = onbellekte.etag;
+        }
+    }
+    
     try {
         const response = await fetch(url, options);
-        return await response.json();
+        
+        if (response.status === 304 && onbellekte) {
+            // En son kullanılan kayıt sona taşınır (LRU)
+            apiOnbellek.delete(url);
+            apiOnbellek.set(url, onbellekte);
+            return onbellekte.veri;
+        }
+        
+        const veri = await response.json();
+        const etag = response.headers.get('ETag');
+        if (method === 'GET' && response.ok && etag) {
+            apiOnbellek.delete(url);
+            apiOnbellek.set(url, { etag, veri });
+            if (apiOnbellek.size > API_ONBELLEK_BOYUTU) {
+                apiOnbellek.delete(apiOnbellek.keys().next().value);
+            }
+        }
+        return veri;
     } catch (error) {
         console.error('API Hatası:', error);
         return { basarili: false, hata: 'Bağlantı hatası' };
@@ -127,28 +158,50 @@ async function sinifFiltrele() {
     ogrencileriYukle();
 }
 
-// Öğrencileri yükle
+// Öğrencileri yükle (imleç tabanlı, sayfa sayfa)
+const OGRENCI_SAYFA_BOYUTU = 200;
+// Listede gösterilen alanlar (sunucu yalnızca bunları gönderir)
+const OGRENCI_LISTE_ALANLARI = 'id,ogrenci_no,tam_ad,sinif_adi,telefon,kayit_tarihi';
+let ogrenciYuklemeNo = 0;
+
 async function ogrencileriYukle() {
-    let url = '/api/ogrenciler';
-    if (seciliSinifId) {
-        url += `?sinif_id=${seciliSinifId}`;
-    }
-    const sonuc = await apiCall(url);
+    const yuklemeNo = ++ogrenciYuklemeNo;
+    let cursor = null;
+    let ilkSayfa = true;
     
-    if (sonuc.basarili) {
-        const ogrenciler = sonuc.ogrenciler;
-        ogrencileriGoster(ogrenciler);
-        istatistikleriGuncelle(ogrenciler);
-    } else {
-        bildirimGoster('Öğrenciler yüklenemedi: ' + sonuc.hata, 'error');
-    }
+    istatistikleriGuncelle();
+    
+    do {
+        let url = `/api/ogrenciler?limit=${OGRENCI_SAYFA_BOYUTU}&fields=${OGRENCI_LISTE_ALANLARI}`;
+        if (seciliSinifId) {
+            url += `&sinif_id=${seciliSinifId}`;
+        }
+        if (cursor) {
+            url += `&cursor=${encodeURIComponent(cursor)}`;
+        }
+        const sonuc = await apiCall(url);
+        
+        // Yükleme sırasında filtre değiştiyse eski yüklemeyi bırak
+        if (yuklemeNo !== ogrenciYuklemeNo) {
+            return;
+        }
+        
+        if (!sonuc.basarili) {
+            bildirimGoster('Öğrenciler yüklenemedi: ' + sonuc.hata, 'error');
+            return;
+        }
+        
+        ogrencileriGoster(sonuc.ogrenciler, !ilkSayfa);
+        ilkSayfa = false;
+        cursor = sonuc.sonraki_cursor;
+    } while (cursor);
 }
 
-// Öğrencileri göster
-function ogrencileriGoster(ogrenciler) {
+// Öğrencileri göster (ekle = true ise mevcut listenin sonuna eklenir)
+function ogrencileriGoster(ogrenciler, ekle = false) {
     const liste = document.getElementById('ogrenciListesi');
     
-    if (ogrenciler.length === 0) {
+    if (!ekle && ogrenciler.length === 0) {
         liste.innerHTML = `
             <div class="empty-state">
                 <i class="fas fa-users"></i>
@@ -159,7 +212,7 @@ function ogrencileriGoster(ogrenciler) {
         return;
     }
     
-    liste.innerHTML = ogrenciler.map(ogrenci => `
+    const html = ogrenciler.map(ogrenci => `
         <div class="ogrenci-card" onclick="window.location.href='/ogrenci/${ogrenci.id}'">
             <div class="ogrenci-header">
                 <div class="ogrenci-avatar">
@@ -184,27 +237,30 @@ function ogrencileriGoster(ogrenciler) {
             </div>
         </div>
     `).join('');
+    
+    if (ekle) {
+        liste.insertAdjacentHTML('beforeend', html);
+        if (document.getElementById('searchInput').value) {
+            aramaYap();
+        }
+    } else {
+        liste.innerHTML = html;
+    }
 }
 
 // İstatistikleri güncelle
-async function istatistikleriGuncelle(ogrenciler) {
-    document.getElementById('toplamOgrenci').textContent = ogrenciler.length;
-    
-    let degerlendirilenler = 0;
-    let toplamZiyaret = 0;
-    
-    for (const ogrenci of ogrenciler) {
-        const detay = await apiCall(`/api/ogrenciler/${ogrenci.id}`);
-        if (detay.basarili) {
-            if (detay.degerlendirme && detay.degerlendirme.toplam > 0) {
-                degerlendirilenler++;
-            }
-            toplamZiyaret += detay.ziyaretler.length;
-        }
+async function istatistikleriGuncelle() {
+    let url = '/api/istatistikler/ozet';
+    if (seciliSinifId) {
+        url += `?sinif_id=${seciliSinifId}`;
     }
+    const sonuc = await apiCall(url);
     
-    document.getElementById('degerlendirilenler').textContent = degerlendirilenler;
-    document.getElementById('toplamZiyaret').textContent = toplamZiyaret;
+    if (sonuc.basarili) {
+        document.getElementById('toplamOgrenci').textContent = sonuc.ozet.toplam_ogrenci;
+        document.getElementById('degerlendirilenler').textContent = sonuc.ozet.degerlendirilen;
+        document.getElementById('toplamZiyaret').textContent = sonuc.ozet.toplam_ziyaret;
+    }
 }
 
 // Yeni öğrenci modal
@@ -270,15 +326,50 @@ function aramaYap() {
     });
 }
 
+// Arka plan işleri: uzun süren rapor/içe aktarma işlemleri sunucuda iş olarak başlatılır,
+// durum yoklanır ve iş bitince sonuç indirilir
+const IS_YOKLAMA_ARALIGI = 1000;
+
+// İş bitene kadar durumunu yokla (ilerleme: her yoklamada iş bilgisiyle çağrılır)
+async function isBekle(isId, ilerleme = null) {
+    while (true) {
+        const sonuc = await apiCall(`/api/isler/${isId}`);
+        if (!sonuc.basarili) {
+            return sonuc;
+        }
+        if (ilerleme) {
+            ilerleme(sonuc.is);
+        }
+        if (sonuc.is.durum === 'tamamlandi' || sonuc.is.durum === 'hata') {
+            return sonuc;
+        }
+        await new Promise(resolve => setTimeout(resolve, IS_YOKLAMA_ARALIGI));
+    }
+}
+
+// Raporu arka planda oluştur ve hazır olunca indir
+async function raporIsiCalistir(tur) {
+    const baslat = await apiCall('/api/isler/rapor', 'POST', { tur: tur, sinif_id: seciliSinifId });
+    if (!baslat.basarili) {
+        bildirimGoster('Rapor hatası: ' + baslat.hata, 'error');
+        return;
+    }
+    
+    bildirimGoster('Rapor hazırlanıyor...', 'success');
+    const sonuc = await isBekle(baslat.is.id);
+    
+    if (sonuc.basarili && sonuc.is.durum === 'tamamlandi') {
+        window.location.href = `/api/isler/${sonuc.is.id}/indir`;
+        bildirimGoster('Rapor indiriliyor...', 'success');
+    } else {
+        bildirimGoster('Rapor oluşturulamadı: ' + (sonuc.is ? sonuc.is.hata : sonuc.hata), 'error');
+    }
+}
+
 // Excel export
 async function excelExport() {
     try {
-        let url = '/api/excel/export';
-        if (seciliSinifId) {
-            url += `?sinif_id=${seciliSinifId}`;
-        }
-        window.location.href = url;
-        bildirimGoster('Excel dosyası indiriliyor...', 'success');
+        await raporIsiCalistir('ogrenci_listesi');
     } catch (error) {
         bildirimGoster('Excel indirme hatası', 'error');
     }
@@ -306,13 +397,39 @@ async function excelImport() {
     formData.append('file', file);
     
     try {
-        const response = await fetch('/api/excel/import', {
+        const response = await fetch('/api/isler/ice-aktar', {
             method: 'POST',
             body: formData
         });
         
-        const sonuc = await response.json();
+        const baslat = await response.json();
         const sonucDiv = document.getElementById('uploadSonuc');
+        fileInput.value = '';
+        
+        if (!baslat.basarili) {
+            sonucDiv.className = 'upload-sonuc error';
+            sonucDiv.innerHTML = `<strong>❌ Hata!</strong><br>${baslat.hata}`;
+            sonucDiv.style.display = 'block';
+            return;
+        }
+        
+        // İş bitene kadar işlenen satır sayısını göster
+        sonucDiv.className = 'upload-sonuc';
+        sonucDiv.style.display = 'block';
+        const isSonucu = await isBekle(baslat.is.id, is => {
+            sonucDiv.innerHTML = is.toplam
+                ? `⏳ İşleniyor: ${is.islenen} / ${is.toplam} satır`
+                : '⏳ Dosya okunuyor...';
+        });
+        
+        const sonuc = isSonucu.basarili && isSonucu.is.durum === 'tamamlandi'
+            ? isSonucu.is.sonuc
+            : {
+                basarili: false,
+                hata: isSonucu.is ? isSonucu.is.hata : isSonucu.hata,
+                // Hatalı satırlar yüzünden hiçbir şey kaydedilmediyse satır hataları da gösterilir
+                hatalar: isSonucu.is && isSonucu.is.sonuc ? isSonucu.is.sonuc.hatalar : []
+            };
         
         if (sonuc.basarili) {
             sonucDiv.className = 'upload-sonuc success';
@@ -325,7 +442,10 @@ async function excelImport() {
             ogrencileriYukle();
         } else {
             sonucDiv.className = 'upload-sonuc error';
-            sonucDiv.innerHTML = `<strong>❌ Hata!</strong><br>${sonuc.hata}`;
+            sonucDiv.innerHTML = `
+                <strong>❌ Hata!</strong><br>${sonuc.hata}
+                ${sonuc.hatalar.length > 0 ? `<br><br><strong>Hatalar:</strong><br>${sonuc.hatalar.join('<br>')}` : ''}
+            `;
             sonucDiv.style.display = 'block';
         }
     } catch (error) {
@@ -352,25 +472,18 @@ function raporDropdownToggle(event) {
 // Rapor indir
 async function raporIndir(tip) {
     try {
-        let url = '';
-        if (tip === 'staj') {
-            url = '/api/excel/rapor';
-        } else if (tip === 'normal-donem') {
-            url = '/api/excel/rapor/normal-donem';
-        } else {
+        // Menüdeki rapor tipini arka plan işi türüne çevir
+        const isTurleri = { 'staj': 'staj', 'normal-donem': 'normal_donem' };
+        const tur = isTurleri[tip];
+        if (!tur) {
             bildirimGoster('Geçersiz rapor tipi', 'error');
             return;
         }
         
-        if (seciliSinifId) {
-            url += `?sinif_id=${seciliSinifId}`;
-        }
-        
         // Dropdown'ı kapat
         document.getElementById('raporDropdown').style.display = 'none';
         
-        window.location.href = url;
-        bildirimGoster('Rapor indiriliyor...', 'success');
+        await raporIsiCalistir(tur);
     } catch (error) {
         bildirimGoster('Rapor indirme hatası', 'error');
     }
@@ -1,4 +1,9 @@
 // API yardımcı fonksiyonları
+// GET yanıtları ETag'leriyle saklanır; veri değişmediyse sunucu gövdesiz 304 döner
+// ve saklanan yanıt kullanılır
+const API_ONBELLEK_BOYUTU = 50;
+const apiOnbellek = new Map();
+
 async function apiCall(url, method = 'GET', data = null) {
     const options = {
         method: method,
@@ -11,9 +16,35 @@ async function apiCall(url, method = 'GET', data = null) {
         options.body = JSON.stringify(data);
     }
     
+    const onbellekte = method === 'GET' ? apiOnbellek.get(url) : null;
+    if (method === 'GET') {
+        // Koşullu isteği tarayıcı önbelleği değil bu fonksiyon yönetir
+        options.cache = 'no-store';
+        if (onbellekte) {
+            options.headers['If-None-Match'] = onbellekte.etag;
+        }
+    }
+    
     try {
         const response = await fetch(url, options);
-        return await response.json();
+        
+        if (response.status === 304 && onbellekte) {
+            // En son kullanılan kayıt sona taşınır (LRU)
+            apiOnbellek.delete(url);
+            apiOnbellek.set(url, onbellekte);
+            return onbellekte.veri;
+        }
+        
+        const veri = await response.json();
+        const etag = response.headers.get('ETag');
+        if (method === 'GET' && response.ok && etag) {
+            apiOnbellek.delete(url);
+            apiOnbellek.set(url, { etag, veri });
+            if (apiOnbellek.size > API_ONBELLEK_BOYUTU) {
+                apiOnbellek.delete(apiOnbellek.keys().next().value);
+            }
+        }
+        return veri;
     } catch (error) {
         console.error('API Hatası:', error);
         return { basarili: false, hata: 'Bağlantı hatası' };
@@ -53,12 +84,19 @@ document.addEventListener('DOMContentLoaded', function() {
     };
 });
 
+// Ziyaret notları sayfalı yüklenir: ilk sayfa detayla birlikte gelir, kalanı istenince
+const ZIYARET_SAYFA_BOYUTU = 20;
+let ziyaretCursor = null;
+let toplamZiyaret = 0;
+
 // Öğrenci detaylarını yükle
 async function ogrenciDetayYukle() {
-    const sonuc = await apiCall(`/api/ogrenciler/${ogrenciId}`);
+    const sonuc = await apiCall(`/api/ogrenciler/${ogrenciId}?ziyaret_limiti=${ZIYARET_SAYFA_BOYUTU}`);
     
     if (sonuc.basarili) {
         ogrenciBilgileriGoster(sonuc.ogrenci);
+        toplamZiyaret = sonuc.toplam_ziyaret;
+        ziyaretCursor = sonuc.ziyaret_cursor;
         ziyaretleriGoster(sonuc.ziyaretler);
         degerlendirmeGoster(sonuc.degerlendirme);
         normalDonemGoster(sonuc.normal_donem);
@@ -90,11 +128,46 @@ function tabDegistir(tabId) {
     document.getElementById(tabId).classList.add('active');
 }
 
-// Ziyaretleri göster
-function ziyaretleriGoster(ziyaretler) {
+// Ziyaret notlarının ilk sayfasını yeniden yükle (not ekleme/silme sonrası)
+async function ziyaretleriYukle() {
+    const sonuc = await apiCall(`/api/ogrenciler/${ogrenciId}/ziyaretler?limit=${ZIYARET_SAYFA_BOYUTU}`);
+    
+    if (sonuc.basarili) {
+        ziyaretCursor = sonuc.sonraki_cursor;
+        ziyaretleriGoster(sonuc.ziyaretler);
+    } else {
+        bildirimGoster('Ziyaret notları yüklenemedi: ' + sonuc.hata, 'error');
+    }
+}
+
+// Sonraki ziyaret sayfasını listenin sonuna ekle
+async function dahaFazlaZiyaretYukle() {
+    if (!ziyaretCursor) return;
+    
+    const sonuc = await apiCall(
+        `/api/ogrenciler/${ogrenciId}/ziyaretler?limit=${ZIYARET_SAYFA_BOYUTU}&cursor=${encodeURIComponent(ziyaretCursor)}`
+    );
+    
+    if (sonuc.basarili) {
+        ziyaretCursor = sonuc.sonraki_cursor;
+        ziyaretleriGoster(sonuc.ziyaretler, true);
+    } else {
+        bildirimGoster('Ziyaret notları yüklenemedi: ' + sonuc.hata, 'error');
+    }
+}
+
+// "Daha fazla" butonunu kalan ziyaret sayısına göre göster/gizle
+function dahaFazlaButonunuGuncelle() {
+    const gosterilen = document.querySelectorAll('#ziyaretListesi .ziyaret-item').length;
+    document.getElementById('dahaFazlaZiyaret').style.display = ziyaretCursor ? 'block' : 'none';
+    document.getElementById('ziyaretSayaci').textContent = `(${gosterilen} / ${toplamZiyaret})`;
+}
+
+// Ziyaretleri göster (ekle: true ise mevcut listenin sonuna eklenir)
+function ziyaretleriGoster(ziyaretler, ekle = false) {
     const liste = document.getElementById('ziyaretListesi');
     
-    if (ziyaretler.length === 0) {
+    if (!ekle && ziyaretler.length === 0) {
         liste.innerHTML = `
             <div class="empty-state">
                 <i class="fas fa-notes-medical"></i>
@@ -102,10 +175,11 @@ function ziyaretleriGoster(ziyaretler) {
                 <p>Yeni ziyaret notu eklemek için "Yeni Not Ekle" butonuna tıklayın</p>
             </div>
         `;
+        dahaFazlaButonunuGuncelle();
         return;
     }
     
-    liste.innerHTML = ziyaretler.map(ziyaret => `
+    const html = ziyaretler.map(ziyaret => `
         <div class="ziyaret-item">
             <div class="ziyaret-header">
                 <strong>${ziyaret.ogretmen_adi || 'Öğretmen'}</strong>
@@ -119,6 +193,13 @@ function ziyaretleriGoster(ziyaretler) {
             <div class="ziyaret-text">${ziyaret.not_metni}</div>
         </div>
     `).join('');
+    
+    if (ekle) {
+        liste.insertAdjacentHTML('beforeend', html);
+    } else {
+        liste.innerHTML = html;
+    }
+    dahaFazlaButonunuGuncelle();
 }
 
 // Ziyaret notu modal
@@ -144,7 +225,8 @@ async function ziyaretNotuEkle(event) {
     if (sonuc.basarili) {
         bildirimGoster('Ziyaret notu başarıyla eklendi!', 'success');
         modalKapat('ziyaretNotuModal');
-        ogrenciDetayYukle();
+        toplamZiyaret++;
+        ziyaretleriYukle();
     } else {
         bildirimGoster('Hata: ' + sonuc.hata, 'error');
     }
@@ -160,7 +242,8 @@ async function ziyaretSil(ziyaretId) {
     
     if (sonuc.basarili) {
         bildirimGoster('Ziyaret notu silindi', 'success');
-        ogrenciDetayYukle();
+        toplamZiyaret--;
+        ziyaretleriYukle();
     } else {
         bildirimGoster('Hata: ' + sonuc.hata, 'error');
     }
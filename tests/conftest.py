@@ -0,0 +1,23 @@
+import pytest
+from app import create_app
+from database import db
+from services.rapor_cache import rapor_cache
+
+@pytest.fixture
+def uygulama_olustur(tmp_path):
+    """Geçici dosya veritabanıyla uygulama oluşturan fonksiyonu döndür"""
+    uygulamalar = []
+    
+    def olustur(ad='test', **ayarlar):
+        app = create_app({'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / ad}.db", **ayarlar})
+        uygulamalar.append(app)
+        return app
+    
+    # Rapor önbelleği süreç geneli; anahtarlar farklı veritabanlarında çakışabilir
+    rapor_cache.temizle()
+    yield olustur
+    rapor_cache.temizle()
+    for app in uygulamalar:
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
@@ -0,0 +1,95 @@
+"""Eşzamanlı okuma ve not girişi: üretim profili (WAL, busy timeout) okuyucuların yazıcıları
+bekletmesini ortadan kaldırmalı
+
+Bir okuyucu CSV dışa aktarmayı yarıda tutarken (açık imleç) ve başka okuyucular liste
+isteği gönderirken birden fazla iş parçacığı POST /api/degerlendirme/<id> gönderir.
+Geliştirme profilinde (rollback journal, sqlite3 sürücüsünün varsayılan 5 sn'lik beklemesi)
+açık okuma commit'leri engeller ve yazmalar 'database is locked' ile başarısız olur;
+üretim profilinde hiçbir yazma başarısız olmamalıdır. Her iki profilde sınıf özetleri
+yeniden sayımla tutarlı kalmalıdır.
+"""
+import threading
+import pytest
+from database import db
+from performans_testi import ornek_veri_olustur
+from services.disa_aktarma_service import DisaAktarmaService
+from services.excel_service import ExcelService
+from services.staj_service import OzetService
+
+OGRENCI_SAYISI = 60
+PARTI_BOYUTU = 20
+YAZICI_SAYISI = 8
+YAZICI_BASINA_ISTEK = 20
+LISTE_OKUYUCU_SAYISI = 2
+# Dışa aktarma, sürücünün varsayılan 5 sn'lik beklemesinden uzun süre açık tutulur
+# (üretim profilinde yazıcılar bitince hemen kapatılır)
+OKUMA_SURESI_SN = 6
+
+# profil: (journal_mode, busy_timeout ms) havuzdaki bağlantılarda
+BEKLENEN_PRAGMALAR = {
+    'uretim': ('wal', 30000),
+    'gelistirme': ('delete', 5000)
+}
+
+@pytest.mark.parametrize('profil', ['uretim', 'gelistirme'])
+def test_eszamanli_okuma_ve_not_girisi(uygulama_olustur, monkeypatch, profil):
+    monkeypatch.setattr(ExcelService, 'PARTI_BOYUTU', PARTI_BOYUTU)
+    monkeypatch.setattr(DisaAktarmaService, 'PARCA_BOYUTU', PARTI_BOYUTU)
+    app = uygulama_olustur(VERITABANI_PROFILI=profil)
+    with app.app_context():
+        ornek_veri_olustur(OGRENCI_SAYISI)
+        with db.engine.connect() as baglanti:
+            pragmalar = (
+                baglanti.exec_driver_sql('PRAGMA journal_mode').scalar(),
+                baglanti.exec_driver_sql('PRAGMA busy_timeout').scalar()
+            )
+    assert pragmalar == BEKLENEN_PRAGMALAR[profil]
+
+    hatalar = []
+    okuma_acik = threading.Event()
+    yazicilar_bitti = threading.Event()
+
+    def uzun_okuyucu():
+        yanit = app.test_client().get('/api/disa-aktar/ogrenciler.csv')
+        parcalar = iter(yanit.response)
+        # Başlık ve ilk parti okunur; imleç kalan satırlar için açık kalır
+        next(parcalar)
+        next(parcalar)
+        okuma_acik.set()
+        yazicilar_bitti.wait(OKUMA_SURESI_SN)
+        for _ in parcalar:
+            pass
+        yanit.close()
+
+    def liste_okuyucu():
+        istemci = app.test_client()
+        while not yazicilar_bitti.is_set():
+            istemci.get('/api/ogrenciler?limit=20')
+
+    def yazici(sira):
+        istemci = app.test_client()
+        okuma_acik.wait()
+        for i in range(YAZICI_BASINA_ISTEK):
+            # Yazıcılar aynı öğrencilere yazar; değerlendirmesi olmayan öğrenciler için kayıt oluşturulur
+            ogrenci_id = (sira * 7 + i) % OGRENCI_SAYISI + 1
+            yanit = istemci.post(f"/api/degerlendirme/{ogrenci_id}", json={'isyeren_notu': (sira + i) % 30})
+            if yanit.status_code != 200:
+                hatalar.append(yanit.get_json()['hata'])
+
+    okuyucular = [threading.Thread(target=uzun_okuyucu)]
+    okuyucular += [threading.Thread(target=liste_okuyucu) for _ in range(LISTE_OKUYUCU_SAYISI)]
+    yazicilar = [threading.Thread(target=yazici, args=(i,)) for i in range(YAZICI_SAYISI)]
+    for islem in okuyucular + yazicilar:
+        islem.start()
+    for islem in yazicilar:
+        islem.join()
+    yazicilar_bitti.set()
+    for islem in okuyucular:
+        islem.join()
+
+    if profil == 'uretim':
+        assert hatalar == []
+    else:
+        assert hatalar and all('database is locked' in hata for hata in hatalar)
+    with app.app_context():
+        assert OzetService.tutarlilik_kontrolu() == []
@@ -0,0 +1,54 @@
+"""Excel içe aktarma: dry_run seçilen modu önizler, hatalı dosya yarım kaydedilmez"""
+import io
+from services.excel_service import ExcelService
+
+def _excel_dosyasi(satirlar):
+    tampon = io.BytesIO()
+    ExcelService._calisma_kitabi_yaz(
+        tampon, 'Öğrenciler', ['Ad', 'Soyad', 'Öğrenci No', 'Telefon'], iter(satirlar), '4472C4'
+    )
+    tampon.seek(0)
+    return tampon
+
+def _ice_aktar(istemci, satirlar, **secenekler):
+    return istemci.post('/api/excel/import', data={
+        **secenekler, 'file': (_excel_dosyasi(satirlar), 'ogrenciler.xlsx')
+    }, content_type='multipart/form-data').get_json()
+
+def _ogrenci_numaralari(istemci):
+    return sorted(o['ogrenci_no'] for o in istemci.get('/api/ogrenciler').get_json()['ogrenciler'])
+
+def test_dry_run_secilen_modu_onizler(uygulama_olustur):
+    istemci = uygulama_olustur().test_client()
+    istemci.post('/api/ogrenciler', json={'ad': 'Eski', 'soyad': 'Kayit', 'ogrenci_no': 'no1'})
+    satirlar = [['Yeni', 'Ad', 'no1', None], ['Yeni', 'Kayit', 'no2', None]]
+
+    insert = _ice_aktar(istemci, satirlar, mode='insert', dry_run='1')
+    assert (insert['dry_run'], insert['kaydedildi']) == (True, False)
+    assert (insert['eklenen'], insert['guncellenen']) == (1, 0)
+    assert len(insert['hatalar']) == 1 and 'zaten kayıtlı' in insert['hatalar'][0]
+    # Önizleme gerçek aktarmayla aynı sonucu verir
+    gercek = _ice_aktar(istemci, satirlar, mode='insert')
+    assert gercek['hatalar'] == insert['hatalar']
+
+    upsert = _ice_aktar(istemci, satirlar, mode='upsert', dry_run='1')
+    assert (upsert['eklenen'], upsert['guncellenen'], upsert['hatalar']) == (1, 1, [])
+    assert _ogrenci_numaralari(istemci) == ['no1']
+
+def test_hatali_satir_varsa_hicbir_sey_kaydedilmez(uygulama_olustur):
+    istemci = uygulama_olustur().test_client()
+    istemci.post('/api/ogrenciler', json={'ad': 'Eski', 'soyad': 'Kayit', 'ogrenci_no': 'no1'})
+    # 5 satırdan 3'ü hatalı: kayıtlı numara, dosya içi tekrar, eksik bilgi
+    satirlar = [
+        ['Yeni', 'Ad', 'no1', None], ['Yeni', 'Ad', 'no2', None], ['Yeni', 'Ad', 'no2', None],
+        ['', 'Ad', 'no3', None], ['Yeni', 'Ad', 'no4', None]
+    ]
+
+    sonuc = _ice_aktar(istemci, satirlar, mode='insert')
+    assert (sonuc['basarili'], sonuc['kaydedildi']) == (False, False)
+    assert len(sonuc['hatalar']) == 3
+    assert _ogrenci_numaralari(istemci) == ['no1']
+
+    sonuc = _ice_aktar(istemci, satirlar, mode='insert', partial='1')
+    assert (sonuc['basarili'], sonuc['kaydedildi'], sonuc['eklenen']) == (True, True, 2)
+    assert _ogrenci_numaralari(istemci) == ['no1', 'no2', 'no4']
@@ -0,0 +1,37 @@
+"""Not analizindeki toplam histogramları notu girilmiş tüm öğrencileri kapsamalı"""
+
+STAJ_TAM_PUAN = {
+    'isyeren_notu': 30, 'icindekiler': 10, 'firma_bilgisi': 10, 'yazim_duzeni': 10,
+    'resim_sekil': 10, 'dil_kullanimi': 20, 'sonuc_bolumu': 10, 'defter_duzeni_mulakat': 30
+}
+
+def test_histogram_toplami_ogrenci_sayisina_esit(uygulama_olustur):
+    istemci = uygulama_olustur().test_client()
+    sinif_id = istemci.post('/api/siniflar', json={'ad': 'A'}).get_json()['sinif']['id']
+    ogrenci_idleri = [
+        istemci.post('/api/ogrenciler', json={
+            'ad': 'Ad', 'soyad': 'Soyad', 'ogrenci_no': f"no{i}", 'sinif_id': sinif_id
+        }).get_json()['ogrenci']['id']
+        for i in range(3)
+    ]
+
+    # Tam puan (130), sıfır ve ara bir toplam
+    istemci.post(f"/api/degerlendirme/{ogrenci_idleri[0]}", json=STAJ_TAM_PUAN)
+    istemci.post(f"/api/degerlendirme/{ogrenci_idleri[1]}", json={'isyeren_notu': 0})
+    istemci.post(f"/api/degerlendirme/{ogrenci_idleri[2]}", json={'isyeren_notu': 25, 'dil_kullanimi': 15})
+    istemci.post(f"/api/normal-donem/{ogrenci_idleri[0]}", json={'vize_notu': 100, 'final_notu': 100})
+    istemci.post(f"/api/normal-donem/{ogrenci_idleri[1]}", json={'vize_notu': 40, 'final_notu': 55})
+
+    analiz = istemci.get('/api/istatistikler/analiz').get_json()['analiz']
+
+    assert analiz['staj']['ogrenci_sayisi'] == 3
+    assert analiz['normal_donem']['ogrenci_sayisi'] == 2
+    for tur in ('staj', 'normal_donem'):
+        histogram = analiz[tur]['histogram']
+        assert sum(aralik['sayi'] for aralik in histogram) == analiz[tur]['ogrenci_sayisi']
+    for tur, ust_sinir in (('staj', 130), ('normal_donem', 100)):
+        histogram = analiz[tur]['histogram']
+        assert all(aralik['ust'] - aralik['alt'] == 10 for aralik in histogram)
+        assert (histogram[0]['alt'], histogram[-1]['ust']) == (0, ust_sinir)
+    # Üst sınır son aralığa dahildir
+    assert analiz['staj']['histogram'][-1]['sayi'] == 1
@@ -0,0 +1,15 @@
+"""Sınıf rapor paketi her sınıf ve rapor türü için ayrı bir ZIP girdisi içermeli"""
+import io
+import zipfile
+
+def test_temizlenince_ayni_kalan_sinif_adlari_ayri_girdi_olur(uygulama_olustur):
+    istemci = uygulama_olustur().test_client()
+    for ad in ('A/B', 'A-B'):
+        assert istemci.post('/api/siniflar', json={'ad': ad}).status_code == 200
+
+    yanit = istemci.get('/api/excel/rapor/paket')
+    assert yanit.status_code == 200
+    adlar = zipfile.ZipFile(io.BytesIO(yanit.get_data())).namelist()
+
+    assert len(adlar) == 4
+    assert len(set(adlar)) == len(adlar)
@@ -0,0 +1,139 @@
+"""Yazma yolları sinif_ozet / sinif_harf_ozet tablolarını yeniden sayımla tutarlı bırakmalı
+
+Her adımdan sonra OzetService.tutarlilik_kontrolu() boş liste döndürmelidir.
+"""
+import io
+import threading
+import time
+from services.excel_service import ExcelService
+from services.staj_service import OzetService
+
+def _excel_dosyasi(satirlar):
+    tampon = io.BytesIO()
+    ExcelService._calisma_kitabi_yaz(
+        tampon, 'Öğrenciler', ['Ad', 'Soyad', 'Öğrenci No', 'Telefon', 'Sınıf'], iter(satirlar), '4472C4'
+    )
+    tampon.seek(0)
+    return tampon
+
+def test_yazma_yollari_ozetleri_tutarli_birakir(uygulama_olustur):
+    app = uygulama_olustur()
+    istemci = app.test_client()
+
+    def istek(metot, url, **kwargs):
+        yanit = istemci.open(url, method=metot, **kwargs)
+        assert yanit.status_code == 200, yanit.get_data(as_text=True)
+        return yanit.get_json()
+
+    def tutarli():
+        with app.app_context():
+            assert OzetService.tutarlilik_kontrolu() == []
+
+    sinif_a = istek('POST', '/api/siniflar', json={'ad': 'A'})['sinif']['id']
+    sinif_b = istek('POST', '/api/siniflar', json={'ad': 'B'})['sinif']['id']
+
+    # Öğrenci ekleme, güncelleme (sınıf değişikliği) ve silme
+    ogrenci_idleri = [
+        istek('POST', '/api/ogrenciler', json={
+            'ad': 'Ad', 'soyad': 'Soyad', 'ogrenci_no': f"no{i}", 'sinif_id': sinif_a if i % 2 else sinif_b
+        })['ogrenci']['id']
+        for i in range(8)
+    ]
+    tutarli()
+
+    # Ziyaret ekleme ve silme
+    ziyaret_idleri = [
+        istek('POST', '/api/ziyaretler', json={'ogrenci_id': ogrenci_id, 'not_metni': 'Ziyaret'})['ziyaret']['id']
+        for ogrenci_id in ogrenci_idleri[:4] * 2
+    ]
+    tutarli()
+    istek('DELETE', f"/api/ziyaretler/{ziyaret_idleri[0]}")
+    tutarli()
+
+    # Tekil ve toplu staj / normal dönem notu girişi
+    istek('POST', f"/api/degerlendirme/{ogrenci_idleri[0]}", json={'isyeren_notu': 25, 'dil_kullanimi': 15})
+    istek('POST', f"/api/normal-donem/{ogrenci_idleri[0]}", json={'vize_notu': 70, 'final_notu': 80})
+    tutarli()
+    istek('POST', f"/api/degerlendirme/{ogrenci_idleri[0]}", json={'isyeren_notu': 30, 'defter_duzeni_mulakat': 30})
+    tutarli()
+    istek('POST', '/api/degerlendirme/toplu', json={'kayitlar': [
+        {'ogrenci_id': ogrenci_id, 'isyeren_notu': 10 + i * 3, 'icindekiler': 8}
+        for i, ogrenci_id in enumerate(ogrenci_idleri)
+    ]})
+    istek('POST', '/api/normal-donem/toplu', json={'kayitlar': [
+        {'ogrenci_id': ogrenci_id, 'vize_notu': 50 + i * 5, 'final_notu': 40 + i * 6}
+        for i, ogrenci_id in enumerate(ogrenci_idleri)
+    ]})
+    tutarli()
+
+    # Notlu ve ziyaretli öğrencinin sınıf değiştirmesi ve silinmesi
+    istek('PUT', f"/api/ogrenciler/{ogrenci_idleri[1]}", json={'sinif_id': sinif_b})
+    tutarli()
+    istek('DELETE', f"/api/ogrenciler/{ogrenci_idleri[2]}")
+    tutarli()
+
+    # Toplu silme (liste ve sınıf)
+    istek('POST', '/api/ogrenciler/toplu-sil', json={'ogrenci_idleri': ogrenci_idleri[3:5]})
+    tutarli()
+
+    # Excel içe aktarma: insert yeni öğrenci ekler, upsert mevcut öğrencilerin sınıfını da değiştirir
+    sonuc = istek('POST', '/api/excel/import', data={
+        'mode': 'insert',
+        'file': (_excel_dosyasi([['Yeni', 'Kayit', 'no100', None, 'A'], ['Yeni', 'Kayit', 'no101', None, 'B']]),
+                 'ogrenciler.xlsx')
+    }, content_type='multipart/form-data')
+    assert sonuc['eklenen'] == 2
+    tutarli()
+    sonuc = istek('POST', '/api/excel/import', data={
+        'mode': 'upsert',
+        'file': (_excel_dosyasi([['Ad', 'Soyad', 'no0', None, 'A'], ['Ad', 'Soyad', 'no5', None, 'B'],
+                                 ['Yeni', 'Kayit', 'no100', None, 'B'], ['Yeni', 'Kayit', 'no102', None, 'A']]),
+                 'ogrenciler.xlsx')
+    }, content_type='multipart/form-data')
+    assert (sonuc['eklenen'], sonuc['guncellenen']) == (1, 3)
+    tutarli()
+
+    istek('POST', '/api/ogrenciler/toplu-sil', json={'sinif_id': sinif_b})
+    tutarli()
+
+def test_arka_plan_aktarmasi_sirasinda_not_girisi(uygulama_olustur, monkeypatch):
+    """Arka plan upsert aktarması öğrencinin katkısını okuduktan sonra girilen not özeti bozmamalı"""
+    app = uygulama_olustur()
+    istemci = app.test_client()
+    sinif_a = istemci.post('/api/siniflar', json={'ad': 'A'}).get_json()['sinif']['id']
+    istemci.post('/api/siniflar', json={'ad': 'B'})
+    ogrenci_id = istemci.post('/api/ogrenciler', json={
+        'ad': 'Ad', 'soyad': 'Soyad', 'ogrenci_no': 'no0', 'sinif_id': sinif_a
+    }).get_json()['ogrenci']['id']
+    istemci.post(f"/api/degerlendirme/{ogrenci_id}", json={'isyeren_notu': 10})
+
+    # Aktarma, sınıfı değişen öğrencinin katkısını okuduktan hemen sonra başka bir istemci not girer
+    yanitlar = []
+    not_girisleri = []
+    katkilari_oku = OzetService.ogrenci_katkilari
+
+    def katkilar_okununca_not_gir(ogrenci_idleri):
+        katkilar = katkilari_oku(ogrenci_idleri)
+        islem = threading.Thread(target=lambda: yanitlar.append(app.test_client().post(
+            f"/api/degerlendirme/{ogrenci_id}", json={'isyeren_notu': 25, 'dil_kullanimi': 15}
+        ).status_code))
+        islem.start()
+        # Yazma kilidi yoksa not bu sürede kaydedilir; varsa aktarma bitene kadar bekler
+        islem.join(0.5)
+        not_girisleri.append(islem)
+        return katkilar
+
+    monkeypatch.setattr(OzetService, 'ogrenci_katkilari', staticmethod(katkilar_okununca_not_gir))
+    is_ = istemci.post('/api/isler/ice-aktar', data={
+        'mode': 'upsert', 'file': (_excel_dosyasi([['Ad', 'Soyad', 'no0', None, 'B']]), 'ogrenciler.xlsx')
+    }, content_type='multipart/form-data').get_json()['is']
+    while is_['durum'] not in ('tamamlandi', 'hata'):
+        time.sleep(0.05)
+        is_ = istemci.get(f"/api/isler/{is_['id']}").get_json()['is']
+    for islem in not_girisleri:
+        islem.join()
+
+    assert is_['durum'] == 'tamamlandi' and is_['sonuc']['guncellenen'] == 1
+    assert yanitlar == [200]
+    with app.app_context():
+        assert OzetService.tutarlilik_kontrolu() == []
@@ -0,0 +1,38 @@
+"""Liste, detay, dışa aktarma ve rapor yollarının sorgu sayısı öğrenci sayısından bağımsız olmalı
+
+performans_testi.py'deki senaryolar küçük veritabanlarında çalıştırılır; parti boyutu
+küçültüldüğü için dışa aktarmalar her boyutta farklı sayıda partiye bölünür.
+"""
+from database import db
+from performans_testi import SENARYOLAR, SABIT_SORGULU_SENARYOLAR, SorguSayaci, ornek_veri_olustur
+from services.excel_service import ExcelService
+
+PARTI_BOYUTU = 50
+BOYUTLAR = (120, 600)
+
+def _sorgu_sayilari(app, ogrenci_sayisi):
+    """Sabit sorgulu senaryoları bir kez çalıştır ve sorgu sayılarını döndür"""
+    with app.app_context():
+        ornek_veri_olustur(ogrenci_sayisi)
+        ortam = {
+            'app': app,
+            'engine': db.engine,
+            'ogrenci_sayisi': ogrenci_sayisi,
+            'ornek_ogrenci_id': ogrenci_sayisi // 2 + 1,
+            'ice_aktarma_sayisi': 0
+        }
+    
+    istemci = app.test_client()
+    sayilar = {}
+    for ad in SABIT_SORGULU_SENARYOLAR:
+        hazirla, calistir = SENARYOLAR[ad]
+        hazirlik = hazirla(ortam) if hazirla else None
+        with SorguSayaci(ortam['engine']) as sayac:
+            calistir(istemci, ortam, hazirlik)
+        sayilar[ad] = sayac.sayi
+    return sayilar
+
+def test_sorgu_sayisi_ogrenci_sayisindan_bagimsiz(uygulama_olustur, monkeypatch):
+    monkeypatch.setattr(ExcelService, 'PARTI_BOYUTU', PARTI_BOYUTU)
+    kucuk, buyuk = (_sorgu_sayilari(uygulama_olustur(f"ogrenci_{boyut}"), boyut) for boyut in BOYUTLAR)
+    assert kucuk == buyuk
@@ -0,0 +1,28 @@
+"""Toplu not girişi endpoint'lerinin geçersiz girdilere verdiği yanıtlar"""
+
+def test_json_olmayan_govde_400_doner(uygulama_olustur):
+    istemci = uygulama_olustur().test_client()
+    for yol in ('/api/degerlendirme/toplu', '/api/normal-donem/toplu'):
+        yanit = istemci.post(yol, data='x')
+        assert yanit.status_code == 400
+        assert yanit.get_json()['hata'] == "Kayıt listesi (kayitlar) gerekli!"
+
+def test_devamsizlik_durumu_metin_degerleri(uygulama_olustur):
+    istemci = uygulama_olustur().test_client()
+    ogrenci_idleri = [
+        istemci.post('/api/ogrenciler', json={
+            'ad': 'Ad', 'soyad': 'Soyad', 'ogrenci_no': f"no{i}"
+        }).get_json()['ogrenci']['id']
+        for i in range(7)
+    ]
+    degerler = ['false', 'true', '0', 1, False, 'evet', 2]
+
+    yanit = istemci.post('/api/normal-donem/toplu', json={'kayitlar': [
+        {'ogrenci_id': ogrenci_id, 'devamsizlik_durumu': deger, 'vize_notu': 60, 'final_notu': 60}
+        for ogrenci_id, deger in zip(ogrenci_idleri, degerler)
+    ]}).get_json()
+
+    durumlar = {d['ogrenci_id']: d['devamsizlik_durumu'] for d in yanit['degerlendirmeler']}
+    assert durumlar == dict(zip(ogrenci_idleri, [False, True, False, True, False]))
+    assert [hata['sira'] for hata in yanit['hatalar']] == [5, 6]
+    assert all('devamsizlik_durumu' in hata['hata'] for hata in yanit['hatalar'])